@@ -3,30 +3,46 @@ import tkinter as tk
 from tkinter import messagebox, ttk, filedialog
 import psycopg2
 from datetime import datetime
-import csv
 import os
 import hashlib
 import re
-
-# Optional ReportLab import - for PDF export
-try:
-    from reportlab.lib import colors
-    from reportlab.lib.pagesizes import letter
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
-
-# Import custom styles if available
-try:
-    import styles
-    import style_integration
-    STYLES_AVAILABLE = True
+import sys
+
+# Imported first so the first startup phase covers the imports below
+from src.utils.startup_timing import FLAG as STARTUP_TIMING_FLAG, StartupTimer, run_timed, timing_child
+startup_timer = StartupTimer()
+
+from src.utils.change_listener import Change, ChangeListener, select_changes
+from src.utils.connection_pool import configure_pool, get_pool, pool_stats
+from src.utils.csv_export import CSV_EXPORTS, export_csv
+from src.utils.csv_import import CSV_IMPORTS, format_report, import_folder
+from src.utils.database import Database
+from src.utils.db_executor import DBExecutor
+from src.utils.effort_stats import NUMPY_AVAILABLE, load_stats
+from src.utils.migrations import MigrationRunner
+from src.utils.pdf_export import PDF_REPORTS, REPORTLAB_AVAILABLE, export_pdf
+from src.utils.project_catalog import ProjectCatalog
+from src.utils.schema import get_catalog
+from src.views.effort_batch_dialog import EffortBatchDialog
+from src.views.effort_charts import EffortCharts
+from src.views.filter_bar import FilterBar
+from src.views.lazy_tab import LazyTab
+from src.views.live_updates import patch_rows
+from src.views.progress_dialog import ProgressDialog
+from src.views.risk_matrix import RiskMatrixView
+from src.views.search_window import SearchWindow
+from src.views.virtual_tree import VirtualTreeview
+
+def load_styles():
+    """Import the optional custom style modules; returns (styles, style_integration) or None"""
+    try:
+        import styles
+        import style_integration
+    except ImportError:
+        print("Custom styles not found. Using default styling.")
+        return None
     print("Custom styles loaded successfully!")
-except ImportError:
-    STYLES_AVAILABLE = False
-    print("Custom styles not found. Using default styling.")
+    return styles, style_integration
 
 # PostgreSQL connection configuration
 DB_NAME = "project_management"
@@ -34,6 +50,40 @@ DB_USER = "postgres"
 DB_PASSWORD = os.getenv("DB_PASSWORD", "Your password here")  # Use environment variable with fallback
 DB_HOST = "localhost"
 
+# Connection pool sizing (see src/utils/connection_pool.py)
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "1"))
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "10"))
+# Background threads for database calls (each holds at most one pooled connection)
+DB_WORKERS = int(os.getenv("DB_WORKERS", "4"))
+
+# One pool per process - every connect_db() call checks out of it
+configure_pool(
+    minconn=DB_POOL_MIN,
+    maxconn=DB_POOL_MAX,
+    dbname=DB_NAME,
+    user=DB_USER,
+    password=DB_PASSWORD,
+    host=DB_HOST
+)
+
+# Data access layer - all SQL goes through these repositories
+db = Database()
+
+# Project id/name list shared by every tab; reloaded only after project writes
+project_catalog = ProjectCatalog(db)
+
+# Queries run here instead of on the Tk thread; results are delivered back through root.after()
+db_executor = DBExecutor(
+    max_workers=DB_WORKERS,
+    error_handler=lambda e: messagebox.showerror("Database Error", str(e))
+)
+project_catalog.dispatch = db_executor.call_soon
+project_catalog.executor = db_executor
+
+# Rows written by other clients, pushed into the open tabs (see ChangeListener)
+change_listener = ChangeListener()
+change_listener.dispatch = db_executor.call_soon
+
 class LoginWindow:
     def __init__(self, root, on_login_success, skip_allowed=True):
         self.root = root
@@ -167,46 +217,22 @@ class LoginWindow:
         register_button.pack(side=tk.RIGHT, padx=5, pady=5)
     
     def create_users_table(self):
-        """Create users table if it doesn't exist"""
-        try:
-            conn = connect_db()
-            cur = conn.cursor()
-            
-            # Check if users table exists
-            cur.execute("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_name = 'users'
-                )
-            """)
-            table_exists = cur.fetchone()[0]
-            
-            if not table_exists:
-                # Create users table
-                cur.execute("""
-                    CREATE TABLE users (
-                        id SERIAL PRIMARY KEY,
-                        username VARCHAR(50) UNIQUE NOT NULL,
-                        password_hash VARCHAR(128) NOT NULL,
-                        role VARCHAR(20) NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Create default admin user
-                hashed_password = hashlib.sha256("admin".encode()).hexdigest()
-                cur.execute("""
-                    INSERT INTO users (username, password_hash, role)
-                    VALUES ('admin', %s, 'Project Manager')
-                """, (hashed_password,))
-                
-                conn.commit()
+        """Create users table if it doesn't exist (on the DB executor)"""
+        def ensure():
+            # Creates the table plus a default admin user when missing
+            if get_catalog(db).has_table("users"):
+                return False
+            hashed_password = hashlib.sha256("admin".encode()).hexdigest()
+            created = db.users.ensure_table(hashed_password)
+            get_catalog(db, refresh=True)
+            return created
+
+        def done(created):
+            if created:
                 self.status_var.set("Default user created: admin/admin")
-            
-            cur.close()
-            conn.close()
-        except Exception as e:
-            self.status_var.set(f"Database error: {e}")
+
+        db_executor.submit(ensure, on_done=done, key="login.users_table",
+                           on_error=lambda e: self.status_var.set(f"Database error: {e}"))
     
     def validate_password(self, password):
         """Validate password strength"""
@@ -235,41 +261,30 @@ class LoginWindow:
             self.status_var.set(message)
             return
         
-        try:
-            # Hash password
-            hashed_password = hashlib.sha256(password.encode()).hexdigest()
-            
-            # Insert new user
-            conn = connect_db()
-            cur = conn.cursor()
-            
-            # Check if username exists
-            cur.execute("SELECT COUNT(*) FROM users WHERE username = %s", (username,))
-            if cur.fetchone()[0] > 0:
+        # Hash password
+        hashed_password = hashlib.sha256(password.encode()).hexdigest()
+
+        def create():
+            # Check if username exists, then insert user; False if the name is taken
+            if db.users.username_exists(username):
+                return False
+            db.users.insert(username, hashed_password, role)
+            return True
+
+        def done(created):
+            if not created:
                 self.status_var.set("Username already exists")
-                cur.close()
-                conn.close()
                 return
-            
-            # Insert user
-            cur.execute("""
-                INSERT INTO users (username, password_hash, role)
-                VALUES (%s, %s, %s)
-            """, (username, hashed_password, role))
-            
-            conn.commit()
-            cur.close()
-            conn.close()
-            
+
             # Clear registration fields
             self.reg_username_entry.delete(0, tk.END)
             self.reg_password_entry.delete(0, tk.END)
             self.reg_confirm_entry.delete(0, tk.END)
             
             self.status_var.set("Registration successful! You can now login.")
-            
-        except Exception as e:
-            self.status_var.set(f"Registration failed: {e}")
+
+        db_executor.submit(create, on_done=done, key="login.register",
+                           on_error=lambda e: self.status_var.set(f"Registration failed: {e}"))
     
     def login(self):
         """Authenticate user login"""
@@ -280,23 +295,10 @@ class LoginWindow:
             self.status_var.set("Username and password are required")
             return
         
-        try:
-            # Hash password for comparison
-            hashed_password = hashlib.sha256(password.encode()).hexdigest()
-            
-            # Check credentials
-            conn = connect_db()
-            cur = conn.cursor()
-            
-            cur.execute("""
-                SELECT id, role FROM users 
-                WHERE username = %s AND password_hash = %s
-            """, (username, hashed_password))
-            
-            result = cur.fetchone()
-            cur.close()
-            conn.close()
-            
+        # Hash password for comparison
+        hashed_password = hashlib.sha256(password.encode()).hexdigest()
+
+        def checked(result):
             if result:
                 user_id, role = result
                 # Login successful
@@ -304,9 +306,10 @@ class LoginWindow:
                 self.on_login_success(user_id, username, role)
             else:
                 self.status_var.set("Invalid username or password")
-                
-        except Exception as e:
-            self.status_var.set(f"Login failed: {e}")
+
+        # Check credentials
+        db_executor.submit(db.users.find_login, username, hashed_password, on_done=checked, key="login.check",
+                           on_error=lambda e: self.status_var.set(f"Login failed: {e}"))
     
     def skip_login(self):
         """Skip login for backward compatibility"""
@@ -314,57 +317,36 @@ class LoginWindow:
         self.on_login_success(None, "Guest", "Guest")
 
 
-# Function to establish connection to PostgreSQL database
+# Check out a connection from the shared pool.
+# Calling close() on it (or leaving a `with connect_db() as conn:` block)
+# returns it to the pool instead of tearing down the session.
 def connect_db():
-    return psycopg2.connect(
-        dbname=DB_NAME,
-        user=DB_USER,
-        password=DB_PASSWORD,
-        host=DB_HOST
-    )
+    return get_pool().connection()
 
 
 # === PROJECTS TAB ===
 
-# Save a new project to the database
+# Save a new project to the database; returns its id
 def save_project(data):
-    conn = connect_db()
-    cur = conn.cursor()
-    cur.execute("""
-        INSERT INTO projects (project_name, owner, project_description, project_scope, target_users, technology_stack, platform)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
-    """, data)
-    conn.commit()
-    cur.close()
-    conn.close()
-
-# Delete a project by name
-def delete_project(project_name):
-    conn = connect_db()
-    cur = conn.cursor()
-    cur.execute("DELETE FROM projects WHERE project_name = %s", (project_name,))
-    conn.commit()
-    cur.close()
-    conn.close()
-
-# Update project details
-def update_project(data):
-    conn = connect_db()
-    cur = conn.cursor()
-    cur.execute("""
-        UPDATE projects
-        SET project_name = %s,
-            owner = %s,
-            project_description = %s,
-            project_scope = %s,
-            target_users = %s,
-            technology_stack = %s,
-            platform = %s
-        WHERE project_name = %s
-    """, data)
-    conn.commit()
-    cur.close()
-    conn.close()
+    return db.projects.insert(data)
+
+# Delete a project by id, if nobody changed it since version was read
+def delete_project(project_id, version):
+    return db.projects.delete(project_id, version)
+
+# Update project details; returns the new version, or None if the project changed meanwhile
+def update_project(project_id, version, data):
+    return db.projects.update(project_id, version, data)
+
+
+def project_error_message(e):
+    # Names are unique (migration 0008); say so instead of showing the raw database error
+    if isinstance(e, psycopg2.errors.UniqueViolation):
+        return "A project with this name already exists."
+    return f"An error occurred: {e}"
+
+# Shown when an update or delete finds that someone else changed the project first
+PROJECT_CHANGED_MESSAGE = "This project was changed or deleted by another user. The list has been reloaded."
 
 
 # === TEAM TAB ===
@@ -374,6 +356,7 @@ class TeamMembersTab:
     def __init__(self, parent):
         self.parent = parent
         self.frame = ttk.Frame(self.parent)
+        self.project_map = {}  # Filled once the project catalog is loaded
         self.setup_ui()
 
     def setup_ui(self):
@@ -388,12 +371,19 @@ class TeamMembersTab:
         self.project_combo.grid(row=1, column=1, padx=10, pady=5, sticky='w')
         self.project_combo.bind("<<ComboboxSelected>>", self.load_team_members)
 
-        # Treeview to display team member details
-        self.tree = ttk.Treeview(self.frame, columns=("Name", "Role", "Responsibilities", "Skill"), show='headings')
+        # Treeview to display team member details (only the visible rows are loaded)
+        self.member_list = VirtualTreeview(self.frame, ("Name", "Role", "Responsibilities", "Skill"),
+                                           lambda row: (row[1:], (str(row[0]),)), executor=db_executor)
+        self.tree = self.member_list.tree
         for col in ("Name", "Role", "Responsibilities", "Skill"):
             self.tree.heading(col, text=col)
             self.tree.column(col, width=245)
-        self.tree.grid(row=2, column=0, columnspan=3, padx=20, pady=5, sticky='nsew')
+        self.member_list.grid(row=2, column=0, columnspan=3, padx=20, pady=5, sticky='nsew')
+
+        # Type-ahead filter over the project's members (see FilterBar)
+        self.filter_bar = FilterBar(self.frame, db_executor)
+        self.filter_bar.attach(self.member_list)
+        self.filter_bar.grid(row=1, column=2, padx=20, pady=5, sticky='e')
 
         # Allow treeview expansion
         self.frame.grid_rowconfigure(2, weight=1)
@@ -407,45 +397,44 @@ class TeamMembersTab:
         ttk.Button(btn_frame, text="Edit Member", command=self.edit_member).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Delete Member", command=self.delete_member).pack(side="left", padx=5)
 
-        # Load projects into the dropdown
-        self.load_projects()
+        # Load projects into the dropdown (read on a worker the first time) and follow later changes
+        project_catalog.when_loaded(self.load_projects)
+        project_catalog.subscribe(self.load_projects)
 
-    # Load all project names from the database into the project dropdown
-    def load_projects(self):
-        conn = connect_db()
-        cur = conn.cursor()
-        cur.execute("SELECT id, project_name FROM projects")
-        self.project_map = {name: pid for pid, name in cur.fetchall()}
+    # Load all project names from the shared catalog into the project dropdown
+    def load_projects(self, catalog=None):
+        self.project_map = project_catalog.as_map()
         self.project_combo['values'] = list(self.project_map.keys())
-        cur.close()
-        conn.close()
 
     # Load team members for the selected project
     def load_team_members(self, event=None):
-        self.tree.delete(*self.tree.get_children())
         project_id = self.project_map.get(self.project_combo.get())
-
-        conn = connect_db()
-        cur = conn.cursor()
-        cur.execute("""
-            SELECT id, name, role, responsibilities, skill_level
-            FROM team_members
-            WHERE project_id = %s
-        """, (project_id,))
-        self.member_id_map = {}
-        for row in cur.fetchall():
-            member_id, name, role, responsibilities, skill = row
-            self.tree.insert('', 'end', values=(name, role, responsibilities, skill), tags=(str(member_id),))
-        cur.close()
-        conn.close()
+        self.filter_bar.set_source(self.member_list,
+                                   db.team_members.paged_by_project(project_id) if project_id else None)
+
+    def show_member(self, project_id, member_id):
+        # Select the member's project and scroll the list to the member (used by search)
+        self.project_combo.set(project_catalog.name_for(project_id) or "")
+        source = db.team_members.paged_by_project(project_id)
+        db_executor.submit(source.index_of, member_id, key="team.show_member",
+                           on_done=lambda index: self.filter_bar.set_source(self.member_list, source, focus=index))
+
+    def apply_changes(self, changes):
+        # Members written by other clients: patch the shown project's rows
+        project_id = self.project_map.get(self.project_combo.get())
+        changes = select_changes(changes, "team_members", project_id=project_id) if project_id else []
+        if not changes:
+            return
+        self.filter_bar.changed()
+        if not self.filter_bar.active:
+            patch_rows([self.member_list], changes, db.team_members.by_ids, db_executor)
 
     def get_selected_member(self):
-        # Get details of the currently selected member in the tree
-        selected = self.tree.focus()
-        if selected:
-            values = self.tree.item(selected)['values']
-            member_id = self.tree.item(selected)['tags'][0]
-            return selected, member_id, values
+        # Get details of the currently selected member in the list
+        row = self.member_list.focus_row()
+        if row:
+            member_id, *values = row
+            return self.tree.focus(), member_id, values
         return None, None, None
 
     def add_member(self):
@@ -468,13 +457,13 @@ class TeamMembersTab:
             return
         if not messagebox.askyesno("Confirm", "Delete this member?"):
             return
-        conn = connect_db()
-        cur = conn.cursor()
-        cur.execute("DELETE FROM team_members WHERE id = %s", (member_id,))
-        conn.commit()
-        cur.close()
-        conn.close()
-        self.load_team_members()
+        db_executor.submit(db.team_members.delete, member_id, on_done=lambda _: self.member_deleted(member_id))
+
+    def member_deleted(self, member_id):
+        # Drop the row in place; re-read only if it was not on a loaded page
+        if not self.member_list.remove_row(member_id):
+            self.member_list.refresh()
+        self.filter_bar.row_removed(self.member_list, member_id)
 
     def open_member_form(self, title, member_id=None, values=None):
         # Opens the popup form to add/edit a team member
@@ -522,25 +511,26 @@ class TeamMembersTab:
                 return
 
             project_id = self.project_map[self.project_combo.get()]
-            conn = connect_db()
-            cur = conn.cursor()
             if member_id:
                 # Update existing member
-                cur.execute("""
-                    UPDATE team_members
-                    SET name = %s, role = %s, responsibilities = %s, skill_level = %s
-                    WHERE id = %s
-                """, (*new_values, member_id))
+                db_executor.submit(db.team_members.update, member_id, *new_values, on_done=updated)
             else:
                 # Insert new member
-                cur.execute("""
-                    INSERT INTO team_members (project_id, name, role, responsibilities, skill_level)
-                    VALUES (%s, %s, %s, %s, %s)
-                """, (project_id, *new_values))
-            conn.commit()
-            cur.close()
-            conn.close()
-            self.load_team_members()
+                db_executor.submit(db.team_members.insert, project_id, *new_values, on_done=inserted)
+
+        # The writes return the stored row, so only that row of the list is touched
+        def updated(row):
+            if row is None or not self.member_list.update_row(row):
+                self.member_list.refresh()
+            if row is None:
+                self.filter_bar.row_removed(self.member_list, member_id)
+            else:
+                self.filter_bar.row_saved(self.member_list, row)
+            win.destroy()
+
+        def inserted(row):
+            self.member_list.append_row(row)
+            self.filter_bar.row_saved(self.member_list, row)
             win.destroy()
 
         # Save button for the form
@@ -549,22 +539,25 @@ class TeamMembersTab:
 
 # === RISKS TAB ===
 
+# Risk List "Sort by" choices -> RiskRepository.SORTS keys
+RISK_SORTS = {"Entry order": "entry", "Priority": "priority"}
+# Rows in the "Top Risks" window
+TOP_RISKS = 50
+
 
 class RisksTab:
     def __init__(self, parent):
         # Initialize the tab with parent notebook
         self.parent = parent
         self.frame = ttk.Frame(self.parent)
-        self.risk_details = {}  # Store risk details for matrix visualization
-        
-        # Update database schema if needed
-        self.update_risk_table_if_needed()
+        self.project_map = {}  # Filled once the project catalog is loaded
         
         # Set up the UI
         self.setup_ui()
         
-        # Initialize project data
-        self.load_projects()
+        # Initialize project data (read on a worker the first time)
+        project_catalog.when_loaded(self.load_projects)
+        project_catalog.subscribe(self.load_projects)
         
         # Force an initial synchronization after a short delay to ensure UI is ready
         self.frame.after(100, self.sync_project_dropdowns)
@@ -605,20 +598,50 @@ class RisksTab:
                                style="Accent.TButton")
         matrix_btn.grid(row=1, column=2, padx=10, pady=10, sticky='w')
         
+        # Sorting and filtering happen in the database (see RiskRepository.paged_by_project)
+        filter_frame = ttk.Frame(self.risks_list_tab)
+        filter_frame.grid(row=2, column=0, columnspan=3, padx=10, pady=(0, 5), sticky='w')
+        ttk.Label(filter_frame, text="Sort by:").pack(side="left")
+        self.sort_combo = ttk.Combobox(filter_frame, values=list(RISK_SORTS), state="readonly", width=18)
+        self.sort_combo.set("Entry order")
+        self.sort_combo.pack(side="left", padx=(5, 15))
+        self.filter_combos = {}
+        for name, label, values in (("status", "Status:", ["low", "medium", "high"]),
+                                    ("impact", "Impact:", [1, 2, 3, 4, 5]),
+                                    ("probability", "Probability:", [1, 2, 3, 4, 5])):
+            ttk.Label(filter_frame, text=label).pack(side="left")
+            combo = ttk.Combobox(filter_frame, values=["Any"] + values, state="readonly", width=7)
+            combo.set("Any")
+            combo.pack(side="left", padx=(5, 15))
+            self.filter_combos[name] = combo
+        for combo in [self.sort_combo, *self.filter_combos.values()]:
+            combo.bind("<<ComboboxSelected>>", lambda e: self.load_risks())
+        ttk.Button(filter_frame, text="Clear Filters", command=self.clear_risk_filters).pack(side="left", padx=5)
+        ttk.Button(filter_frame, text="Top Risks...", command=self.show_top_risks).pack(side="left", padx=5)
+
+        # Type-ahead filter over the rows the list shows (see FilterBar)
+        self.filter_bar = FilterBar(self.risks_list_tab, db_executor)
+        self.filter_bar.grid(row=3, column=0, columnspan=3, padx=10, pady=(0, 5), sticky='w')
+
         # Treeview to show risk entries with enhanced columns
-        self.tree = ttk.Treeview(self.risks_list_tab, columns=("Risk", "Description", "Status"), show='headings')
-        self.tree.heading("Risk", text="Risk")
-        self.tree.heading("Description", text="Description")
-        self.tree.heading("Status", text="Status")
-        self.tree.grid(row=2, column=0, columnspan=3, padx=10, pady=5, sticky="nsew")
+        self.risk_list = VirtualTreeview(self.risks_list_tab,
+                                         ("Risk", "Description", "Status", "Impact", "Probability", "Priority"),
+                                         lambda row: (row[1:], (str(row[0]),)), executor=db_executor)
+        self.tree = self.risk_list.tree
+        for col in self.tree["columns"]:
+            self.tree.heading(col, text=col)
+        for col in ("Status", "Impact", "Probability", "Priority"):
+            self.tree.column(col, width=80, anchor="center")
+        self.risk_list.grid(row=4, column=0, columnspan=3, padx=10, pady=5, sticky="nsew")
+        self.filter_bar.attach(self.risk_list)
 
         # Configure row/column resizing behavior
-        self.risks_list_tab.grid_rowconfigure(2, weight=1)
+        self.risks_list_tab.grid_rowconfigure(4, weight=1)
         self.risks_list_tab.grid_columnconfigure(2, weight=1)
 
         # Buttons to Add, Edit, Delete Risk
         btn_frame = ttk.Frame(self.risks_list_tab)
-        btn_frame.grid(row=3, column=0, columnspan=3, sticky='e', padx=10, pady=10)
+        btn_frame.grid(row=5, column=0, columnspan=3, sticky='e', padx=10, pady=10)
         ttk.Button(btn_frame, text="Add Risk", command=self.add_risk).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Edit Risk", command=self.edit_risk).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Delete Risk", command=self.delete_risk).pack(side="left", padx=5)
@@ -627,9 +650,6 @@ class RisksTab:
         ttk.Button(btn_frame, text="View Risk Matrix", command=self.show_risk_matrix,
                   style="Accent.TButton").pack(side="left", padx=15)
 
-        # Load project names into dropdown
-        self.load_projects()
-
     def setup_risk_matrix_ui(self):
         # Create a custom style for accent buttons
         style = ttk.Style()
@@ -642,7 +662,7 @@ class RisksTab:
         # Title
         ttk.Label(self.matrix_frame, 
                   text="Risk Matrix Visualization", 
-                  font=("Arial", 14, "bold")).pack(pady=(0, 20))
+                  font=("Arial", 14, "bold")).pack(pady=(0, 5))
         
         # Project selector for risk matrix tab
         select_frame = ttk.Frame(self.matrix_frame)
@@ -661,19 +681,15 @@ class RisksTab:
         # Add binding to notebook to update dropdowns when tab changes
         self.risk_notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         
-        # Button to generate the matrix
-        ttk.Button(select_frame, text="Generate Risk Matrix", 
-                  command=self.show_risk_matrix,
+        # Button to re-read the matrix
+        ttk.Button(select_frame, text="Refresh Risk Matrix", 
+                  command=self.load_matrix,
                   style="Accent.TButton").pack(side="left", padx=5)
         
-        # Instructions label with improved styling
-        instruction_frame = ttk.Frame(self.matrix_frame)
-        instruction_frame.pack(fill="x", pady=20)
-        
-        ttk.Label(instruction_frame, 
-                 text="Select a project and click 'Generate Risk Matrix' to visualize risks based on impact and probability.",
-                 wraplength=500,
-                 font=("Arial", 10, "italic")).pack(anchor="center")
+        # The matrix is drawn once and then only updated (see RiskMatrixView);
+        # clicking a cell lists its risks
+        self.matrix_view = RiskMatrixView(self.matrix_frame, on_cell_click=self.filter_by_cell)
+        self.matrix_view.frame.pack(fill="both", expand=True)
     
     def sync_project_dropdowns(self):
         """Synchronize both project dropdowns"""
@@ -691,22 +707,21 @@ class RisksTab:
             elif self.matrix_project_combo.get():
                 self.project_combo.set(self.matrix_project_combo.get())
     
-    def on_tab_changed(self, event):
+    def on_tab_changed(self, event=None):
         """Handle tab change event to update dropdowns"""
         self.sync_project_dropdowns()
+        if self.matrix_visible():
+            self.load_matrix()
+
+    def matrix_visible(self):
+        return self.risk_notebook.select() == str(self.risk_matrix_tab)
             
-    def load_projects(self):
-        # Fetch all projects and populate dropdown
-        conn = connect_db()
-        cur = conn.cursor()
-        cur.execute("SELECT id, project_name FROM projects")
-        self.project_map = {name: pid for pid, name in cur.fetchall()}
+    def load_projects(self, catalog=None):
+        # Take the project list from the shared catalog
+        self.project_map = project_catalog.as_map()
         
         # Synchronize both dropdowns
         self.sync_project_dropdowns()
-                
-        cur.close()
-        conn.close()
 
     def load_risks(self, event=None):
         # Get source of the event
@@ -726,29 +741,98 @@ class RisksTab:
                 self.matrix_project_combo.set(project_name)
                 
         project_id = self.project_map.get(project_name)
-        self.tree.delete(*self.tree.get_children())
-        self.risk_details = {}  # Reset risk details
-
-        if not project_id:
+        source = None
+        if project_id:
+            source = db.risks.paged_by_project(project_id, RISK_SORTS[self.sort_combo.get()], **self.risk_filters())
+        self.filter_bar.set_source(self.risk_list, source)
+        if self.matrix_visible():
+            self.load_matrix()
+
+    def risk_filters(self):
+        """{filter name: value or None} from the filter dropdowns"""
+        filters = {}
+        for name, combo in self.filter_combos.items():
+            value = combo.get()
+            filters[name] = None if value == "Any" else int(value) if value.isdigit() else value
+        return filters
+
+    def show_risk(self, project_id, risk_id):
+        """Select the risk's project and scroll the unfiltered list to the risk (used by search)"""
+        project_name = project_catalog.name_for(project_id) or ""
+        self.project_combo.set(project_name)
+        self.matrix_project_combo.set(project_name)
+        self.sort_combo.set("Entry order")
+        for combo in self.filter_combos.values():
+            combo.set("Any")
+        self.risk_notebook.select(self.risks_list_tab)
+        source = db.risks.paged_by_project(project_id)
+        db_executor.submit(source.index_of, risk_id, key="risks.show_risk",
+                           on_done=lambda index: self.filter_bar.set_source(self.risk_list, source, focus=index))
+
+    def list_in_entry_order(self):
+        """True when the list shows every risk by id, so written rows can be patched in place"""
+        return self.sort_combo.get() == "Entry order" and not any(self.risk_filters().values())
+
+    def risk_shown(self, row):
+        """True if the risk row passes the filter dropdowns"""
+        status, impact, probability = row[3:6]
+        values = {"status": status, "impact": impact, "probability": probability}
+        return all(value in (None, values[name]) for name, value in self.risk_filters().items())
+
+    def apply_changes(self, changes):
+        # Risks written by other clients: patch the shown project's rows and matrix
+        project_id = self.project_map.get(self.project_combo.get())
+        changes = select_changes(changes, "risks", project_id=project_id) if project_id else []
+        if not changes:
             return
-            
-        conn = connect_db()
-        cur = conn.cursor()
-        cur.execute("SELECT id, name, description, status FROM risks WHERE project_id = %s", (project_id,))
-        self.risk_id_map = {}
-        for row in cur.fetchall():
-            risk_id, name, desc, status = row
-            self.tree.insert('', 'end', values=(name, desc, status), tags=(str(risk_id),))
-            self.risk_id_map[name] = risk_id
-        cur.close()
-        conn.close()
+        self.filter_bar.changed()
+        if not self.filter_bar.active:
+            if self.list_in_entry_order():
+                patch_rows([self.risk_list], changes, db.risks.by_ids, db_executor)
+            else:
+                # Rows may move or drop out of a sorted or filtered list
+                self.risk_list.refresh()
+        if self.matrix_visible():
+            self.load_matrix()
+
+    def clear_risk_filters(self):
+        for combo in self.filter_combos.values():
+            combo.set("Any")
+        self.load_risks()
+
+    def filter_by_cell(self, impact, probability):
+        """A matrix cell was clicked: list that cell's risks, highest priority first"""
+        self.filter_combos["impact"].set(impact)
+        self.filter_combos["probability"].set(probability)
+        self.sort_combo.set("Priority")
+        self.risk_notebook.select(self.risks_list_tab)
+        self.load_risks()
+
+    def show_top_risks(self):
+        """Window with the highest-priority risks of all projects (honours the status filter)"""
+        status = self.risk_filters()["status"]
+        win = tk.Toplevel(self.frame)
+        win.title(f"Top {TOP_RISKS} Risks - All Projects" + (f" ({status})" if status else ""))
+        columns = ("Project", "Risk", "Status", "Impact", "Probability", "Priority")
+        tree = ttk.Treeview(win, columns=columns, show="headings", height=20)
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=160 if col in ("Project", "Risk") else 80)
+        tree.pack(fill="both", expand=True, padx=10, pady=10)
+
+        def show(rows):
+            for row in rows:
+                tree.insert("", "end", values=row)
+
+        db_executor.submit(db.risks.top, TOP_RISKS, status, on_done=show)
 
     def get_selected_risk(self):
         # Return ID and data of selected risk
-        selected = self.tree.focus()
-        if not selected:
+        row = self.risk_list.focus_row()
+        if not row:
             return None, None, None
-        return selected, self.tree.item(selected)['tags'][0], self.tree.item(selected)['values']
+        risk_id, *values = row
+        return self.tree.focus(), risk_id, values
 
     def add_risk(self):
         # Open empty form to add new risk
@@ -770,13 +854,13 @@ class RisksTab:
             return
         if not messagebox.askyesno("Confirm", "Delete this risk?"):
             return
-        conn = connect_db()
-        cur = conn.cursor()
-        cur.execute("DELETE FROM risks WHERE id = %s", (risk_id,))
-        conn.commit()
-        cur.close()
-        conn.close()
-        self.load_risks()
+        db_executor.submit(db.risks.delete, risk_id, on_done=lambda _: self.risk_deleted(risk_id))
+
+    def risk_deleted(self, risk_id):
+        # Drop the row in place; re-read only if it was not on a loaded page
+        if not self.risk_list.remove_row(risk_id):
+            self.risk_list.refresh()
+        self.filter_bar.row_removed(self.risk_list, risk_id)
 
     def open_risk_form(self, title, risk_id=None, values=None):
         # Popup window for adding/editing a risk
@@ -799,582 +883,89 @@ class RisksTab:
         status.grid(row=2, column=1, padx=10, pady=5, sticky="w")
         status.set("low")
 
+        # Impact and probability (1-5); the database derives the priority from them
+        ttk.Label(win, text="Impact").grid(row=3, column=0, padx=10, pady=5, sticky="e")
+        impact = ttk.Combobox(win, values=[1, 2, 3, 4, 5], state="readonly", width=37)
+        impact.grid(row=3, column=1, padx=10, pady=5, sticky="w")
+        impact.set(3)
+        ttk.Label(win, text="Probability").grid(row=4, column=0, padx=10, pady=5, sticky="e")
+        probability = ttk.Combobox(win, values=[1, 2, 3, 4, 5], state="readonly", width=37)
+        probability.grid(row=4, column=1, padx=10, pady=5, sticky="w")
+        probability.set(3)
+
         # Prefill if editing
         if values:
             name.insert(0, values[0])
             desc.insert("1.0", values[1])
             status.set(values[2])
+            impact.set(values[3])
+            probability.set(values[4])
 
         def submit():
             # Save or update the risk in the database
             project_id = self.project_map[self.project_combo.get()]
-            conn = connect_db()
-            cur = conn.cursor()
+            scores = int(impact.get()), int(probability.get())
             if risk_id:
-                cur.execute("""
-                    UPDATE risks SET name = %s, description = %s, status = %s
-                    WHERE id = %s
-                """, (name.get(), desc.get("1.0", tk.END).strip(), status.get(), risk_id))
+                db_executor.submit(db.risks.update, risk_id, name.get(), desc.get("1.0", tk.END).strip(),
+                                   status.get(), *scores, on_done=updated)
             else:
-                cur.execute("""
-                    INSERT INTO risks (project_id, name, description, status)
-                    VALUES (%s, %s, %s, %s)
-                """, (project_id, name.get(), desc.get("1.0", tk.END).strip(), status.get()))
-            conn.commit()
-            cur.close()
-            conn.close()
-            self.load_risks()
+                db_executor.submit(db.risks.insert, project_id, name.get(), desc.get("1.0", tk.END).strip(),
+                                   status.get(), *scores, on_done=inserted)
+
+        # The writes return the stored row, so only that row of the list is touched;
+        # a sorted or filtered list is re-read, since the row may move or drop out
+        def updated(row):
+            if row is None or not self.list_in_entry_order() or not self.risk_list.update_row(row):
+                self.risk_list.refresh()
+            if row is not None and self.risk_shown(row):
+                self.filter_bar.row_saved(self.risk_list, row)
+            else:
+                self.filter_bar.row_removed(self.risk_list, risk_id)
+            win.destroy()
+
+        def inserted(row):
+            if self.list_in_entry_order():
+                self.risk_list.append_row(row)
+            else:
+                self.risk_list.refresh()
+            if self.risk_shown(row):
+                self.filter_bar.row_saved(self.risk_list, row)
             win.destroy()
 
         # Save button for the popup
-        ttk.Button(win, text="Save", command=submit).grid(row=3, column=1, pady=(3,10), padx=10)
+        ttk.Button(win, text="Save", command=submit).grid(row=5, column=1, pady=(3,10), padx=10)
         
     def show_risk_matrix(self):
-        """Display risk matrix visualization with proper scaling and background"""
-        # Get project name from appropriate dropdown based on which tab is active
-        current_tab = self.risk_notebook.index(self.risk_notebook.select())
-        
-        if current_tab == 0:  # Risk List tab
-            project_name = self.project_combo.get()
-        else:  # Risk Matrix tab
-            project_name = self.matrix_project_combo.get()
-            
-        if not project_name:
+        """Switch to the Risk Matrix tab for the selected project"""
+        if not self.project_combo.get():
             messagebox.showwarning("Select Project", "Please select a project first")
             return
-            
-        # Create a new window for the matrix
-        matrix_win = tk.Toplevel(self.frame)
-        matrix_win.title(f"Risk Matrix - {project_name}")
-        matrix_win.geometry("900x750")  # Increased size to accommodate larger margins
-        matrix_win.configure(background="#f0f0f0")  # Light gray background
-        matrix_win.resizable(True, True)  # Allow resizing
-        
-        # Main frame to hold everything
-        main_frame = ttk.Frame(matrix_win, padding=10, style="Main.TFrame")
-        main_frame.pack(fill="both", expand=True)
-        
-        # Configure styles
-        style = ttk.Style()
-        style.configure("Main.TFrame", background="#f0f0f0")
-        style.configure("Header.TLabel", font=("Arial", 16, "bold"), background="#f0f0f0")
-        style.configure("Subheader.TLabel", font=("Arial", 11), background="#f0f0f0", foreground="#555555")
-        style.configure("Footer.TLabel", font=("Arial", 10, "italic"), background="#f0f0f0")
-        
-        # Header section
-        header_frame = ttk.Frame(main_frame, style="Main.TFrame")
-        header_frame.pack(fill="x", pady=(0, 10))
-        
-        ttk.Label(header_frame, 
-                 text=f"Risk Matrix: {project_name}", 
-                 style="Header.TLabel").pack(anchor="w")
-        
-        ttk.Label(header_frame, 
-                 text="Visualization of project risks based on impact and probability", 
-                 style="Subheader.TLabel").pack(anchor="w", pady=(0, 10))
-        
-        # Matrix frame - will contain the actual visualization
-        matrix_frame = ttk.Frame(main_frame, style="Main.TFrame")
-        matrix_frame.pack(fill="both", expand=True, padx=5, pady=5)
-        
-        # Define matrix dimensions and spacing
-        # These are carefully calculated to fit properly
-        matrix_cell_size = 80  # Size of each cell
-        matrix_width = 5 * matrix_cell_size  # 5 columns
-        matrix_height = 5 * matrix_cell_size  # 5 rows
-        left_margin = 130  # Space for impact labels - increased
-        top_margin = 100   # Space for probability labels - increased
-        right_margin = 20  # Additional right margin
-        bottom_margin = 20  # Additional bottom margin
-        
-        # Calculate total canvas size
-        canvas_width = left_margin + matrix_width + right_margin
-        canvas_height = top_margin + matrix_height + bottom_margin
-        
-        # Create canvas that will hold the matrix
-        canvas = tk.Canvas(matrix_frame, 
-                          width=canvas_width, 
-                          height=canvas_height,
-                          background="#f0f0f0",  # Match the background
-                          highlightthickness=0)  # Remove border
-        canvas.pack(fill="both", expand=True)
-        
-        # Define colors for matrix cells - using more professional color scheme
-        colors = {
-            "critical": "#e53935",  # Red
-            "high": "#f57c00",      # Orange
-            "medium": "#fbc02d",    # Amber
-            "low": "#7cb342"        # Green
-        }
-        
-        # Draw matrix cells with shadow effect
-        for i in range(5):  # Rows (impact)
-            for j in range(5):  # Columns (probability)
-                # Calculate priority value
-                priority = (5-i) * (j+1)  # Impact (5-i) * Probability (j+1)
-                
-                # Get cell color based on priority
-                if priority >= 16:
-                    color = colors["critical"]
-                    border_color = "#c62828"  # Darker red
-                elif priority >= 10:
-                    color = colors["high"]
-                    border_color = "#e65100"  # Darker orange
-                elif priority >= 5:
-                    color = colors["medium"]
-                    border_color = "#f9a825"  # Darker amber
-                else:
-                    color = colors["low"]
-                    border_color = "#558b2f"  # Darker green
-                
-                # Cell position
-                x1 = left_margin + j * matrix_cell_size
-                y1 = top_margin + i * matrix_cell_size
-                x2 = x1 + matrix_cell_size
-                y2 = y1 + matrix_cell_size
-                
-                # Draw subtle shadow for 3D effect
-                canvas.create_rectangle(
-                    x1+3, y1+3, x2+3, y2+3,
-                    fill="#d0d0d0", outline="", width=0
-                )
-                
-                # Draw cell
-                cell_id = canvas.create_rectangle(
-                    x1, y1, x2, y2,
-                    fill=color, outline=border_color, width=2
-                )
-                
-                # Add priority text
-                canvas.create_text(
-                    x1 + matrix_cell_size/2,
-                    y1 + matrix_cell_size/2,
-                    text=str(priority),
-                    font=("Arial", 11, "bold"),
-                    fill="#ffffff"  # White text for better contrast
-                )
-        
-        # Draw axis titles with improved positioning
-        canvas.create_text(
-            20,  # Moved even further left to avoid any overlap
-            top_margin + matrix_height/2,
-            text="IMPACT",
-            font=("Arial", 12, "bold"),
-            angle=90,
-            anchor="center",
-            fill="#333333"
-        )
-        
-        canvas.create_text(
-            left_margin + matrix_width/2, 
-            20,  # Moved even higher to avoid any overlap
-            text="PROBABILITY",
-            font=("Arial", 12, "bold"),
-            anchor="center",
-            fill="#333333"
-        )
-        
-        # Draw impact axis labels (y-axis) with more spacing
-        impact_labels = ["Severe (5)", "Significant (4)", "Moderate (3)", "Minor (2)", "Minimal (1)"]
-        for i, label in enumerate(impact_labels):
-            y = top_margin + i * matrix_cell_size + matrix_cell_size/2
-            canvas.create_text(
-                left_margin - 15,  # Increased distance from matrix even more
-                y,
-                text=label,
-                font=("Arial", 10),
-                anchor="e",
-                fill="#333333"
-            )
-        
-        # Draw probability axis labels (x-axis) with more spacing
-        prob_labels = ["Rare (1)", "Unlikely (2)", "Possible (3)", "Likely (4)", "Almost Certain (5)"]
-        for j, label in enumerate(prob_labels):
-            x = left_margin + j * matrix_cell_size + matrix_cell_size/2
-            canvas.create_text(
-                x, 
-                top_margin - 15,  # Increased distance from matrix even more
-                text=label,
-                font=("Arial", 10),
-                anchor="s",
-                fill="#333333"
-            )
-            
-        # Fetch risks data for the selected project
-        conn = connect_db()
-        cur = conn.cursor()
-        cur.execute("""
-            SELECT id, name, description, status, 
-                   COALESCE(impact, 3) as impact,  
-                   COALESCE(probability, 3) as probability
-            FROM risks 
-            WHERE project_id = %s
-        """, (self.project_map[project_name],))
-        
-        # Store risk data
-        risks = {}
-        risk_positions = {}
-        
-        for row in cur.fetchall():
-            risk_id, name, desc, status, impact, probability = row
-            # Use default values if none stored
-            impact = impact if impact else 3
-            probability = probability if probability else 3
-            
-            # Store risk data
-            risks[risk_id] = {
-                'name': name,
-                'description': desc,
-                'impact': impact,
-                'probability': probability,
-                'priority': impact * probability,
-                'status': status
-            }
-            
-            # Calculate cell position for this risk
-            cell_x = probability - 1
-            cell_y = 5 - impact
-            
-            # Track risks in each cell
-            cell_key = f"{cell_x},{cell_y}"
-            if cell_key not in risk_positions:
-                risk_positions[cell_key] = []
-            risk_positions[cell_key].append(risk_id)
-        
-        cur.close()
-        conn.close()
-        
-        # Plot risks on the matrix
-        for cell_key, risk_ids in risk_positions.items():
-            cell_x, cell_y = map(int, cell_key.split(','))
-            num_risks = len(risk_ids)
-            
-            # Base position for this cell
-            base_x = left_margin + cell_x * matrix_cell_size + matrix_cell_size/2
-            base_y = top_margin + cell_y * matrix_cell_size + matrix_cell_size/2
-            
-            # Choose visualization based on number of risks in cell
-            if num_risks == 1:
-                # Single risk
-                self._draw_risk_dot(canvas, base_x, base_y, risk_ids[0], risks)
-            elif num_risks == 2:
-                # Two risks side by side
-                self._draw_risk_dot(canvas, base_x - 15, base_y, risk_ids[0], risks)
-                self._draw_risk_dot(canvas, base_x + 15, base_y, risk_ids[1], risks)
-            elif num_risks == 3:
-                # Three risks in triangle
-                self._draw_risk_dot(canvas, base_x, base_y - 15, risk_ids[0], risks)
-                self._draw_risk_dot(canvas, base_x - 15, base_y + 10, risk_ids[1], risks)
-                self._draw_risk_dot(canvas, base_x + 15, base_y + 10, risk_ids[2], risks)
-            elif num_risks == 4:
-                # Four risks in square
-                self._draw_risk_dot(canvas, base_x - 15, base_y - 15, risk_ids[0], risks)
-                self._draw_risk_dot(canvas, base_x + 15, base_y - 15, risk_ids[1], risks)
-                self._draw_risk_dot(canvas, base_x - 15, base_y + 15, risk_ids[2], risks)
-                self._draw_risk_dot(canvas, base_x + 15, base_y + 15, risk_ids[3], risks)
-            else:
-                # More than 4 risks - show count
-                # Draw shadow for 3D effect
-                canvas.create_oval(
-                    base_x - 18 + 2, base_y - 18 + 2, 
-                    base_x + 18 + 2, base_y + 18 + 2, 
-                    fill="#d0d0d0", outline=""
-                )
-                # Draw main circle
-                circle_id = canvas.create_oval(
-                    base_x - 20, base_y - 20, 
-                    base_x + 20, base_y + 20, 
-                    fill="#3949ab", outline="#1a237e", width=2
-                )
-                text_id = canvas.create_text(
-                    base_x, base_y, 
-                    text=f"{num_risks}", 
-                    fill="white", 
-                    font=("Arial", 11, "bold")
-                )
-                
-                # Create tooltip text
-                tooltip_text = f"Multiple risks ({num_risks}) in this cell:\n\n"
-                for i, risk_id in enumerate(risk_ids):
-                    tooltip_text += f"{i+1}. {risks[risk_id]['name']}\n"
-                
-                # Bind hover events for multiple risks indicator
-                self._bind_tooltip(canvas, circle_id, tooltip_text)
-                self._bind_tooltip(canvas, text_id, tooltip_text)
-        
-        # Legend section
-        legend_frame = ttk.LabelFrame(main_frame, text="Risk Priority Legend", padding=10)
-        legend_frame.pack(fill="x", pady=10)
-        
-        # Create legend items
-        legend_items = [
-            ("Low (1-4)", colors["low"]),
-            ("Medium (5-9)", colors["medium"]),
-            ("High (10-15)", colors["high"]),
-            ("Critical (16-25)", colors["critical"])
-        ]
-        
-        # Layout legend items horizontally
-        for text, color in legend_items:
-            item_frame = ttk.Frame(legend_frame)
-            item_frame.pack(side="left", padx=20, pady=2)
-            
-            # Color box
-            color_box = tk.Canvas(item_frame, width=20, height=20, bg="#f0f0f0", highlightthickness=0)
-            color_box.create_rectangle(0, 0, 18, 18, fill=color, outline="#666666")
-            color_box.pack(side="left", padx=5)
-            
-            # Text label
-            ttk.Label(item_frame, text=text).pack(side="left")
-        
-        # Instructions at the bottom
-        footer_frame = ttk.Frame(main_frame, style="Main.TFrame")
-        footer_frame.pack(fill="x", pady=10)
-        
-        ttk.Label(
-            footer_frame, 
-            text="Hover over risk indicators to see details. Blue dots show individual risks.",
-            style="Footer.TLabel"
-        ).pack(side="left")
-        
-        ttk.Button(
-            footer_frame, 
-            text="Close", 
-            command=matrix_win.destroy
-        ).pack(side="right")
-        
-        # Store active tooltips
-        self.active_tooltips = {}
-        
-        # Store risk data for tooltips
-        self.current_risks = risks
-        
-        # Cleanup on window close
-        def on_window_close():
-            if hasattr(self, 'active_tooltips'):
-                for tooltip in self.active_tooltips.values():
-                    if tooltip and tooltip.winfo_exists():
-                        tooltip.destroy()
-            matrix_win.destroy()
-            
-        matrix_win.protocol("WM_DELETE_WINDOW", on_window_close)
-    
-    def _draw_risk_dot(self, canvas, x, y, risk_id, risks):
-        """Draw a single risk dot on the matrix"""
-        # Draw shadow for 3D effect
-        shadow_id = canvas.create_oval(
-            x - 10 + 2, y - 10 + 2, 
-            x + 10 + 2, y + 10 + 2, 
-            fill="#d0d0d0", outline=""
-        )
-        
-        # Different shade of blue for each risk
-        fill_color = "#3f51b5"  # Indigo
-        outline_color = "#303f9f"  # Darker indigo
-        
-        # Draw dot
-        dot_id = canvas.create_oval(
-            x - 12, y - 12, 
-            x + 12, y + 12, 
-            fill=fill_color, outline=outline_color, width=2
-        )
-        
-        # Add risk ID
-        text_id = canvas.create_text(
-            x, y, 
-            text=str(risk_id), 
-            fill="white", 
-            font=("Arial", 9, "bold")
-        )
-        
-        # Prepare tooltip text
-        risk = risks[risk_id]
-        tooltip_text = f"Risk ID: {risk_id}\n"
-        tooltip_text += f"Name: {risk['name']}\n"
-        if risk['description']:
-            tooltip_text += f"Description: {risk['description'][:50]}...\n" if len(risk['description']) > 50 else f"Description: {risk['description']}\n"
-        tooltip_text += f"Impact: {risk['impact']}\n"
-        tooltip_text += f"Probability: {risk['probability']}\n"
-        tooltip_text += f"Priority: {risk['priority']}\n"
-        tooltip_text += f"Status: {risk['status']}\n"
-        
-        # Bind tooltip to both dot and text
-        self._bind_tooltip(canvas, dot_id, tooltip_text)
-        self._bind_tooltip(canvas, text_id, tooltip_text)
-        
-    def _bind_tooltip(self, canvas, item_id, tooltip_text):
-        """Bind tooltip to canvas item"""
-        canvas.tag_bind(item_id, "<Enter>", lambda e, id=item_id, txt=tooltip_text: self._show_tooltip(e, id, txt))
-        canvas.tag_bind(item_id, "<Leave>", lambda e, id=item_id: self._hide_tooltip(id))
-        
-    def _show_tooltip(self, event, item_id, tooltip_text):
-        """Show tooltip when hovering over an item"""
-        # Hide any existing tooltip for this item
-        self._hide_tooltip(item_id)
-        
-        # Create new tooltip
-        tooltip = tk.Toplevel()
-        tooltip.wm_overrideredirect(True)  # Remove window border
-        
-        # Position near mouse
-        tooltip.geometry(f"+{event.x_root+15}+{event.y_root+10}")
-        
-        # Create tooltip content
-        frame = ttk.Frame(tooltip, relief="solid", borderwidth=1)
-        frame.pack(fill="both", expand=True)
-        
-        label = ttk.Label(
-            frame, 
-            text=tooltip_text,
-            background="#fffde7",  # Light yellow
-            padding=8,
-            justify="left",
-            font=("Arial", 10)
-        )
-        label.pack()
-        
-        # Store tooltip reference
-        self.active_tooltips[item_id] = tooltip
-        
-    def _hide_tooltip(self, item_id):
-        """Hide tooltip when mouse leaves an item"""
-        if item_id in self.active_tooltips:
-            tooltip = self.active_tooltips[item_id]
-            if tooltip and tooltip.winfo_exists():
-                tooltip.destroy()
-            self.active_tooltips[item_id] = None
+        if self.matrix_visible():
+            self.load_matrix()
+        else:
+            # on_tab_changed syncs the dropdowns and loads the matrix
+            self.risk_notebook.select(self.risk_matrix_tab)
 
-    def update_risk_table_if_needed(self):
-        """Check if the risks table needs to be updated with impact and probability columns"""
-        try:
-            conn = connect_db()
-            cur = conn.cursor()
-            
-            # First make sure the risks table exists
-            cur.execute("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_name = 'risks'
-                )
-            """)
-            
-            table_exists = cur.fetchone()[0]
-            if not table_exists:
-                # Create the risks table if it doesn't exist
-                cur.execute("""
-                    CREATE TABLE risks (
-                        id SERIAL PRIMARY KEY,
-                        project_id INTEGER NOT NULL,
-                        name TEXT NOT NULL,
-                        description TEXT,
-                        status TEXT,
-                        impact INTEGER DEFAULT 3,
-                        probability INTEGER DEFAULT 3,
-                        priority INTEGER DEFAULT 9,
-                        mitigation_strategy TEXT
-                    )
-                """)
-                conn.commit()
-                print("Created risks table")
-            
-            # Check if impact column exists
-            cur.execute("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.columns 
-                    WHERE table_name = 'risks' AND column_name = 'impact'
-                )
-            """)
-            impact_exists = cur.fetchone()[0]
-            
-            # Check if probability column exists
-            cur.execute("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.columns 
-                    WHERE table_name = 'risks' AND column_name = 'probability'
-                )
-            """)
-            probability_exists = cur.fetchone()[0]
-            
-            # If columns don't exist, add them
-            if not impact_exists:
-                cur.execute("ALTER TABLE risks ADD COLUMN impact INTEGER DEFAULT 3")
-                print("Added impact column to risks table")
-                
-            if not probability_exists:
-                cur.execute("ALTER TABLE risks ADD COLUMN probability INTEGER DEFAULT 3")
-                print("Added probability column to risks table")
-                
-            # Add priority column if it doesn't exist
-            cur.execute("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.columns 
-                    WHERE table_name = 'risks' AND column_name = 'priority'
-                )
-            """)
-            priority_exists = cur.fetchone()[0]
-            
-            if not priority_exists:
-                cur.execute("ALTER TABLE risks ADD COLUMN priority INTEGER DEFAULT 9")
-                print("Added priority column to risks table")
-                
-            # Add mitigation_strategy column if it doesn't exist
-            cur.execute("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.columns 
-                    WHERE table_name = 'risks' AND column_name = 'mitigation_strategy'
-                )
-            """)
-            mitigation_exists = cur.fetchone()[0]
-            
-            if not mitigation_exists:
-                cur.execute("ALTER TABLE risks ADD COLUMN mitigation_strategy TEXT DEFAULT ''")
-                print("Added mitigation_strategy column to risks table")
-                
-            # Check for the old columns to handle the transition
-            cur.execute("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.columns 
-                    WHERE table_name = 'risks' AND column_name = 'risk_name'
-                )
-            """)
-            old_name_exists = cur.fetchone()[0]
-            
-            if old_name_exists:
-                # Rename the columns if using the old naming convention
-                print("Converting old risk column names to new format...")
-                cur.execute("ALTER TABLE risks RENAME COLUMN risk_name TO name")
-                cur.execute("ALTER TABLE risks RENAME COLUMN risk_description TO description")
-                cur.execute("ALTER TABLE risks RENAME COLUMN risk_status TO status")
-                print("Column names updated successfully")
-            
-            # If we have risks without impact/probability, calculate default values
-            cur.execute("""
-                UPDATE risks 
-                SET impact = 3,
-                    probability = 3,
-                    priority = 9
-                WHERE impact IS NULL OR probability IS NULL OR priority IS NULL
-            """)
-            
-            # Commit all changes
-            conn.commit()
-            print("Risk table schema update complete")
-            
-            cur.close()
-            conn.close()
-        except Exception as e:
-            print(f"Error updating risk table: {e}")
-            messagebox.showerror("Database Error", f"Error updating risk table: {e}")
+    def load_matrix(self):
+        """Read the selected project's risks on a worker and update the matrix"""
+        project_name = self.matrix_project_combo.get()
+        project_id = self.project_map.get(project_name)
+        if not project_id:
+            self.matrix_view.clear()
+            return
+        db_executor.submit(db.risks.matrix_by_project, project_id, key="risks.matrix",
+                           on_done=lambda rows: self.matrix_view.show(f"Risk Matrix: {project_name}", rows))
 
 
 # === REQUIREMENTS TAB ===
 
 
 class RequirementsTab:
-    def __init__(self, parent, effort_tab):
+    def __init__(self, parent, on_requirements_changed=None):
         self.parent = parent
-        self.effort_tab = effort_tab
+        self.on_requirements_changed = on_requirements_changed
         self.frame = ttk.Frame(self.parent)
+        self.project_map = {}  # Filled once the project catalog is loaded
         self.setup_ui()
 
     def setup_ui(self):
@@ -1391,17 +982,27 @@ class RequirementsTab:
 
         # Functional Requirements Treeview
         ttk.Label(self.frame, text="Functional Requirements:").grid(row=2, column=0, columnspan=3, sticky='w', padx=20)
-        self.func_tree = ttk.Treeview(self.frame, columns=("Name/ID", "Status", "Description"), show='headings')
+        self.func_list = VirtualTreeview(self.frame, ("Name/ID", "Status", "Description"),
+                                         lambda row: (row[1:], (str(row[0]),)), executor=db_executor)
+        self.func_tree = self.func_list.tree
         for col in self.func_tree["columns"]:
             self.func_tree.heading(col, text=col)
-        self.func_tree.grid(row=3, column=0, columnspan=3, padx=20, pady=5, sticky="nsew")
+        self.func_list.grid(row=3, column=0, columnspan=3, padx=20, pady=5, sticky="nsew")
 
         # Non-Functional Requirements Treeview
         ttk.Label(self.frame, text="Non-Functional Requirements:").grid(row=4, column=0, columnspan=3, sticky='w', padx=20)
-        self.nonfunc_tree = ttk.Treeview(self.frame, columns=("Name/ID", "Status", "Description"), show='headings')
+        self.nonfunc_list = VirtualTreeview(self.frame, ("Name/ID", "Status", "Description"),
+                                            lambda row: (row[1:], (str(row[0]),)), executor=db_executor)
+        self.nonfunc_tree = self.nonfunc_list.tree
         for col in self.nonfunc_tree["columns"]:
             self.nonfunc_tree.heading(col, text=col)
-        self.nonfunc_tree.grid(row=5, column=0, columnspan=3, padx=20, pady=5, sticky="nsew")
+        self.nonfunc_list.grid(row=5, column=0, columnspan=3, padx=20, pady=5, sticky="nsew")
+
+        # One type-ahead filter for both lists (see FilterBar)
+        self.filter_bar = FilterBar(self.frame, db_executor)
+        self.filter_bar.attach(self.func_list)
+        self.filter_bar.attach(self.nonfunc_list)
+        self.filter_bar.grid(row=1, column=2, padx=20, pady=10, sticky='e')
 
         # Allow the treeviews to expand with the window
         self.frame.grid_rowconfigure(2, weight=1)
@@ -1415,43 +1016,66 @@ class RequirementsTab:
         ttk.Button(btn_frame, text="Edit Requirement", command=self.edit_requirement).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Delete Requirement", command=self.delete_requirement).pack(side="left", padx=5)
 
-        self.load_projects()
+        project_catalog.when_loaded(self.load_projects)
+        project_catalog.subscribe(self.load_projects)
 
-    def load_projects(self):
-        # Load all projects from DB and populate the dropdown
-        conn = connect_db()
-        cur = conn.cursor()
-        cur.execute("SELECT id, project_name FROM projects")
-        self.project_map = {name: pid for pid, name in cur.fetchall()}
+    def load_projects(self, catalog=None):
+        # Populate the dropdown from the shared project catalog
+        self.project_map = project_catalog.as_map()
         self.project_combo['values'] = list(self.project_map.keys())
-        cur.close()
-        conn.close()
 
     def load_requirements(self, event=None):
         # Load all requirements for selected project and populate treeviews
         project_name = self.project_combo.get()
         project_id = self.project_map.get(project_name)
-        self.func_tree.delete(*self.func_tree.get_children())
-        self.nonfunc_tree.delete(*self.nonfunc_tree.get_children())
-
-        conn = connect_db()
-        cur = conn.cursor()
-        cur.execute("SELECT id, requirement_name, requirement_type, status, description FROM requirements WHERE project_id = %s", (project_id,))
-        self.req_id_map = {}
-        for row in cur.fetchall():
-            req_id, name, rtype, status, desc = row
-            tree = self.func_tree if rtype == "functional" else self.nonfunc_tree
-            tree.insert('', 'end', values=(name, status, desc), tags=(str(req_id),))
-            self.req_id_map[name] = req_id
-        cur.close()
-        conn.close()
+        if project_id:
+            self.filter_bar.set_source(self.func_list, db.requirements.paged_by_project(project_id, "functional"))
+            self.filter_bar.set_source(self.nonfunc_list,
+                                       db.requirements.paged_by_project(project_id, "non-functional"))
+        else:
+            self.filter_bar.set_source(self.func_list, None)
+            self.filter_bar.set_source(self.nonfunc_list, None)
+
+    def show_requirement(self, project_id, req_id, requirement_type):
+        # Select the requirement's project and scroll its list to it (used by search)
+        self.project_combo.set(project_catalog.name_for(project_id) or "")
+        self.load_requirements()
+        requirement_list = {"functional": self.func_list, "non-functional": self.nonfunc_list}.get(requirement_type)
+        if requirement_list is None:
+            return  # Neither list shows requirements of other types
+        source = db.requirements.paged_by_project(project_id, requirement_type)
+        db_executor.submit(source.index_of, req_id, key="requirements.show_requirement",
+                           on_done=lambda index: self.filter_bar.set_source(requirement_list, source, focus=index))
+
+    def refresh_requirements(self):
+        # Re-read both lists in place after a change
+        self.func_list.refresh()
+        self.nonfunc_list.refresh()
+
+    def apply_changes(self, changes):
+        # Requirements written by other clients: patch the shown project's lists
+        project_id = self.project_map.get(self.project_combo.get())
+        changes = select_changes(changes, "requirements", project_id=project_id) if project_id else []
+        if not changes:
+            return
+        self.filter_bar.changed()
+        if not self.filter_bar.active:
+            patch_rows([self.func_list, self.nonfunc_list], changes, db.requirements.by_ids, db_executor,
+                       place=self.place_requirement)
+
+    def place_requirement(self, row):
+        """(list showing the row, row without its type) for a row from by_ids()"""
+        *list_row, requirement_type = row
+        requirement_list = {"functional": self.func_list, "non-functional": self.nonfunc_list}.get(requirement_type)
+        return (requirement_list, tuple(list_row)) if requirement_list else (None, None)
 
     def get_selected_requirement(self):
-        # Returns the selected row's ID and values from either treeview
-        for tree in [self.func_tree, self.nonfunc_tree]:
-            selected = tree.focus()
-            if selected:
-                return selected, tree.item(selected)['tags'][0], tree.item(selected)['values']
+        # Returns the selected row's ID and values from either list
+        for requirement_list in [self.func_list, self.nonfunc_list]:
+            row = requirement_list.focus_row()
+            if row:
+                req_id, *values = row
+                return requirement_list.tree.focus(), req_id, values
         return None, None, None
 
     def add_requirement(self):
@@ -1474,13 +1098,37 @@ class RequirementsTab:
             return
         if not messagebox.askyesno("Confirm", "Delete this requirement?"):
             return
-        conn = connect_db()
-        cur = conn.cursor()
-        cur.execute("DELETE FROM requirements WHERE id = %s", (req_id,))
-        conn.commit()
-        cur.close()
-        conn.close()
-        self.load_requirements()
+        db_executor.submit(db.requirements.delete, req_id, on_done=lambda _: self.requirement_deleted(req_id))
+
+    def requirement_deleted(self, req_id):
+        # Drop the row from whichever list shows it; re-read only if neither has it loaded
+        if not (self.func_list.remove_row(req_id) or self.nonfunc_list.remove_row(req_id)):
+            self.refresh_requirements()
+        self.filter_bar.row_removed(self.func_list, req_id)
+        self.filter_bar.row_removed(self.nonfunc_list, req_id)
+
+    def requirement_saved(self, row, req_id=None):
+        """Patch the lists with a row returned by insert/update (row ends with the requirement type)"""
+        if row is None:
+            self.refresh_requirements()
+            self.filter_bar.row_removed(self.func_list, req_id)
+            self.filter_bar.row_removed(self.nonfunc_list, req_id)
+            return
+        *list_row, requirement_type = row
+        list_row = tuple(list_row)
+        if requirement_type == "functional":
+            target, other = self.func_list, self.nonfunc_list
+        else:
+            target, other = self.nonfunc_list, self.func_list
+
+        if req_id is None:
+            target.append_row(list_row)
+        elif not target.update_row(list_row):
+            # The type changed: the row moves to the other list, in id order
+            other.remove_row(req_id)
+            target.refresh()
+            self.filter_bar.row_removed(other, req_id)
+        self.filter_bar.row_saved(target, list_row)
 
     def open_requirement_form(self, title, req_id=None, values=None):
         # Opens form to add or edit a requirement
@@ -1520,26 +1168,19 @@ class RequirementsTab:
         def submit():
             # Save new or updated requirement to DB
             project_id = self.project_map[self.project_combo.get()]
-            conn = connect_db()
-            cur = conn.cursor()
             if req_id:
                 # Update existing requirement
-                cur.execute("""
-                    UPDATE requirements 
-                    SET requirement_name = %s, requirement_type = %s, status = %s, description = %s
-                    WHERE id = %s
-                """, (name.get(), rtype.get(), status.get(), desc.get("1.0", tk.END).strip(), req_id))
+                db_executor.submit(db.requirements.update, req_id, name.get(), rtype.get(), status.get(),
+                                   desc.get("1.0", tk.END).strip(), on_done=saved)
             else:
                 # Add new requirement
-                cur.execute("""
-                    INSERT INTO requirements (project_id, requirement_name, description, requirement_type, status)
-                    VALUES (%s, %s, %s, %s, %s)
-                """, (project_id, name.get(), desc.get("1.0", tk.END).strip(), rtype.get(), status.get()))
-            conn.commit()
-            cur.close()
-            conn.close()
-            self.load_requirements()
-            self.effort_tab.load_requirements()
+                db_executor.submit(db.requirements.insert, project_id, name.get(), desc.get("1.0", tk.END).strip(),
+                                   rtype.get(), status.get(), on_done=saved)
+
+        def saved(row):
+            self.requirement_saved(row, req_id)
+            if self.on_requirements_changed:
+                self.on_requirements_changed()
             win.destroy()
 
         ttk.Button(win, text="Save", command=submit).grid(row=4, column=1, pady=10)
@@ -1547,11 +1188,18 @@ class RequirementsTab:
 
 # === EFFORT TRACKING & MONITORING TAB ===
 
+# Seconds during which deleted effort entries can be restored
+EFFORT_UNDO_SECONDS = 30
+
 
 class EffortTrackingTab:
     def __init__(self, parent):
         self.parent = parent
         self.frame = ttk.Frame(self.parent)
+        self.project_map = {}      # Filled once the project catalog is loaded
+        self.requirement_map = {}  # Filled once the requirements query returns
+        self.undo_rows = []        # Rows of the last deletion, until the undo window closes
+        self._undo_job = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -1591,45 +1239,62 @@ class EffortTrackingTab:
         btn_frame = ttk.Frame(self.frame)
         btn_frame.grid(row=9, column=0, columnspan=2, padx=20, pady=5, sticky="w")
         ttk.Button(btn_frame, text="Save Entry", command=self.save_effort).pack(side="left", padx=5)
-        ttk.Button(btn_frame, text="Delete Selected Entry", command=self.delete_selected_entry).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Batch Entry...", command=self.open_batch_entry).pack(side="left", padx=5)
+        ttk.Button(btn_frame, text="Delete Selected Entries", command=self.delete_selected_entry).pack(side="left", padx=5)
+        self.undo_button = ttk.Button(btn_frame, text="Undo Delete", command=self.undo_delete, state="disabled")
+        self.undo_button.pack(side="left", padx=5)
         ttk.Button(btn_frame, text="View Total Hours", command=self.view_totals).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Hide Total Hours", command=self.hide_totals).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Clear All Entries", command=self.clear_all_entries).pack(side="left", padx=5)
 
-        # Effort entries table 
-        self.tree = ttk.Treeview(self.frame, columns=["Date"] + categories, show='headings')
+        # Effort entries table (pages are read as the user scrolls); Ctrl/Shift-click selects several
+        self.entry_list = VirtualTreeview(self.frame, ["Date"] + categories, lambda row: (row[1:], (str(row[0]),)),
+                                          executor=db_executor, selectmode="extended")
+        self.tree = self.entry_list.tree
         for col in ["Date"] + categories:
             self.tree.heading(col, text=col)
             self.tree.column(col, width=120)
-        self.tree.grid(row=10, column=0, columnspan=2, padx=20, pady=1, sticky="nsew")
+        self.entry_list.grid(row=10, column=0, columnspan=2, padx=20, pady=1, sticky="nsew")
 
         # Allow table to expand with window
         self.frame.grid_rowconfigure(9, weight=1)
         self.frame.grid_columnconfigure(1, weight=1)
 
-        self.load_projects()
+        project_catalog.when_loaded(self.load_projects)
+        project_catalog.subscribe(self.load_projects)
 
-    def load_projects(self):
-        # Fetch all projects and populate the dropdown
-        conn = connect_db()
-        cur = conn.cursor()
-        cur.execute("SELECT id, project_name FROM projects")
-        self.project_map = {name: pid for pid, name in cur.fetchall()}
+    def load_projects(self, catalog=None):
+        # Populate the dropdown from the shared project catalog
+        self.project_map = project_catalog.as_map()
         self.project_combo['values'] = list(self.project_map.keys())
-        cur.close()
-        conn.close()
 
     def load_requirements(self, event=None):
         # Fetch and populate the requirements dropdown for selected project
         self.requirement_combo.set("")
         project_id = self.project_map.get(self.project_combo.get())
-        conn = connect_db()
-        cur = conn.cursor()
-        cur.execute("SELECT id, requirement_name FROM requirements WHERE project_id = %s", (project_id,))
-        self.requirement_map = {name: rid for rid, name in cur.fetchall()}
+        db_executor.submit(db.requirements.names_by_project, project_id,
+                           on_done=self.show_requirements, key="effort.requirements")
+
+    def show_requirements(self, rows):
+        self.requirement_map = {name: rid for rid, name in rows}
         self.requirement_combo['values'] = list(self.requirement_map.keys())
-        cur.close()
-        conn.close()
+
+    def apply_changes(self, changes):
+        # Requirements and entries written by other clients
+        project_id = self.project_map.get(self.project_combo.get())
+        if project_id and select_changes(changes, "requirements", project_id=project_id):
+            # Only the dropdown's choices change; the selected requirement stays
+            db_executor.submit(db.requirements.names_by_project, project_id,
+                               on_done=self.show_requirements, key="effort.requirements")
+
+        req_id = self.requirement_map.get(self.requirement_combo.get())
+        changes = select_changes(changes, "effort_tracking", requirement_id=req_id) if req_id else []
+        if not changes:
+            return
+        # Entries are listed by date, so new ones cannot simply be appended
+        patch_rows([self.entry_list], changes, db.effort.by_ids, db_executor, append=False)
+        if self.entry_list.extra_rows:
+            db_executor.submit(db.effort.totals, req_id, on_done=self.show_totals, key="effort.totals")
 
     def save_effort(self):
         # Validate and save a new effort entry
@@ -1649,30 +1314,16 @@ class EffortTrackingTab:
             return
 
         try:
-            # Check if entry already exists for this requirement and date
-            conn = connect_db()
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT COUNT(*) FROM effort_tracking
-                WHERE requirement_id = %s AND date = %s
-            """, (req_id, date))
-            exists = cur.fetchone()[0] > 0
-            if exists:
-                messagebox.showwarning("Duplicate Entry", "An entry for this date already exists for the selected requirement.")
-                cur.close()
-                conn.close()
-                return
-
-            # Prepare and insert the data
             values = tuple(float(self.entries[cat].get()) for cat in self.entries)
+        except ValueError:
+            messagebox.showerror("Invalid Input", "All hour fields must be numeric.")
+            return
 
-            cur.execute("""
-                INSERT INTO effort_tracking (requirement_id, date, requirements_analysis, designing, coding, testing, project_management)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """, (req_id, date, *values))
-            conn.commit()
-            cur.close()
-            conn.close()
+        def saved(inserted):
+            # insert() returns None when the day already has an entry (ON CONFLICT DO NOTHING)
+            if not inserted:
+                messagebox.showwarning("Duplicate Entry", "An entry for this date already exists for the selected requirement.")
+                return
 
             messagebox.showinfo("Saved", "Effort saved successfully.")
 
@@ -1681,12 +1332,40 @@ class EffortTrackingTab:
                 entry.delete(0, tk.END)
 
             # Show newly saved entry
-            self.tree.insert('', 'end', values=(date, *values))
+            self.entry_list.refresh()
 
-        except ValueError:
-            messagebox.showerror("Invalid Input", "All hour fields must be numeric.")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        db_executor.submit(db.effort.insert, req_id, date, values, on_done=saved,
+                           on_error=lambda e: messagebox.showerror("Error", str(e)))
+
+    def open_batch_entry(self):
+        # Grid entry for many requirements and days at once
+        if not self.requirement_map:
+            messagebox.showwarning("Select Project", "Please select a project with requirements.")
+            return
+        EffortBatchDialog(self.frame, dict(self.requirement_map), self.save_batch)
+
+    def save_batch(self, dialog, rows, replace):
+        # The whole grid goes in one transaction; days already entered are skipped or replaced
+        def saved(counts):
+            inserted, replaced, skipped = counts
+            dialog.close()
+            message = f"{inserted} entries added"
+            if replaced:
+                message += f", {replaced} replaced"
+            if skipped:
+                message += f", {skipped} skipped (already entered)"
+            messagebox.showinfo("Saved", message + ".")
+
+            # This list and the dashboard re-read the requirements' effort
+            change_listener.publish([Change("effort_tracking", "bulk", requirement_id=req_id)
+                                     for req_id in sorted({row[0] for row in rows})])
+
+        def failed(e):
+            dialog.set_busy(False)
+            messagebox.showerror("Error", f"Failed to save effort entries: {e}")
+
+        dialog.set_busy(True)
+        db_executor.submit(db.effort.save_batch, rows, replace, on_done=saved, on_error=failed)
 
     def view_totals(self):
         # Get current project ID
@@ -1696,88 +1375,77 @@ class EffortTrackingTab:
             return
 
         # Fetch summed totals per requirement
-        conn = connect_db()
-        cur = conn.cursor()
         req_id = self.requirement_map.get(self.requirement_combo.get())
-        cur.execute("""
-            SELECT 
-                SUM(requirements_analysis), 
-                SUM(designing), 
-                SUM(coding), 
-                SUM(testing), 
-                SUM(project_management)
-            FROM effort_tracking
-            WHERE requirement_id = %s
-        """, (req_id,))
-        row = cur.fetchone()
-        total_row = cur.fetchone()
-        cur.close()
-        conn.close()
-
-        # Insert totals row at the end of the Treeview
-        self.tree.insert('', 'end', values=("Total", *row), tags=("total",))
+        db_executor.submit(db.effort.totals, req_id, on_done=self.show_totals, key="effort.totals")
+
+    def show_totals(self, row):
+        # Show the totals row after the last entry
+        self.entry_list.set_extra_rows([(("Total", *row), ("total",))])
 
     def load_effort_entries(self):
-        # Load all saved entries for the selected requirement
-        self.tree.delete(*self.tree.get_children())
+        # Load the saved entries for the selected requirement
         req_id = self.requirement_map.get(self.requirement_combo.get())
-        if not req_id:
-            return
-
-        conn = connect_db()
-        cur = conn.cursor()
-        cur.execute("""
-            SELECT date, requirements_analysis, designing, coding, testing, project_management
-            FROM effort_tracking
-            WHERE requirement_id = %s
-            ORDER BY date
-        """, (req_id,))
-        for row in cur.fetchall():
-            self.tree.insert('', 'end', values=row)
-        cur.close()
-        conn.close()
+        self.entry_list.set_source(db.effort.paged_by_requirement(req_id) if req_id else None)
 
     def hide_totals(self):
         # Remove the totals row if displayed
-        for item in self.tree.get_children():
-            if "total" in self.tree.item(item, "tags"):
-                self.tree.delete(item)
+        self.entry_list.set_extra_rows([])
 
     def delete_selected_entry(self):
-        # Delete a specific effort entry based on selection
-        selected = self.tree.focus()
-        if not selected:
-            messagebox.showwarning("Select Entry", "Please select a row to delete.")
+        # Delete every selected effort entry (by id, in one statement)
+        entry_ids = self.entry_list.selected_keys()
+        if not entry_ids:
+            if self.entry_list.focus_extra():
+                messagebox.showinfo("Info", "Totals row cannot be deleted.")
+            else:
+                messagebox.showwarning("Select Entry", "Please select a row to delete.")
             return
 
-        values = self.tree.item(selected, 'values')
-        if values[0] == "Total":
-            messagebox.showinfo("Info", "Totals row cannot be deleted.")
+        count = len(entry_ids)
+        if not messagebox.askyesno("Confirm", f"Delete {count} selected {'entry' if count == 1 else 'entries'}?"):
             return
 
-        confirm = messagebox.askyesno("Confirm", "Delete selected entry?")
-        if not confirm:
-            return
+        db_executor.submit(db.effort.delete_many, entry_ids, on_done=self.entries_deleted,
+                           on_error=lambda e: messagebox.showerror("Error", str(e)))
 
-        # Identify and delete from DB
-        date = values[0]
-        req_id = self.requirement_map.get(self.requirement_combo.get())
-        if not req_id:
+    def entries_deleted(self, rows):
+        # Drop the rows in place; re-read only if some were not on a loaded page
+        removed = [self.entry_list.remove_row(row[0]) for row in rows]
+        if not all(removed):
+            self.entry_list.refresh()
+        self.keep_for_undo(rows)
+
+    def keep_for_undo(self, rows):
+        """Hold deleted rows in memory for EFFORT_UNDO_SECONDS so the deletion can be undone"""
+        self.drop_undo()
+        if not rows:
             return
+        self.undo_rows = rows
+        self.undo_button.config(state="normal", text=f"Undo Delete ({len(rows)})")
+        self._undo_job = self.frame.after(EFFORT_UNDO_SECONDS * 1000, self.drop_undo)
+
+    def drop_undo(self):
+        if self._undo_job is not None:
+            self.frame.after_cancel(self._undo_job)
+            self._undo_job = None
+        self.undo_rows = []
+        self.undo_button.config(state="disabled", text="Undo Delete")
+
+    def undo_delete(self):
+        # Put the last deleted entries back with their original ids
+        rows = self.undo_rows
+        if not rows:
+            return
+        self.drop_undo()
 
-        # Remove from database  
-        conn = connect_db()
-        cur = conn.cursor()
-        cur.execute("""
-            DELETE FROM effort_tracking 
-            WHERE requirement_id = %s AND date = %s
-        """, (req_id, date))
-        conn.commit()
-        cur.close()
-        conn.close()
+        def restored(count):
+            self.entry_list.refresh()
+            if count < len(rows):
+                messagebox.showinfo("Undo", f"{count} of {len(rows)} entries restored; "
+                                            "the other days have been entered again since.")
 
-        # Remove from treeview
-        self.tree.delete(selected)
+        db_executor.submit(db.effort.restore, rows, on_done=restored,
+                           on_error=lambda e: messagebox.showerror("Error", f"Failed to restore entries: {e}"))
 
     def clear_all_entries(self):
         # Clear all entries for the selected requirement after confirmation
@@ -1790,16 +1458,85 @@ class EffortTrackingTab:
         if not messagebox.askyesno("Confirm", f"Delete all effort entries for '{req_name}'?"):
             return
 
+        def cleared(rows):
+            # This list and the dashboard re-read the requirement's effort
+            change_listener.publish([Change("effort_tracking", "bulk", requirement_id=req_id)])
+            self.keep_for_undo(rows)
+            messagebox.showinfo("Cleared", "All entries have been deleted. "
+                                           f"Use Undo Delete within {EFFORT_UNDO_SECONDS} seconds to restore them.")
+
         # Delete from database
-        conn = connect_db()
-        cur = conn.cursor()
-        cur.execute("DELETE FROM effort_tracking WHERE requirement_id = %s", (req_id,))
-        conn.commit()
-        cur.close()
-        conn.close()
+        db_executor.submit(db.effort.delete_for_requirement, req_id, on_done=cleared)
 
-        self.load_effort_entries()
-        messagebox.showinfo("Cleared", "All entries have been deleted.")
+
+# === DASHBOARD TAB ===
+
+class EffortDashboardTab:
+    """Project-wide effort charts, computed from the effort rollup tables"""
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.frame = ttk.Frame(self.parent)
+        self.project_map = {}  # Filled once the project catalog is loaded
+        self.setup_ui()
+
+    def setup_ui(self):
+        # Title
+        title_label = ttk.Label(self.frame, text="Effort Dashboard", font=("Arial", 12, "bold"))
+        title_label.pack(padx=20, pady=(20, 10), anchor="w")
+
+        if not NUMPY_AVAILABLE:
+            ttk.Label(self.frame, text="The dashboard requires the NumPy library.\n\n"
+                                       "To install it, run: pip install numpy").pack(padx=20, pady=10, anchor="w")
+            return
+
+        # Project selection and summary
+        top_frame = ttk.Frame(self.frame)
+        top_frame.pack(fill=tk.X, padx=20)
+        ttk.Label(top_frame, text="Select Project:").pack(side="left")
+        self.project_combo = ttk.Combobox(top_frame, width=40, state="readonly")
+        self.project_combo.pack(side="left", padx=10)
+        self.project_combo.bind("<<ComboboxSelected>>", self.load_dashboard)
+        ttk.Button(top_frame, text="Refresh", command=self.load_dashboard).pack(side="left", padx=5)
+        self.summary_label = ttk.Label(top_frame, text="")
+        self.summary_label.pack(side="left", padx=20)
+
+        # Charts
+        canvas = tk.Canvas(self.frame, background="white", highlightthickness=0)
+        canvas.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
+        self.charts = EffortCharts(canvas)
+
+        project_catalog.when_loaded(self.load_projects)
+        project_catalog.subscribe(self.load_projects)
+
+    def load_projects(self, catalog=None):
+        # Populate the dropdown from the shared project catalog
+        self.project_map = project_catalog.as_map()
+        self.project_combo['values'] = list(self.project_map.keys())
+
+    def load_dashboard(self, event=None):
+        """Read and aggregate the selected project's effort on a worker"""
+        if not NUMPY_AVAILABLE:
+            return
+        project_id = self.project_map.get(self.project_combo.get())
+        if not project_id:
+            return
+        db_executor.submit(load_stats, db, project_id, on_done=self.show_stats, key="dashboard.stats")
+
+    def apply_changes(self, changes):
+        # Effort rows only name their requirement, so any change re-reads the dashboard while it is shown
+        # (it is read again on every visit anyway)
+        if self.frame.winfo_ismapped() and any(change.table in ("effort_tracking", "requirements")
+                                               for change in changes):
+            self.load_dashboard()
+
+    def show_stats(self, stats):
+        if stats.empty:
+            self.summary_label.config(text="")
+        else:
+            self.summary_label.config(text=f"{stats.total_hours:,.1f} hours in {stats.entries:,} entries, "
+                                           f"{len(stats.weeks)} weeks, {len(stats.requirements)} requirements")
+        self.charts.show(stats)
 
 
 # === EXPORTS TAB ===
@@ -1848,6 +1585,8 @@ class ExportsTab:
         eff_btn_frame.pack(padx=10, pady=10)
         ttk.Button(eff_btn_frame, text="CSV", command=self.export_effort_csv).pack(side="left", padx=5)
         ttk.Button(eff_btn_frame, text="PDF", command=self.export_effort_pdf).pack(side="left", padx=5)
+        ttk.Button(eff_btn_frame, text="Weekly CSV", command=self.export_effort_weekly_csv).pack(side="left", padx=5)
+        ttk.Button(eff_btn_frame, text="Weekly PDF", command=self.export_effort_weekly_pdf).pack(side="left", padx=5)
         
         # Export Risks section
         risks_frame = ttk.LabelFrame(self.frame, text="Risks")
@@ -1869,9 +1608,19 @@ class ExportsTab:
         ttk.Button(all_btn_frame, text="CSV", command=self.export_all_csv).pack(side="left", padx=5)
         ttk.Button(all_btn_frame, text="PDF", command=self.export_all_pdf).pack(side="left", padx=5)
         
+        # Import section (reads the files "Export All" CSV writes)
+        import_frame = ttk.LabelFrame(self.frame, text="Import")
+        import_frame.grid(row=5, column=0, columnspan=2, padx=20, pady=10, sticky="nsew")
+        
+        ttk.Label(import_frame, text="Load a folder of exported CSV files (existing rows with the same name are updated)").pack(padx=10, pady=5, anchor="w")
+        import_btn_frame = ttk.Frame(import_frame)
+        import_btn_frame.pack(padx=10, pady=10)
+        ttk.Button(import_btn_frame, text="Validate Only", command=lambda: self.import_csv_folder(dry_run=True)).pack(side="left", padx=5)
+        ttk.Button(import_btn_frame, text="Import", command=self.import_csv_folder).pack(side="left", padx=5)
+        
         # Status section
         status_frame = ttk.LabelFrame(self.frame, text="Export Status")
-        status_frame.grid(row=5, column=0, columnspan=2, padx=20, pady=10, sticky="ew")
+        status_frame.grid(row=6, column=0, columnspan=2, padx=20, pady=10, sticky="ew")
         
         self.status_var = tk.StringVar()
         self.status_var.set("Ready to export")
@@ -1882,6 +1631,58 @@ class ExportsTab:
         self.frame.columnconfigure(0, weight=1)
         self.frame.columnconfigure(1, weight=1)
     
+    def progress_callback(self, label):
+        """Progress function for export_csv; safe to call from a worker thread"""
+        def progress(rows, total):
+            if total:
+                text = f"{label}: {rows:,} of ~{total:,} rows ({min(rows / total, 1):.0%})"
+            else:
+                text = f"{label}: {rows:,} rows"
+            db_executor.call_soon(self.status_var.set, text)
+        return progress
+
+    def import_csv_folder(self, dry_run=False):
+        """Import (or only validate) a folder of CSV exports in the background"""
+        directory = filedialog.askdirectory(title="Select Folder with CSV Exports")
+        if not directory:
+            return
+
+        def progress(name, rows):
+            db_executor.call_soon(self.status_var.set, f"{'Validating' if dry_run else 'Importing'} {name}: {rows:,} rows")
+
+        def done(results):
+            failed = any(result.error_count for result in results)
+            if not results:
+                self.status_var.set(f"No export files found in {directory}")
+            elif failed:
+                self.status_var.set("Import failed validation; nothing was imported")
+            else:
+                self.status_var.set("Validation passed" if dry_run else f"Data imported from {directory}")
+                if not dry_run:
+                    # Open lists of the imported tables re-read (the project catalog was already told)
+                    change_listener.publish([Change(CSV_IMPORTS[result.name].table, "bulk")
+                                             for result in results if result.name != "projects"])
+            self.show_import_report(format_report(results, dry_run), dry_run)
+
+        def failed(e):
+            self.status_var.set(f"Error importing data: {e}")
+            messagebox.showerror("Error", f"Failed to import data: {e}")
+
+        self.status_var.set("Validating..." if dry_run else "Importing...")
+        db_executor.submit(import_folder, db, directory, dry_run, progress, on_done=done, on_error=failed)
+
+    def show_import_report(self, report, dry_run):
+        """Window with the per-file import summary and any invalid rows"""
+        win = tk.Toplevel(self.frame)
+        win.title("Validation Report" if dry_run else "Import Report")
+        text = tk.Text(win, width=90, height=25, wrap="none")
+        scrollbar = ttk.Scrollbar(win, orient="vertical", command=text.yview)
+        text.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        text.pack(fill=tk.BOTH, expand=True)
+        text.insert("1.0", report)
+        text.config(state="disabled")
+
     def check_reportlab(self):
         """Check if ReportLab is available, show message if not"""
         if not REPORTLAB_AVAILABLE:
@@ -1907,73 +1708,20 @@ class ExportsTab:
         if not file_path:
             return
             
-        try:
-            # Get project data
-            conn = connect_db()
-            cur = conn.cursor()
-            cur.execute("SELECT project_name, owner, project_description, project_scope, target_users, technology_stack, platform FROM projects ORDER BY project_name")
-            projects = cur.fetchall()
-            cur.close()
-            conn.close()
-            
-            # Create PDF
-            doc = SimpleDocTemplate(file_path, pagesize=letter)
-            styles = getSampleStyleSheet()
-            elements = []
-            
-            # Add title
-            title = Paragraph("Project Management System - Projects Report", styles['Title'])
-            elements.append(title)
-            elements.append(Spacer(1, 20))
-            
-            # Add date
-            date_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            date_paragraph = Paragraph(f"Generated on: {date_str}", styles['Normal'])
-            elements.append(date_paragraph)
-            elements.append(Spacer(1, 20))
-            
-            # Create table data
-            table_data = [["Project Name", "Owner", "Description", "Scope", "Target Users", "Tech Stack", "Platform"]]
-            for project in projects:
-                # Truncate long fields
-                desc = project[2][:100] + "..." if len(project[2]) > 100 else project[2]
-                scope = project[3][:100] + "..." if len(project[3]) > 100 else project[3]
-                
-                table_data.append([
-                    project[0],  # project_name
-                    project[1],  # owner
-                    desc,        # description (truncated)
-                    scope,       # scope (truncated)
-                    project[4],  # target_users
-                    project[5],  # tech_stack
-                    project[6]   # platform
-                ])
-            
-            # Create the table
-            table = Table(table_data, repeatRows=1)
-            
-            # Add style to the table
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            
-            elements.append(table)
-            
-            # Build PDF
-            doc.build(elements)
-            
+        def write():
+            export_pdf(db, PDF_REPORTS["projects"], file_path)
+
+        def done(result):
             self.status_var.set(f"Projects exported successfully to {os.path.basename(file_path)}")
             messagebox.showinfo("Success", "Projects exported successfully to PDF!")
-        except Exception as e:
+
+        def failed(e):
             self.status_var.set(f"Error exporting projects to PDF: {e}")
             messagebox.showerror("Error", f"Failed to export projects to PDF: {e}")
+
+        # Query and file writing run on a worker; the messages come back on the Tk thread
+        self.status_var.set("Exporting...")
+        db_executor.submit(write, on_done=done, on_error=failed)
     
     def export_requirements_pdf(self):
         """Export requirements to PDF format"""
@@ -1989,75 +1737,20 @@ class ExportsTab:
         if not file_path:
             return
             
-        try:
-            # Get requirements data
-            conn = connect_db()
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT p.project_name, r.requirement_name, r.requirement_type, r.status, r.description
-                FROM requirements r
-                JOIN projects p ON r.project_id = p.id
-                ORDER BY p.project_name, r.requirement_name
-            """)
-            requirements = cur.fetchall()
-            cur.close()
-            conn.close()
-            
-            # Create PDF
-            doc = SimpleDocTemplate(file_path, pagesize=letter)
-            styles = getSampleStyleSheet()
-            elements = []
-            
-            # Add title
-            title = Paragraph("Project Management System - Requirements Report", styles['Title'])
-            elements.append(title)
-            elements.append(Spacer(1, 20))
-            
-            # Add date
-            date_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            date_paragraph = Paragraph(f"Generated on: {date_str}", styles['Normal'])
-            elements.append(date_paragraph)
-            elements.append(Spacer(1, 20))
-            
-            # Create table data
-            table_data = [["Project", "Requirement Name", "Type", "Status", "Description"]]
-            for req in requirements:
-                # Truncate description
-                desc = req[4][:100] + "..." if len(req[4]) > 100 else req[4]
-                
-                table_data.append([
-                    req[0],  # project_name
-                    req[1],  # requirement_name
-                    req[2],  # requirement_type
-                    req[3],  # status
-                    desc     # description (truncated)
-                ])
-            
-            # Create the table
-            table = Table(table_data, repeatRows=1)
-            
-            # Add style to the table
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            
-            elements.append(table)
-            
-            # Build PDF
-            doc.build(elements)
-            
+        def write():
+            export_pdf(db, PDF_REPORTS["requirements"], file_path)
+
+        def done(result):
             self.status_var.set(f"Requirements exported successfully to {os.path.basename(file_path)}")
             messagebox.showinfo("Success", "Requirements exported successfully to PDF!")
-        except Exception as e:
+
+        def failed(e):
             self.status_var.set(f"Error exporting requirements to PDF: {e}")
             messagebox.showerror("Error", f"Failed to export requirements to PDF: {e}")
+
+        # Query and file writing run on a worker; the messages come back on the Tk thread
+        self.status_var.set("Exporting...")
+        db_executor.submit(write, on_done=done, on_error=failed)
     
     def export_effort_pdf(self):
         """Export effort tracking data to PDF format"""
@@ -2073,78 +1766,48 @@ class ExportsTab:
         if not file_path:
             return
             
-        try:
-            # Get effort tracking data
-            conn = connect_db()
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT p.project_name, r.requirement_name, e.date, 
-                       e.requirements_analysis, e.designing, e.coding, 
-                       e.testing, e.project_management
-                FROM effort_tracking e
-                JOIN requirements r ON e.requirement_id = r.id
-                JOIN projects p ON r.project_id = p.id
-                ORDER BY p.project_name, r.requirement_name, e.date
-            """)
-            effort = cur.fetchall()
-            cur.close()
-            conn.close()
-            
-            # Create PDF
-            doc = SimpleDocTemplate(file_path, pagesize=letter)
-            styles = getSampleStyleSheet()
-            elements = []
-            
-            # Add title
-            title = Paragraph("Project Management System - Effort Tracking Report", styles['Title'])
-            elements.append(title)
-            elements.append(Spacer(1, 20))
-            
-            # Add date
-            date_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            date_paragraph = Paragraph(f"Generated on: {date_str}", styles['Normal'])
-            elements.append(date_paragraph)
-            elements.append(Spacer(1, 20))
-            
-            # Create table data
-            table_data = [["Project", "Requirement", "Date", "Req. Analysis", "Design", "Coding", "Testing", "PM"]]
-            for entry in effort:
-                table_data.append([
-                    entry[0],  # project_name
-                    entry[1],  # requirement_name
-                    entry[2],  # date
-                    entry[3],  # requirements_analysis
-                    entry[4],  # designing
-                    entry[5],  # coding
-                    entry[6],  # testing
-                    entry[7]   # project_management
-                ])
-            
-            # Create the table
-            table = Table(table_data, repeatRows=1)
-            
-            # Add style to the table
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            
-            elements.append(table)
-            
-            # Build PDF
-            doc.build(elements)
-            
+        def write():
+            export_pdf(db, PDF_REPORTS["effort"], file_path)
+
+        def done(result):
             self.status_var.set(f"Effort tracking data exported successfully to {os.path.basename(file_path)}")
             messagebox.showinfo("Success", "Effort tracking data exported successfully to PDF!")
-        except Exception as e:
+
+        def failed(e):
             self.status_var.set(f"Error exporting effort tracking data to PDF: {e}")
             messagebox.showerror("Error", f"Failed to export effort tracking data to PDF: {e}")
+
+        # Query and file writing run on a worker; the messages come back on the Tk thread
+        self.status_var.set("Exporting...")
+        db_executor.submit(write, on_done=done, on_error=failed)
+    
+    def export_effort_weekly_pdf(self):
+        """Export hours per project and week (from the effort rollup) to PDF format"""
+        if not self.check_reportlab():
+            return
+            
+        # Get file path from user
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".pdf",
+            filetypes=[("PDF files", "*.pdf")],
+            title="Export Weekly Effort Summary to PDF"
+        )
+        if not file_path:
+            return
+            
+        def write():
+            export_pdf(db, PDF_REPORTS["effort_weekly"], file_path)
+
+        def done(result):
+            self.status_var.set(f"Weekly effort summary exported successfully to {os.path.basename(file_path)}")
+            messagebox.showinfo("Success", "Weekly effort summary exported successfully to PDF!")
+
+        def failed(e):
+            self.status_var.set(f"Error exporting weekly effort summary to PDF: {e}")
+            messagebox.showerror("Error", f"Failed to export weekly effort summary to PDF: {e}")
+
+        self.status_var.set("Exporting...")
+        db_executor.submit(write, on_done=done, on_error=failed)
     
     def export_risks_csv(self):
         # Get file path from user
@@ -2156,31 +1819,21 @@ class ExportsTab:
         if not file_path:
             return
             
-        try:
-            # Get risks data
-            conn = connect_db()
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT p.project_name, r.name, r.description, r.risk_status
-                FROM risks r
-                JOIN projects p ON r.project_id = p.id
-                ORDER BY p.project_name, r.name
-            """)
-            risks = cur.fetchall()
-            cur.close()
-            conn.close()
-            
-            # Write to CSV
-            with open(file_path, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(["Project", "Risk Name", "Description", "Status"])
-                writer.writerows(risks)
-                
+        def write():
+            # Stream rows straight from the database into the file
+            export_csv(db, CSV_EXPORTS["risks"], file_path, self.progress_callback("Exporting risks"))
+
+        def done(result):
             self.status_var.set(f"Risks exported successfully to {os.path.basename(file_path)}")
             messagebox.showinfo("Success", "Risks exported successfully!")
-        except Exception as e:
+
+        def failed(e):
             self.status_var.set(f"Error exporting risks: {e}")
             messagebox.showerror("Error", f"Failed to export risks: {e}")
+
+        # Query and file writing run on a worker; the messages come back on the Tk thread
+        self.status_var.set("Exporting...")
+        db_executor.submit(write, on_done=done, on_error=failed)
     
     def export_risks_pdf(self):
         """Export risks to PDF format"""
@@ -2196,74 +1849,20 @@ class ExportsTab:
         if not file_path:
             return
             
-        try:
-            # Get risks data
-            conn = connect_db()
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT p.project_name, r.name, r.description, r.risk_status
-                FROM risks r
-                JOIN projects p ON r.project_id = p.id
-                ORDER BY p.project_name, r.name
-            """)
-            risks = cur.fetchall()
-            cur.close()
-            conn.close()
-            
-            # Create PDF
-            doc = SimpleDocTemplate(file_path, pagesize=letter)
-            styles = getSampleStyleSheet()
-            elements = []
-            
-            # Add title
-            title = Paragraph("Project Management System - Risk Management Report", styles['Title'])
-            elements.append(title)
-            elements.append(Spacer(1, 20))
-            
-            # Add date
-            date_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            date_paragraph = Paragraph(f"Generated on: {date_str}", styles['Normal'])
-            elements.append(date_paragraph)
-            elements.append(Spacer(1, 20))
-            
-            # Create table data
-            table_data = [["Project", "Risk", "Description", "Status"]]
-            for risk in risks:
-                # Truncate description
-                desc = risk[2][:100] + "..." if len(risk[2]) > 100 else risk[2]
-                
-                table_data.append([
-                    risk[0],  # project_name
-                    risk[1],  # name
-                    desc,     # description (truncated)
-                    risk[3]   # status
-                ])
-            
-            # Create the table
-            table = Table(table_data, repeatRows=1)
-            
-            # Add style to the table
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            
-            elements.append(table)
-            
-            # Build PDF
-            doc.build(elements)
-            
+        def write():
+            export_pdf(db, PDF_REPORTS["risks"], file_path)
+
+        def done(result):
             self.status_var.set(f"Risks exported successfully to {os.path.basename(file_path)}")
             messagebox.showinfo("Success", "Risks exported successfully to PDF!")
-        except Exception as e:
+
+        def failed(e):
             self.status_var.set(f"Error exporting risks to PDF: {e}")
             messagebox.showerror("Error", f"Failed to export risks to PDF: {e}")
+
+        # Query and file writing run on a worker; the messages come back on the Tk thread
+        self.status_var.set("Exporting...")
+        db_executor.submit(write, on_done=done, on_error=failed)
     
     def export_all_pdf(self):
         """Export all data to PDF format"""
@@ -2274,167 +1873,43 @@ class ExportsTab:
         directory = filedialog.askdirectory(title="Select Export Directory")
         if not directory:
             return
-            
-        success_count = 0
-        try:
-            # Connect to database
-            conn = connect_db()
-            cur = conn.cursor()
-            
-            # Export projects
-            projects_file = os.path.join(directory, "projects_export.pdf")
-            try:
-                # Get project data
-                cur.execute("SELECT project_name, owner, project_description, project_scope, target_users, technology_stack, platform FROM projects ORDER BY project_name")
-                projects = cur.fetchall()
-                
-                # Create PDF
-                doc = SimpleDocTemplate(projects_file, pagesize=letter)
-                styles = getSampleStyleSheet()
-                elements = []
-                
-                # Add title
-                title = Paragraph("Project Management System - Projects Report", styles['Title'])
-                elements.append(title)
-                elements.append(Spacer(1, 20))
-                
-                # Add date
-                date_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                date_paragraph = Paragraph(f"Generated on: {date_str}", styles['Normal'])
-                elements.append(date_paragraph)
-                elements.append(Spacer(1, 20))
-                
-                # Create table data
-                table_data = [["Project Name", "Owner", "Description", "Scope", "Target Users", "Tech Stack", "Platform"]]
-                for project in projects:
-                    # Truncate description and scope
-                    desc = project[2][:100] + "..." if len(project[2]) > 100 else project[2]
-                    scope = project[3][:100] + "..." if len(project[3]) > 100 else project[3]
-                    
-                    table_data.append([
-                        project[0],  # project_name
-                        project[1],  # owner
-                        desc,        # description (truncated)
-                        scope,       # scope (truncated)
-                        project[4],  # target_users
-                        project[5],  # tech_stack
-                        project[6]   # platform
-                    ])
-                
-                # Create the table
-                table = Table(table_data, repeatRows=1)
-                
-                # Add style to the table
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 12),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
-                
-                elements.append(table)
-                
-                # Build PDF
-                doc.build(elements)
-                success_count += 1
-            except Exception as e:
-                messagebox.showwarning("Warning", f"Failed to export projects to PDF: {e}")
-            
-            # Export requirements
-            requirements_file = os.path.join(directory, "requirements_export.pdf")
-            try:
-                # Get requirements data
-                cur.execute("""
-                    SELECT p.project_name, r.requirement_name, r.requirement_type, r.status, r.description
-                    FROM requirements r
-                    JOIN projects p ON r.project_id = p.id
-                    ORDER BY p.project_name, r.requirement_name
-                """)
-                requirements = cur.fetchall()
-                
-                # Create PDF
-                doc = SimpleDocTemplate(requirements_file, pagesize=letter)
-                styles = getSampleStyleSheet()
-                elements = []
-                
-                # Add title
-                title = Paragraph("Project Management System - Requirements Report", styles['Title'])
-                elements.append(title)
-                elements.append(Spacer(1, 20))
-                
-                # Add date
-                date_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                date_paragraph = Paragraph(f"Generated on: {date_str}", styles['Normal'])
-                elements.append(date_paragraph)
-                elements.append(Spacer(1, 20))
-                
-                # Create table data
-                table_data = [["Project", "Requirement Name", "Type", "Status", "Description"]]
-                for req in requirements:
-                    # Truncate description
-                    desc = req[4][:100] + "..." if len(req[4]) > 100 else req[4]
-                    
-                    table_data.append([
-                        req[0],  # project_name
-                        req[1],  # requirement_name
-                        req[2],  # requirement_type
-                        req[3],  # status
-                        desc     # description (truncated)
-                    ])
-                
-                # Create the table
-                table = Table(table_data, repeatRows=1)
-                
-                # Add style to the table
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 12),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
-                
-                elements.append(table)
-                
-                # Build PDF
-                doc.build(elements)
-                success_count += 1
-            except Exception as e:
-                messagebox.showwarning("Warning", f"Failed to export requirements to PDF: {e}")
-            
-            # Export effort tracking
-            effort_file = os.path.join(directory, "effort_export.pdf")
-            cur.execute("""
-                SELECT p.project_name, r.requirement_name, e.date, 
-                       e.requirements_analysis, e.designing, e.coding, 
-                       e.testing, e.project_management
-                FROM effort_tracking e
-                JOIN requirements r ON e.requirement_id = r.id
-                JOIN projects p ON r.project_id = p.id
-                ORDER BY p.project_name, r.requirement_name, e.date
-            """)
-            effort = cur.fetchall()
-            with open(effort_file, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(["Project", "Requirement", "Date", "Requirements Analysis", 
-                                "Designing", "Coding", "Testing", "Project Management"])
-                writer.writerows(effort)
-                
-            cur.close()
-            conn.close()
-            
-            self.status_var.set(f"All data exported successfully to {directory}")
-            messagebox.showinfo("Success", f"All data exported successfully to {directory}!")
-        except Exception as e:
+
+        self.run_export_all("pdf", PDF_REPORTS, directory)
+
+    def run_export_all(self, fmt, reports, directory):
+        """Produce every report in parallel worker processes, with a progress dialog"""
+        # Imported on first use: multiprocessing is not needed to start the application
+        from src.utils.parallel_export import ExportJob, export_all
+
+        jobs = [ExportJob(fmt, name, os.path.join(directory, report.filename)) for name, report in reports.items()]
+        dialog = ProgressDialog(self.frame, f"Exporting all data ({fmt.upper()})", len(jobs))
+
+        def progress(job, rows, error, finished, total):
+            # Called on the executor thread as each worker process finishes
+            if error is None:
+                line = f"{os.path.basename(job.path)}: {rows:,} rows"
+            else:
+                line = f"{os.path.basename(job.path)}: FAILED - {error}"
+            db_executor.call_soon(dialog.update, finished, f"{finished} of {total} files done", line)
+
+        def done(results):
+            failed = [job for job, result in results.items() if isinstance(result, Exception)]
+            if not failed:
+                dialog.finish("Done")
+                self.status_var.set(f"All data exported successfully to {directory}")
+                messagebox.showinfo("Success", f"All data exported successfully to {directory}!")
+            else:
+                dialog.finish(f"{len(failed)} of {len(jobs)} files failed")
+                self.status_var.set(f"Error exporting data to {directory}")
+                messagebox.showerror("Error", f"Failed to export all data ({len(jobs) - len(failed)} files were exported successfully)")
+
+        def error(e):
+            dialog.finish("Export failed")
             self.status_var.set(f"Error exporting data: {e}")
-            messagebox.showerror("Error", f"Failed to export all data: {e} ({success_count} files were exported successfully)")
+            messagebox.showerror("Error", f"Failed to export all data: {e}")
+
+        self.status_var.set("Exporting...")
+        db_executor.submit(export_all, jobs, get_pool().connect_kwargs, progress, on_done=done, on_error=error)
     
     # Original CSV export methods
     def export_projects_csv(self):
@@ -2447,26 +1922,21 @@ class ExportsTab:
         if not file_path:
             return
             
-        try:
-            # Get project data
-            conn = connect_db()
-            cur = conn.cursor()
-            cur.execute("SELECT project_name, owner, project_description, project_scope, target_users, technology_stack, platform FROM projects ORDER BY project_name")
-            projects = cur.fetchall()
-            cur.close()
-            conn.close()
-            
-            # Write to CSV
-            with open(file_path, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(["Project Name", "Owner", "Description", "Scope", "Target Users", "Technology Stack", "Platform"])
-                writer.writerows(projects)
-                
+        def write():
+            # Stream rows straight from the database into the file
+            export_csv(db, CSV_EXPORTS["projects"], file_path, self.progress_callback("Exporting projects"))
+
+        def done(result):
             self.status_var.set(f"Projects exported successfully to {os.path.basename(file_path)}")
             messagebox.showinfo("Success", "Projects exported successfully!")
-        except Exception as e:
+
+        def failed(e):
             self.status_var.set(f"Error exporting projects: {e}")
             messagebox.showerror("Error", f"Failed to export projects: {e}")
+
+        # Query and file writing run on a worker; the messages come back on the Tk thread
+        self.status_var.set("Exporting...")
+        db_executor.submit(write, on_done=done, on_error=failed)
             
     def export_requirements_csv(self):
         # Get file path from user
@@ -2478,31 +1948,21 @@ class ExportsTab:
         if not file_path:
             return
             
-        try:
-            # Get requirements data
-            conn = connect_db()
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT p.project_name, r.requirement_name, r.requirement_type, r.status, r.description
-                FROM requirements r
-                JOIN projects p ON r.project_id = p.id
-                ORDER BY p.project_name, r.requirement_name
-            """)
-            requirements = cur.fetchall()
-            cur.close()
-            conn.close()
-            
-            # Write to CSV
-            with open(file_path, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(["Project", "Requirement Name", "Type", "Status", "Description"])
-                writer.writerows(requirements)
-                
+        def write():
+            # Stream rows straight from the database into the file
+            export_csv(db, CSV_EXPORTS["requirements"], file_path, self.progress_callback("Exporting requirements"))
+
+        def done(result):
             self.status_var.set(f"Requirements exported successfully to {os.path.basename(file_path)}")
             messagebox.showinfo("Success", "Requirements exported successfully!")
-        except Exception as e:
+
+        def failed(e):
             self.status_var.set(f"Error exporting requirements: {e}")
             messagebox.showerror("Error", f"Failed to export requirements: {e}")
+
+        # Query and file writing run on a worker; the messages come back on the Tk thread
+        self.status_var.set("Exporting...")
+        db_executor.submit(write, on_done=done, on_error=failed)
             
     def export_effort_csv(self):
         # Get file path from user
@@ -2514,115 +1974,53 @@ class ExportsTab:
         if not file_path:
             return
             
-        try:
-            # Get effort tracking data
-            conn = connect_db()
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT p.project_name, r.requirement_name, e.date, 
-                       e.requirements_analysis, e.designing, e.coding, 
-                       e.testing, e.project_management
-                FROM effort_tracking e
-                JOIN requirements r ON e.requirement_id = r.id
-                JOIN projects p ON r.project_id = p.id
-                ORDER BY p.project_name, r.requirement_name, e.date
-            """)
-            effort = cur.fetchall()
-            cur.close()
-            conn.close()
-            
-            # Write to CSV
-            with open(file_path, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(["Project", "Requirement", "Date", "Requirements Analysis", 
-                                "Designing", "Coding", "Testing", "Project Management"])
-                writer.writerows(effort)
-                
+        def write():
+            # Stream rows straight from the database into the file
+            export_csv(db, CSV_EXPORTS["effort"], file_path, self.progress_callback("Exporting effort tracking"))
+
+        def done(result):
             self.status_var.set(f"Effort tracking data exported successfully to {os.path.basename(file_path)}")
             messagebox.showinfo("Success", "Effort tracking data exported successfully!")
-        except Exception as e:
+
+        def failed(e):
             self.status_var.set(f"Error exporting effort tracking data: {e}")
             messagebox.showerror("Error", f"Failed to export effort tracking data: {e}")
+
+        # Query and file writing run on a worker; the messages come back on the Tk thread
+        self.status_var.set("Exporting...")
+        db_executor.submit(write, on_done=done, on_error=failed)
+            
+    def export_effort_weekly_csv(self):
+        # Get file path from user
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")],
+            title="Export Weekly Effort Summary"
+        )
+        if not file_path:
+            return
+            
+        def write():
+            export_csv(db, CSV_EXPORTS["effort_weekly"], file_path, self.progress_callback("Exporting weekly effort summary"))
+
+        def done(result):
+            self.status_var.set(f"Weekly effort summary exported successfully to {os.path.basename(file_path)}")
+            messagebox.showinfo("Success", "Weekly effort summary exported successfully!")
+
+        def failed(e):
+            self.status_var.set(f"Error exporting weekly effort summary: {e}")
+            messagebox.showerror("Error", f"Failed to export weekly effort summary: {e}")
+
+        self.status_var.set("Exporting...")
+        db_executor.submit(write, on_done=done, on_error=failed)
             
     def export_all_csv(self):
         # Get directory from user
         directory = filedialog.askdirectory(title="Select Export Directory")
         if not directory:
             return
-            
-        success_count = 0
-        try:
-            # Export projects
-            projects_file = os.path.join(directory, "projects_export.csv")
-            conn = connect_db()
-            cur = conn.cursor()
-            
-            # Export projects
-            cur.execute("SELECT project_name, owner, project_description, project_scope, target_users, technology_stack, platform FROM projects ORDER BY project_name")
-            projects = cur.fetchall()
-            with open(projects_file, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(["Project Name", "Owner", "Description", "Scope", "Target Users", "Technology Stack", "Platform"])
-                writer.writerows(projects)
-            success_count += 1
-            
-            # Export requirements
-            requirements_file = os.path.join(directory, "requirements_export.csv")
-            cur.execute("""
-                SELECT p.project_name, r.requirement_name, r.requirement_type, r.status, r.description
-                FROM requirements r
-                JOIN projects p ON r.project_id = p.id
-                ORDER BY p.project_name, r.requirement_name
-            """)
-            requirements = cur.fetchall()
-            with open(requirements_file, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(["Project", "Requirement Name", "Type", "Status", "Description"])
-                writer.writerows(requirements)
-            success_count += 1
-            
-            # Export effort tracking
-            effort_file = os.path.join(directory, "effort_export.csv")
-            cur.execute("""
-                SELECT p.project_name, r.requirement_name, e.date, 
-                       e.requirements_analysis, e.designing, e.coding, 
-                       e.testing, e.project_management
-                FROM effort_tracking e
-                JOIN requirements r ON e.requirement_id = r.id
-                JOIN projects p ON r.project_id = p.id
-                ORDER BY p.project_name, r.requirement_name, e.date
-            """)
-            effort = cur.fetchall()
-            with open(effort_file, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(["Project", "Requirement", "Date", "Requirements Analysis", 
-                                "Designing", "Coding", "Testing", "Project Management"])
-                writer.writerows(effort)
-            success_count += 1
-            
-            # Export risks
-            risks_file = os.path.join(directory, "risks_export.csv")
-            cur.execute("""
-                SELECT p.project_name, r.name, r.description, r.risk_status
-                FROM risks r
-                JOIN projects p ON r.project_id = p.id
-                ORDER BY p.project_name, r.name
-            """)
-            risks = cur.fetchall()
-            with open(risks_file, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(["Project", "Risk Name", "Description", "Status"])
-                writer.writerows(risks)
-            success_count += 1
-            
-            cur.close()
-            conn.close()
-            
-            self.status_var.set(f"All data exported successfully to {directory}")
-            messagebox.showinfo("Success", f"All data exported successfully to {directory}!")
-        except Exception as e:
-            self.status_var.set(f"Error exporting data: {e}")
-            messagebox.showerror("Error", f"Failed to export all data: {e} ({success_count} files were exported successfully)")
+
+        self.run_export_all("csv", CSV_EXPORTS, directory)
 
 
 # === PROJECT MANAGEMENT GUI ===
@@ -2641,6 +2039,25 @@ class ProjectManagementApp:
         else:
             self.root.title("Project Management System")
         
+        # Status bar showing when background database calls are running
+        # (packed before the notebook so it keeps its space when the window shrinks)
+        status_bar = ttk.Frame(root)
+        status_bar.pack(side="bottom", fill="x")
+        self.busy_progress = ttk.Progressbar(status_bar, mode="indeterminate", length=120)
+        self.busy_progress.pack(side="right", padx=5, pady=2)
+        self.busy_label = ttk.Label(status_bar, text="")
+        self.busy_label.pack(side="right", padx=5)
+        db_executor.add_busy_listener(self.show_busy)
+
+        # Global search box (results open in a SearchWindow)
+        search_bar = ttk.Frame(root)
+        search_bar.pack(side="top", fill="x", padx=5, pady=(5, 0))
+        ttk.Button(search_bar, text="Search", command=self.run_search).pack(side="right")
+        self.search_entry = ttk.Entry(search_bar, width=40)
+        self.search_entry.pack(side="right", padx=5)
+        self.search_entry.bind("<Return>", lambda e: self.run_search())
+        self.search_window = None
+
         # Create a notebook widget to hold multiple tabs
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(fill="both", expand=True)
@@ -2650,27 +2067,18 @@ class ProjectManagementApp:
         self.notebook.add(self.projects_tab, text="Projects")
         self.setup_projects_tab()
 
-        # Team Members Tab
-        self.team_tab = TeamMembersTab(self.notebook)
-        self.notebook.add(self.team_tab.frame, text="Team")
-
-        # Risks Tab
-        self.risks_tab = RisksTab(self.notebook)
-        self.notebook.add(self.risks_tab.frame, text="Risks")
-
-        # Effort Tracking & Monitoring Tab (must be created first)
-        self.effort_tab = EffortTrackingTab(self.notebook)
-
-        # Requirements Tab (pass reference to effort_tab)
-        self.requirements_tab = RequirementsTab(self.notebook, self.effort_tab)
-
-        # Add to notebook
-        self.notebook.add(self.requirements_tab.frame, text="Requirements")
-        self.notebook.add(self.effort_tab.frame, text="Effort Tracking")
-        
-        # Exports Tab
-        self.exports_tab = ExportsTab(self.notebook)
-        self.notebook.add(self.exports_tab.frame, text="Exports")
+        # The other tabs query the database when they are created, so each one is
+        # only built the first time it is selected (see on_tab_changed)
+        self.team_tab = LazyTab(self.notebook, "Team", TeamMembersTab)
+        self.risks_tab = LazyTab(self.notebook, "Risks", RisksTab)
+        self.requirements_tab = LazyTab(self.notebook, "Requirements",
+                                        lambda parent: RequirementsTab(parent, self.requirements_changed))
+        self.effort_tab = LazyTab(self.notebook, "Effort Tracking", EffortTrackingTab)
+        self.dashboard_tab = LazyTab(self.notebook, "Dashboard", EffortDashboardTab)
+        self.exports_tab = LazyTab(self.notebook, "Exports", ExportsTab)
+        self.lazy_tabs = {str(tab.placeholder): tab for tab in
+                          (self.team_tab, self.risks_tab, self.requirements_tab, self.effort_tab,
+                           self.dashboard_tab, self.exports_tab)}
         
         # User Profile Tab - only show if logged in
         if self.current_user["id"] is not None:
@@ -2678,42 +2086,83 @@ class ProjectManagementApp:
             self.notebook.add(self.user_profile_tab, text="My Profile")
             self.setup_user_profile_tab()
         
-        # Add tab change event handler to preserve content
+        # Build lazy tabs on first selection
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
-        
-        # Dictionary to track if a tab has been visited
-        self.tab_visited = {i: False for i in range(self.notebook.index('end'))}
-        # Mark first tab as visited
-        self.tab_visited[0] = True
+
+        # Other clients' writes update the open tabs as they are committed
+        change_listener.subscribe(self.apply_changes)
     
+    def show_busy(self, busy):
+        """Busy indicator for the DB executor"""
+        if busy:
+            self.busy_label.config(text="Loading...")
+            self.busy_progress.start(15)
+            self.root.config(cursor="watch")
+        else:
+            self.busy_label.config(text="")
+            self.busy_progress.stop()
+            self.root.config(cursor="")
+
     def on_tab_changed(self, event):
-        """Handle tab changes and ensure content is preserved"""
-        current_tab = self.notebook.index(self.notebook.select())
-        
-        # If this is the first visit to this tab, mark it as visited
-        if not self.tab_visited.get(current_tab, False):
-            self.tab_visited[current_tab] = True
-            
-            # Force a refresh of the tab content based on which tab it is
-            if current_tab == 1:  # Team tab
-                if hasattr(self.team_tab, 'project_combo') and self.team_tab.project_combo.get():
-                    self.team_tab.load_team_members()
-            elif current_tab == 2:  # Risks tab
-                if hasattr(self.risks_tab, 'project_combo') and self.risks_tab.project_combo.get():
-                    self.risks_tab.load_risks()
-            elif current_tab == 3:  # Requirements tab
-                if hasattr(self.requirements_tab, 'project_combo') and self.requirements_tab.project_combo.get():
-                    self.requirements_tab.load_requirements()
-            elif current_tab == 4:  # Effort Tracking tab
-                if hasattr(self.effort_tab, 'project_combo') and self.effort_tab.project_combo.get():
-                    if hasattr(self.effort_tab, 'req_combo') and self.effort_tab.req_combo.get():
-                        self.effort_tab.load_effort_entries()
-        
-        # For specific tabs that need extra handling on every visit
-        if current_tab == 2 and hasattr(self.risks_tab, 'risk_notebook'):  # Risks tab with internal notebook
-            selected_risk_tab = self.risks_tab.risk_notebook.index(self.risks_tab.risk_notebook.select())
-            if selected_risk_tab == 1:  # Matrix tab
-                self.risks_tab.sync_project_dropdowns()
+        """Build a lazy tab the first time it is shown"""
+        lazy_tab = self.lazy_tabs.get(str(self.notebook.select()))
+        if lazy_tab is None:
+            return
+        if not lazy_tab.built:
+            lazy_tab.build()
+            return
+
+        # For specific tabs that need extra handling on every later visit
+        if lazy_tab is self.risks_tab:  # Risks tab with internal notebook
+            risks_tab = self.risks_tab.tab
+            selected_risk_tab = risks_tab.risk_notebook.index(risks_tab.risk_notebook.select())
+            if selected_risk_tab == 1:  # Matrix tab; risks may have changed elsewhere
+                risks_tab.on_tab_changed()
+        elif lazy_tab is self.dashboard_tab:  # Effort may have changed in the meantime
+            self.dashboard_tab.tab.load_dashboard()
+
+    def run_search(self):
+        """Show the search results for the text in the search box"""
+        if self.search_window is None or not self.search_window.top.winfo_exists():
+            self.search_window = SearchWindow(self.root, db.search.search, db_executor, self.open_search_hit)
+        self.search_window.run(self.search_entry.get())
+
+    def open_search_hit(self, hit):
+        """Switch to the tab that shows a search hit and scroll to its row"""
+        if not project_catalog.loaded:
+            # The tabs select the hit's project by its name from the catalog
+            project_catalog.when_loaded(lambda catalog: self.open_search_hit(hit))
+            return
+        kind, row_id, project_id, _, _, detail, _ = hit
+        if kind == "project":
+            self.notebook.select(self.projects_tab)
+            self.view_projects(select_id=project_id)
+            return
+
+        lazy_tab = {"team_member": self.team_tab, "risk": self.risks_tab,
+                    "requirement": self.requirements_tab}[kind]
+        self.notebook.select(lazy_tab.placeholder)
+        tab = lazy_tab.build()
+        if kind == "team_member":
+            tab.show_member(project_id, row_id)
+        elif kind == "risk":
+            tab.show_risk(project_id, row_id)
+        else:
+            tab.show_requirement(project_id, row_id, detail)
+
+    def apply_changes(self, changes):
+        """Rows other clients wrote (see ChangeListener): update the tabs that show them"""
+        if any(change.table == "projects" for change in changes):
+            # The catalog pushes the new list to every dropdown and open projects window
+            db_executor.submit(project_catalog.invalidate, key="projects.invalidate")
+        for lazy_tab in (self.team_tab, self.risks_tab, self.requirements_tab, self.effort_tab, self.dashboard_tab):
+            if lazy_tab.built:
+                lazy_tab.tab.apply_changes(changes)
+
+    def requirements_changed(self):
+        """A requirement was added or edited; the effort tab lists requirements too"""
+        if self.effort_tab.built:
+            self.effort_tab.tab.load_requirements()
     
     def setup_user_profile_tab(self):
         """Set up the user profile tab"""
@@ -2769,44 +2218,31 @@ class ProjectManagementApp:
                     status_var.set("Password must be at least 6 characters")
                     return
                 
-                try:
-                    # Verify current password
-                    current_hash = hashlib.sha256(current.encode()).hexdigest()
-                    new_hash = hashlib.sha256(new.encode()).hexdigest()
-                    
-                    conn = connect_db()
-                    cur = conn.cursor()
-                    
-                    cur.execute("""
-                        SELECT COUNT(*) FROM users 
-                        WHERE id = %s AND password_hash = %s
-                    """, (self.current_user["id"], current_hash))
-                    
-                    if cur.fetchone()[0] == 0:
+                current_hash = hashlib.sha256(current.encode()).hexdigest()
+                new_hash = hashlib.sha256(new.encode()).hexdigest()
+                user_id = self.current_user["id"]
+
+                def update():
+                    # Verify current password, then update it; False if it did not match
+                    if not db.users.password_matches(user_id, current_hash):
+                        return False
+                    db.users.update_password(user_id, new_hash)
+                    return True
+
+                def done(changed):
+                    if not changed:
                         status_var.set("Current password is incorrect")
-                        cur.close()
-                        conn.close()
                         return
-                    
-                    # Update password
-                    cur.execute("""
-                        UPDATE users 
-                        SET password_hash = %s
-                        WHERE id = %s
-                    """, (new_hash, self.current_user["id"]))
-                    
-                    conn.commit()
-                    cur.close()
-                    conn.close()
-                    
+
                     # Clear entries
                     current_pwd_entry.delete(0, tk.END)
                     new_pwd_entry.delete(0, tk.END)
                     confirm_pwd_entry.delete(0, tk.END)
                     
                     status_var.set("Password changed successfully")
-                except Exception as e:
-                    status_var.set(f"Error: {e}")
+
+                db_executor.submit(update, on_done=done, key="profile.change_password",
+                                   on_error=lambda e: status_var.set(f"Error: {e}"))
             
             ttk.Button(pwd_frame, text="Change Password", command=change_password).grid(row=4, column=0, columnspan=2, pady=10)
         
@@ -2820,6 +2256,7 @@ class ProjectManagementApp:
             
             # Show login window again
             login_root = tk.Tk()
+            db_executor.attach(login_root)  # The old root's event loop is gone
             login_window = LoginWindow(login_root, lambda user_id, username, role: on_login_success(user_id, username, role))
             login_root.mainloop()
 
@@ -2884,27 +2321,24 @@ class ProjectManagementApp:
                 self.entry_platform.get()
             )
             if all(data):
-                save_project(data)
-                self.refresh_project_lists()
-                messagebox.showinfo("Success", "Project saved successfully!")
-
-                # Clear inputs
-                for entry in [self.entry_name, self.entry_owner, self.entry_users, self.entry_stack, self.entry_platform]:
-                    entry.delete(0, tk.END)
-                self.entry_description.delete("1.0", tk.END)
-                self.entry_scope.delete("1.0", tk.END)
-
-                # Also reload comboboxes in other tabs
-                self.requirements_tab.load_projects()  # refresh combobox
-                self.effort_tab.load_projects()
-
+                db_executor.submit(save_project, data, on_done=self.project_saved,
+                                   on_error=lambda e: messagebox.showerror("Error", project_error_message(e)))
             else:
                 messagebox.showwarning("Incomplete Data", "Please fill all fields.")
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {e}")
 
-    def view_projects(self):
-        # Open a new window to view/edit/delete existing projects
+    def project_saved(self, result):
+        messagebox.showinfo("Success", "Project saved successfully!")
+
+        # Clear inputs
+        for entry in [self.entry_name, self.entry_owner, self.entry_users, self.entry_stack, self.entry_platform]:
+            entry.delete(0, tk.END)
+        self.entry_description.delete("1.0", tk.END)
+        self.entry_scope.delete("1.0", tk.END)
+
+    def view_projects(self, select_id=None):
+        # Open a new window to view/edit/delete existing projects; project select_id is highlighted once loaded
         top = tk.Toplevel(self.root)
         top.title("All Projects")
 
@@ -2915,21 +2349,35 @@ class ProjectManagementApp:
             tree.column(col, anchor=tk.W, stretch=True)
         tree.pack(fill=tk.BOTH, expand=True)
 
+        # Items are keyed by project id; the version each row was read at is kept for writes
+        versions = {}
+
         # Fetch projects from DB and insert into tree
         def refresh_tree():
+            db_executor.submit(db.projects.list_all, on_done=fill_tree, key="projects.list_all")
+
+        # Re-read whenever the project list changes, here or in another client
+        def catalog_changed(catalog):
+            if top.winfo_exists():
+                refresh_tree()
+            else:
+                project_catalog.unsubscribe(catalog_changed)
+
+        project_catalog.subscribe(catalog_changed)
+
+        def fill_tree(rows):
+            # Keep the selected project selected across refreshes
+            keep_id = int(tree.focus()) if tree.focus() else select_id
             for row in tree.get_children():
                 tree.delete(row)
-            conn = connect_db()
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT project_name, owner, project_description, project_scope, target_users,
-                       technology_stack, platform
-                FROM projects
-            """)
-            for row in cur.fetchall():
-                tree.insert('', tk.END, values=row)
-            cur.close()
-            conn.close()
+            versions.clear()
+            for project_id, version, *values in rows:
+                item = tree.insert('', tk.END, iid=str(project_id), values=values)
+                versions[project_id] = version
+                if project_id == keep_id:
+                    tree.selection_set(item)
+                    tree.focus(item)
+                    tree.see(item)
 
         # Delete selected project
         def delete_selected():
@@ -2937,17 +2385,19 @@ class ProjectManagementApp:
             if not selected:
                 messagebox.showwarning("Select Project", "Please select a project to delete.")
                 return
-            values = tree.item(selected, 'values')
-            project_name = values[0]
+            project_id = int(selected)
+            project_name = tree.item(selected, 'values')[0]
             if messagebox.askyesno("Confirm Deletion", f"Delete project '{project_name}'?"):
-                try:
-                    delete_project(project_name)
+                def deleted(done):
+                    if not done:
+                        refresh_tree()
+                        messagebox.showwarning("Project Changed", PROJECT_CHANGED_MESSAGE)
+                        return
                     tree.delete(selected)
-                    self.refresh_project_lists()
-                    self.effort_tab.load_projects()
                     messagebox.showinfo("Deleted", f"'{project_name}' was deleted.")
-                except Exception as e:
-                    messagebox.showerror("Error", f"An error occurred: {e}")
+
+                db_executor.submit(delete_project, project_id, versions[project_id], on_done=deleted,
+                                   on_error=lambda e: messagebox.showerror("Error", project_error_message(e)))
 
         # Edit selected project
         def edit_selected():
@@ -2955,6 +2405,8 @@ class ProjectManagementApp:
             if not selected:
                 messagebox.showwarning("Select Project", "Please select a project to edit.")
                 return
+            project_id = int(selected)
+            version = versions[project_id]
             values = tree.item(selected, 'values')
 
             edit_win = tk.Toplevel(top)
@@ -2971,22 +2423,19 @@ class ProjectManagementApp:
                 e.grid(row=i, column=1)
                 entries.append(e)
 
-            original_name = values[0]
-
             def save_changes():
-                try:
-                    updated = (
-                        entries[0].get(), entries[1].get(), entries[2].get(), entries[3].get(),
-                        entries[4].get(), entries[5].get(), entries[6].get(), original_name
-                    )
-                    update_project(updated)
+                updated = tuple(entry.get() for entry in entries)
+
+                def saved(new_version):
                     refresh_tree()
-                    messagebox.showinfo("Success", f"'{updated[0]}' updated.")
+                    if new_version is None:
+                        messagebox.showwarning("Project Changed", PROJECT_CHANGED_MESSAGE)
+                    else:
+                        messagebox.showinfo("Success", f"'{updated[0]}' updated.")
                     edit_win.destroy()
-                    self.requirements_tab.load_projects() 
 
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to update project: {e}")
+                db_executor.submit(update_project, project_id, version, updated, on_done=saved,
+                                   on_error=lambda e: messagebox.showerror("Error", project_error_message(e)))
 
             tk.Button(edit_win, text="Save Changes", command=save_changes).grid(row=len(fields), column=0, columnspan=2, pady=10)
 
@@ -2998,36 +2447,60 @@ class ProjectManagementApp:
 
         refresh_tree()
 
-    def refresh_project_lists(self):
-        # Reload all comboboxes in other tabs after saving or deleting a project
-        self.team_tab.load_projects()
-        self.risks_tab.load_projects()
-        self.requirements_tab.load_projects()
-
 # Entry Point 
 if __name__ == "__main__":
+    # --startup-timing: start once more under -X importtime and report where startup goes
+    if STARTUP_TIMING_FLAG in sys.argv and not timing_child():
+        sys.exit(run_timed(__file__))
+    startup_timer.mark("imports and module setup")
+
     try:
         print("Starting Project Management System...")
         print(f"Database settings: {DB_NAME}@{DB_HOST} (user: {DB_USER})")
         
-        # Test database connection
+        # Test database connection (this also warms up the connection pool)
         try:
             print("Testing database connection...")
+            get_pool().prefill()
             conn = connect_db()
             print("Database connection successful!")
             conn.close()
+            startup_timer.mark("database connection")
         except Exception as e:
             print(f"ERROR: Database connection failed: {e}")
             print("Please make sure the PostgreSQL database is running and accessible.")
             print("You can run setup.bat to set up the database.")
             input("Press Enter to continue anyway (the application might not work properly)...")
         
+        # Bring the schema up to date (see migrations/)
+        try:
+            applied = MigrationRunner(db).run()
+            print(f"Database schema up to date ({len(applied)} migrations applied)")
+            # Load the column catalog once; later schema checks are answered from memory
+            get_catalog(db)
+            startup_timer.mark("migrations and schema catalog")
+        except Exception as e:
+            print(f"ERROR: Database migration failed: {e}")
+
+        # Listen for other clients' changes (triggers from migration 0009)
+        if not timing_child():
+            change_listener.start()
+        
         root = tk.Tk() # Create main window
+        db_executor.attach(root)  # Deliver background query results on this window's event loop
+        # Read the project list while the login window is up, before any tab asks for it
+        db_executor.submit(project_catalog.ensure_loaded, key="projects.preload",
+                           on_error=lambda e: None)  # The tabs try again when they are built
+        
+        startup_timer.mark("main window")
         
         # Apply styles if available
-        if 'STYLES_AVAILABLE' in globals() and STYLES_AVAILABLE:
+        style_modules = load_styles()
+        if style_modules:
+            styles, style_integration = style_modules
             print("Applying custom styles...")
             styles.apply_styles(root)
+        startup_timer.mark("styles")
         
         def on_login_success(user_id, username, role):
             # Create new window for the main application
@@ -3048,7 +2521,7 @@ if __name__ == "__main__":
             app = ProjectManagementApp(app_window)
             
             # Apply styles to main app if available
-            if 'STYLES_AVAILABLE' in globals() and STYLES_AVAILABLE:
+            if style_modules:
                 try:
                     style_integration.style_main_app(app)
                 except Exception as e:
@@ -3058,11 +2531,12 @@ if __name__ == "__main__":
         login_window = LoginWindow(root, on_login_success)
         
         # Apply styles to login window if available
-        if 'STYLES_AVAILABLE' in globals() and STYLES_AVAILABLE:
+        if style_modules:
             try:
                 style_integration.style_login_window(login_window)
             except Exception as e:
                 print(f"Warning: Error applying styles to login window: {e}")
+        startup_timer.mark("login window")
         
         # Use this flag for demonstration/testing to skip the login screen
         # Set SKIP_LOGIN to True to automatically skip the login
@@ -3071,8 +2545,24 @@ if __name__ == "__main__":
             print("Debug mode: Skipping login screen")
             login_window.skip_login()
         
-        print("Application initialized. Starting main loop...")
-        root.mainloop() # Run main loop
+        if timing_child():
+            # Timed run: stop once the login window has been drawn
+            root.update()
+            startup_timer.mark("first draw")
+            print(startup_timer.report())
+            root.destroy()
+        else:
+            print("Application initialized. Starting main loop...")
+            root.mainloop() # Run main loop
+        change_listener.stop()
+        db_executor.shutdown()
+
+        # Report how many handshakes the pool saved
+        stats = pool_stats()
+        if stats:
+            print(f"Connection pool: {stats['hits']} hits, {stats['misses']} misses "
+                  f"({stats['hit_ratio']:.0%} reused), {stats['reaped']} reaped")
+        get_pool().closeall()
     except Exception as e:
         print(f"CRITICAL ERROR: {e}")
         import traceback
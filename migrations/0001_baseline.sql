@@ -0,0 +1,53 @@
+-- Baseline schema: the tables from init-db.sql, created only when missing so
+-- that an empty database can be brought up by the application itself.
+
+CREATE TABLE IF NOT EXISTS projects (
+    id SERIAL PRIMARY KEY,
+    project_name TEXT NOT NULL,
+    owner TEXT,
+    project_description TEXT,
+    project_scope TEXT,
+    target_users TEXT,
+    technology_stack TEXT,
+    platform TEXT
+);
+
+CREATE TABLE IF NOT EXISTS team_members (
+    id SERIAL PRIMARY KEY,
+    project_id INTEGER REFERENCES projects(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    role TEXT,
+    responsibilities TEXT,
+    skill_level TEXT
+);
+
+CREATE TABLE IF NOT EXISTS risks (
+    id SERIAL PRIMARY KEY,
+    project_id INTEGER REFERENCES projects(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    description TEXT,
+    status TEXT
+);
+
+CREATE TABLE IF NOT EXISTS requirements (
+    id SERIAL PRIMARY KEY,
+    project_id INTEGER REFERENCES projects(id) ON DELETE CASCADE,
+    requirement_name TEXT NOT NULL,
+    description TEXT,
+    requirement_type TEXT,
+    status TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS effort_tracking (
+    id SERIAL PRIMARY KEY,
+    project_id INTEGER REFERENCES projects(id) ON DELETE CASCADE,
+    requirement_id INTEGER REFERENCES requirements(id) ON DELETE CASCADE,
+    date DATE DEFAULT CURRENT_DATE,
+    requirements_analysis NUMERIC DEFAULT 0,
+    designing NUMERIC DEFAULT 0,
+    coding NUMERIC DEFAULT 0,
+    testing NUMERIC DEFAULT 0,
+    project_management NUMERIC DEFAULT 0
+);
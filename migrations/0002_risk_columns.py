@@ -0,0 +1,40 @@
+"""
+Bring the risks table to the shape the application uses.
+Replaces the checks RisksTab used to run every time it was constructed: the
+catalog (one information_schema query) decides which statements are needed,
+and the backfill UPDATE only runs when existing columns may hold NULLs.
+"""
+
+# Columns added for the risk matrix, with their definitions
+RISK_COLUMNS = {
+    "impact": "INTEGER DEFAULT 3",
+    "probability": "INTEGER DEFAULT 3",
+    "priority": "INTEGER DEFAULT 9",
+    "mitigation_strategy": "TEXT DEFAULT ''",
+}
+
+
+def upgrade(tx, catalog):
+    # Databases created from init-db.sql still use the original risk_* names
+    if catalog.has_column("risks", "risk_name"):
+        tx.execute("ALTER TABLE risks RENAME COLUMN risk_name TO name")
+        tx.execute("ALTER TABLE risks RENAME COLUMN risk_description TO description")
+        tx.execute("ALTER TABLE risks RENAME COLUMN risk_status TO status")
+
+    # ADD COLUMN ... DEFAULT fills existing rows, so new columns need no backfill
+    preexisting = []
+    for column, definition in RISK_COLUMNS.items():
+        if catalog.has_column("risks", column):
+            preexisting.append(column)
+        else:
+            tx.execute(f"ALTER TABLE risks ADD COLUMN {column} {definition}")
+
+    # Only columns added by an older version of the app can contain NULLs
+    scored = [c for c in ("impact", "probability", "priority") if c in preexisting]
+    if scored:
+        tx.execute("""
+            UPDATE risks
+            SET impact = COALESCE(impact, 3),
+                probability = COALESCE(probability, 3),
+                priority = COALESCE(priority, 9)
+            WHERE """ + " OR ".join(f"{c} IS NULL" for c in scored))
@@ -0,0 +1,25 @@
+-- Secondary indexes for the per-project and per-requirement lookups every
+-- tab performs, so they stay index scans as the tables grow. Effort entries
+-- are only looked up by requirement (the unique constraint below);
+-- effort_tracking.project_id is never set or queried, so it gets no index.
+
+CREATE INDEX IF NOT EXISTS idx_team_members_project_id ON team_members (project_id);
+CREATE INDEX IF NOT EXISTS idx_risks_project_id ON risks (project_id);
+CREATE INDEX IF NOT EXISTS idx_requirements_project_id ON requirements (project_id);
+
+-- One effort entry per requirement and day. The application already refused
+-- duplicates on save, so any leftovers are races; keep the newest row.
+DELETE FROM effort_tracking older
+USING effort_tracking newer
+WHERE older.requirement_id = newer.requirement_id
+  AND older.date = newer.date
+  AND older.id < newer.id;
+
+-- The unique index also serves lookups by requirement_id and (requirement_id, date)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'effort_tracking_requirement_date_key') THEN
+        ALTER TABLE effort_tracking
+            ADD CONSTRAINT effort_tracking_requirement_date_key UNIQUE (requirement_id, date);
+    END IF;
+END $$;
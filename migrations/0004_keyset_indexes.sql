@@ -0,0 +1,20 @@
+-- The list views page through rows with "WHERE project_id = ? AND id > ?
+-- ORDER BY id LIMIT n". Composite indexes let each page be a single index
+-- range scan. They also cover plain project_id lookups, so the single-column
+-- indexes from 0003 are dropped.
+
+CREATE INDEX IF NOT EXISTS idx_team_members_project_id_id ON team_members (project_id, id);
+DROP INDEX IF EXISTS idx_team_members_project_id;
+
+CREATE INDEX IF NOT EXISTS idx_risks_project_id_id ON risks (project_id, id);
+DROP INDEX IF EXISTS idx_risks_project_id;
+
+CREATE INDEX IF NOT EXISTS idx_requirements_project_type_id ON requirements (project_id, requirement_type, id);
+DROP INDEX IF EXISTS idx_requirements_project_id;
+
+-- effort_tracking pages by (requirement_id, date), already covered by
+-- effort_tracking_requirement_date_key from 0003
+
+-- effort_tracking.project_id is never set or queried, so an index on it only
+-- slows down effort inserts; drop it where a database still has one
+DROP INDEX IF EXISTS idx_effort_tracking_project_id;
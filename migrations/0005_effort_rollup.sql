@@ -0,0 +1,141 @@
+-- Effort totals kept up to date by trigger, so "View Total Hours", project
+-- totals and the weekly summary read a few precomputed rows instead of
+-- summing every effort entry.
+--   effort_totals - per requirement
+--   effort_weekly - per requirement and week (Monday); project figures are
+--                   these rows summed over the project's requirements
+-- A row whose entries count drops to 0 is deleted. There are no foreign keys:
+-- deleting a requirement cascades to its effort rows, whose trigger then
+-- removes the matching rollup rows.
+
+CREATE TABLE IF NOT EXISTS effort_totals (
+    requirement_id INTEGER PRIMARY KEY,
+    entries INTEGER NOT NULL DEFAULT 0,
+    requirements_analysis NUMERIC NOT NULL DEFAULT 0,
+    designing NUMERIC NOT NULL DEFAULT 0,
+    coding NUMERIC NOT NULL DEFAULT 0,
+    testing NUMERIC NOT NULL DEFAULT 0,
+    project_management NUMERIC NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS effort_weekly (
+    requirement_id INTEGER NOT NULL,
+    week DATE NOT NULL,
+    entries INTEGER NOT NULL DEFAULT 0,
+    requirements_analysis NUMERIC NOT NULL DEFAULT 0,
+    designing NUMERIC NOT NULL DEFAULT 0,
+    coding NUMERIC NOT NULL DEFAULT 0,
+    testing NUMERIC NOT NULL DEFAULT 0,
+    project_management NUMERIC NOT NULL DEFAULT 0,
+    PRIMARY KEY (requirement_id, week)
+);
+
+-- Statement-level triggers see all changed rows at once (transition tables),
+-- so a batch save or import costs one aggregate per statement, not one
+-- rollup update per row. %s below is the query producing signed changes.
+CREATE OR REPLACE FUNCTION effort_rollup_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    changes TEXT;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        changes := 'SELECT 1 AS sign, * FROM new_rows';
+    ELSIF TG_OP = 'DELETE' THEN
+        changes := 'SELECT -1 AS sign, * FROM old_rows';
+    ELSE
+        changes := 'SELECT 1 AS sign, * FROM new_rows UNION ALL SELECT -1, * FROM old_rows';
+    END IF;
+
+    EXECUTE format($sql$
+        WITH changes AS (%s),
+        totals AS (
+            INSERT INTO effort_totals AS t
+            SELECT requirement_id, SUM(sign),
+                   SUM(sign * COALESCE(requirements_analysis, 0)), SUM(sign * COALESCE(designing, 0)),
+                   SUM(sign * COALESCE(coding, 0)), SUM(sign * COALESCE(testing, 0)),
+                   SUM(sign * COALESCE(project_management, 0))
+            FROM changes
+            WHERE requirement_id IS NOT NULL
+            GROUP BY requirement_id
+            ON CONFLICT (requirement_id) DO UPDATE SET
+                entries = t.entries + EXCLUDED.entries,
+                requirements_analysis = t.requirements_analysis + EXCLUDED.requirements_analysis,
+                designing = t.designing + EXCLUDED.designing,
+                coding = t.coding + EXCLUDED.coding,
+                testing = t.testing + EXCLUDED.testing,
+                project_management = t.project_management + EXCLUDED.project_management
+        )
+        INSERT INTO effort_weekly AS w
+        SELECT requirement_id, date_trunc('week', date)::date, SUM(sign),
+               SUM(sign * COALESCE(requirements_analysis, 0)), SUM(sign * COALESCE(designing, 0)),
+               SUM(sign * COALESCE(coding, 0)), SUM(sign * COALESCE(testing, 0)),
+               SUM(sign * COALESCE(project_management, 0))
+        FROM changes
+        WHERE requirement_id IS NOT NULL AND date IS NOT NULL
+        GROUP BY 1, 2
+        ON CONFLICT (requirement_id, week) DO UPDATE SET
+            entries = w.entries + EXCLUDED.entries,
+            requirements_analysis = w.requirements_analysis + EXCLUDED.requirements_analysis,
+            designing = w.designing + EXCLUDED.designing,
+            coding = w.coding + EXCLUDED.coding,
+            testing = w.testing + EXCLUDED.testing,
+            project_management = w.project_management + EXCLUDED.project_management
+    $sql$, changes);
+
+    IF TG_OP <> 'INSERT' THEN
+        EXECUTE format($sql$
+            WITH changes AS (%s),
+            emptied_totals AS (
+                DELETE FROM effort_totals
+                WHERE entries = 0 AND requirement_id IN (SELECT requirement_id FROM changes)
+            )
+            DELETE FROM effort_weekly
+            WHERE entries = 0
+              AND (requirement_id, week) IN (SELECT requirement_id, date_trunc('week', date)::date FROM changes)
+        $sql$, changes);
+    END IF;
+    RETURN NULL;
+END $$;
+
+CREATE OR REPLACE FUNCTION effort_rollup_truncate() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    TRUNCATE effort_totals, effort_weekly;
+    RETURN NULL;
+END $$;
+
+DROP TRIGGER IF EXISTS effort_rollup_insert ON effort_tracking;
+DROP TRIGGER IF EXISTS effort_rollup_update ON effort_tracking;
+DROP TRIGGER IF EXISTS effort_rollup_delete ON effort_tracking;
+DROP TRIGGER IF EXISTS effort_rollup_truncate ON effort_tracking;
+
+CREATE TRIGGER effort_rollup_insert AFTER INSERT ON effort_tracking
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION effort_rollup_apply();
+CREATE TRIGGER effort_rollup_update AFTER UPDATE ON effort_tracking
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION effort_rollup_apply();
+CREATE TRIGGER effort_rollup_delete AFTER DELETE ON effort_tracking
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION effort_rollup_apply();
+CREATE TRIGGER effort_rollup_truncate AFTER TRUNCATE ON effort_tracking
+    FOR EACH STATEMENT EXECUTE FUNCTION effort_rollup_truncate();
+
+-- Fill from the existing entries (the triggers only see later changes)
+TRUNCATE effort_totals, effort_weekly;
+
+INSERT INTO effort_totals
+SELECT requirement_id, COUNT(*),
+       SUM(COALESCE(requirements_analysis, 0)), SUM(COALESCE(designing, 0)), SUM(COALESCE(coding, 0)),
+       SUM(COALESCE(testing, 0)), SUM(COALESCE(project_management, 0))
+FROM effort_tracking
+WHERE requirement_id IS NOT NULL
+GROUP BY requirement_id;
+
+INSERT INTO effort_weekly
+SELECT requirement_id, date_trunc('week', date)::date, COUNT(*),
+       SUM(COALESCE(requirements_analysis, 0)), SUM(COALESCE(designing, 0)), SUM(COALESCE(coding, 0)),
+       SUM(COALESCE(testing, 0)), SUM(COALESCE(project_management, 0))
+FROM effort_tracking
+WHERE requirement_id IS NOT NULL AND date IS NOT NULL
+GROUP BY 1, 2;
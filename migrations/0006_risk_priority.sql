@@ -0,0 +1,36 @@
+-- Risk priority is impact x probability. It was a plain column that nothing
+-- kept up to date, so the matrix recomputed it in Python; now the database
+-- maintains it, and indexes on it make "highest priority first" lists and
+-- top-N queries index scans that stop after LIMIT rows.
+
+-- Scores are 1..5; NULLs count as the middle of the scale
+UPDATE risks
+SET impact = LEAST(GREATEST(COALESCE(impact, 3), 1), 5),
+    probability = LEAST(GREATEST(COALESCE(probability, 3), 1), 5)
+WHERE impact IS NULL OR probability IS NULL
+   OR impact NOT BETWEEN 1 AND 5 OR probability NOT BETWEEN 1 AND 5;
+
+ALTER TABLE risks ALTER COLUMN impact SET NOT NULL;
+ALTER TABLE risks ALTER COLUMN probability SET NOT NULL;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'risks_impact_range') THEN
+        ALTER TABLE risks ADD CONSTRAINT risks_impact_range CHECK (impact BETWEEN 1 AND 5);
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'risks_probability_range') THEN
+        ALTER TABLE risks ADD CONSTRAINT risks_probability_range CHECK (probability BETWEEN 1 AND 5);
+    END IF;
+END $$;
+
+ALTER TABLE risks DROP COLUMN IF EXISTS priority;
+ALTER TABLE risks ADD COLUMN priority INTEGER GENERATED ALWAYS AS (impact * probability) STORED;
+
+-- Risk List sorted by priority within a project (read backwards for
+-- highest first); also serves the status and matrix cell filters
+CREATE INDEX IF NOT EXISTS idx_risks_project_priority_id ON risks (project_id, priority, id);
+-- Top risks across all projects
+CREATE INDEX IF NOT EXISTS idx_risks_priority_id ON risks (priority, id);
+
+-- The column was rebuilt; give the planner fresh statistics for the new indexes
+ANALYZE risks;
@@ -0,0 +1,35 @@
+-- Full-text search over projects, requirements, risks and team members.
+-- Each table gets a generated tsvector column (names weighted above the
+-- longer text) and a GIN index on it, so a search is an index lookup per
+-- table instead of a LIKE scan over every description.
+
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS search tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(project_name, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(project_description, '')), 'B')
+) STORED;
+
+ALTER TABLE requirements ADD COLUMN IF NOT EXISTS search tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(requirement_name, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B')
+) STORED;
+
+ALTER TABLE risks ADD COLUMN IF NOT EXISTS search tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B')
+) STORED;
+
+ALTER TABLE team_members ADD COLUMN IF NOT EXISTS search tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(role, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(responsibilities, '')), 'B')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_projects_search ON projects USING gin (search);
+CREATE INDEX IF NOT EXISTS idx_requirements_search ON requirements USING gin (search);
+CREATE INDEX IF NOT EXISTS idx_risks_search ON risks USING gin (search);
+CREATE INDEX IF NOT EXISTS idx_team_members_search ON team_members USING gin (search);
+
+ANALYZE projects;
+ANALYZE requirements;
+ANALYZE risks;
+ANALYZE team_members;
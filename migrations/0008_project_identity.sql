@@ -0,0 +1,30 @@
+-- Projects are edited and deleted by id. Names become unique, so the name
+-- shown in every dropdown identifies one project, and a version number
+-- lets a client detect that someone else changed the project since it was
+-- read (optimistic concurrency: the write only matches the version it saw).
+
+-- Older databases may hold duplicate names; keep the first, suffix the others with their id
+UPDATE projects p
+SET project_name = p.project_name || ' (' || p.id || ')'
+FROM (
+    SELECT id, row_number() OVER (PARTITION BY project_name ORDER BY id) AS n
+    FROM projects
+) d
+WHERE p.id = d.id AND d.n > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_projects_name_unique ON projects (project_name);
+
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+
+-- Every update moves the version on, whichever code path makes it (e.g. CSV import)
+CREATE OR REPLACE FUNCTION projects_bump_version() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.version := OLD.version + 1;
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS projects_version ON projects;
+CREATE TRIGGER projects_version BEFORE UPDATE ON projects
+    FOR EACH ROW EXECUTE FUNCTION projects_bump_version();
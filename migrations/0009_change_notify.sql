@@ -0,0 +1,82 @@
+-- Live refresh across clients: every write to projects, team_members, risks,
+-- requirements and effort_tracking sends a notification on the pms_changes
+-- channel, which running applications LISTEN on (src/utils/change_listener.py).
+-- Payload: {"table": ..., "op": "insert"|"update"|"delete"|"truncate", "id": ...}
+-- plus the owner column the tabs filter by (project_id, or requirement_id for
+-- effort_tracking); projects carry no owner. Notifications are only delivered
+-- when the writing transaction commits, and never for a rolled back one.
+--
+-- Statement-level triggers (transition tables, as in 0005) send one message
+-- per row for ordinary edits. A statement changing more rows than that (an
+-- import, clearing a requirement's effort) sends one message without an id per
+-- owner instead - or a single one if there are many owners - and clients
+-- re-read the affected lists rather than patching row by row.
+
+CREATE OR REPLACE FUNCTION notify_changes() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    row_limit CONSTANT INTEGER := 100;
+    changed TEXT := CASE TG_OP WHEN 'DELETE' THEN 'old_rows' ELSE 'new_rows' END;
+    -- TG_ARGV[0]: owner column, if the table has one
+    owner_column TEXT := TG_ARGV[0];
+    owner_sql TEXT := COALESCE(quote_ident(TG_ARGV[0]), 'NULL::integer');
+    message JSONB := jsonb_build_object('table', TG_TABLE_NAME, 'op', lower(TG_OP));
+    total BIGINT;
+    owners INTEGER[];
+    change RECORD;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        PERFORM pg_notify('pms_changes', message::text);
+        RETURN NULL;
+    END IF;
+
+    EXECUTE format('SELECT count(*) FROM %I', changed) INTO total;
+    IF total <= row_limit THEN
+        FOR change IN EXECUTE format('SELECT id, %s AS owner FROM %I ORDER BY id', owner_sql, changed) LOOP
+            PERFORM pg_notify('pms_changes', jsonb_strip_nulls(message
+                || jsonb_build_object('id', change.id, COALESCE(owner_column, 'owner'), change.owner))::text);
+        END LOOP;
+        RETURN NULL;
+    END IF;
+
+    EXECUTE format('SELECT array_agg(DISTINCT %s) FROM %I', owner_sql, changed) INTO owners;
+    IF owner_column IS NULL OR cardinality(owners) > row_limit OR array_position(owners, NULL) IS NOT NULL THEN
+        PERFORM pg_notify('pms_changes', message::text);
+    ELSE
+        FOR change IN SELECT unnest(owners) AS owner LOOP
+            PERFORM pg_notify('pms_changes', (message || jsonb_build_object(owner_column, change.owner))::text);
+        END LOOP;
+    END IF;
+    RETURN NULL;
+END $$;
+
+DO $$
+DECLARE
+    t RECORD;
+BEGIN
+    FOR t IN SELECT * FROM (VALUES
+        ('projects', NULL),
+        ('team_members', 'project_id'),
+        ('risks', 'project_id'),
+        ('requirements', 'project_id'),
+        ('effort_tracking', 'requirement_id')
+    ) AS v(name, owner_column) LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', t.name || '_notify_insert', t.name);
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', t.name || '_notify_update', t.name);
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', t.name || '_notify_delete', t.name);
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', t.name || '_notify_truncate', t.name);
+
+        EXECUTE format('CREATE TRIGGER %I AFTER INSERT ON %I REFERENCING NEW TABLE AS new_rows '
+                       'FOR EACH STATEMENT EXECUTE FUNCTION notify_changes(%s)',
+                       t.name || '_notify_insert', t.name, COALESCE(quote_literal(t.owner_column), ''));
+        EXECUTE format('CREATE TRIGGER %I AFTER UPDATE ON %I REFERENCING NEW TABLE AS new_rows '
+                       'FOR EACH STATEMENT EXECUTE FUNCTION notify_changes(%s)',
+                       t.name || '_notify_update', t.name, COALESCE(quote_literal(t.owner_column), ''));
+        EXECUTE format('CREATE TRIGGER %I AFTER DELETE ON %I REFERENCING OLD TABLE AS old_rows '
+                       'FOR EACH STATEMENT EXECUTE FUNCTION notify_changes(%s)',
+                       t.name || '_notify_delete', t.name, COALESCE(quote_literal(t.owner_column), ''));
+        EXECUTE format('CREATE TRIGGER %I AFTER TRUNCATE ON %I '
+                       'FOR EACH STATEMENT EXECUTE FUNCTION notify_changes()',
+                       t.name || '_notify_truncate', t.name);
+    END LOOP;
+END $$;
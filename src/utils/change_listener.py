@@ -0,0 +1,181 @@
+"""
+Change Listener - Live updates from other clients through LISTEN/NOTIFY
+Triggers (migration 0009) send a notification on the pms_changes channel for
+every row written to projects, team_members, risks, requirements and
+effort_tracking once the writing transaction commits. A background thread
+holds one connection of its own (outside the pool, since it is never handed
+back) listening on that channel, and passes each burst of changes to the
+subscribers on the Tk thread, so the open tabs patch just the rows that
+changed instead of polling or reloading whole lists.
+
+Changes written through this process's own pool are skipped: the tab that
+made them has already updated itself. Bulk writes made here (an import, a
+batch of effort) touch rows other tabs show, so their callers publish() a
+change without an id, which has those tabs re-read. After a lost connection
+the listener reconnects and reports one change per table without an id,
+since anything sent in between was missed.
+"""
+
+import json
+import select
+import threading
+import tkinter as tk
+
+import psycopg2
+
+from .connection_pool import get_pool
+
+CHANNEL = "pms_changes"
+TABLES = ("projects", "team_members", "risks", "requirements", "effort_tracking")
+# Seconds between checks of the stop flag, and before reconnecting after an error
+POLL_INTERVAL = 1.0
+RECONNECT_DELAY = 5.0
+
+
+class Change:
+    """One notification: a row of table was inserted, updated or deleted (op)
+
+    id is None when the statement changed too many rows to list them, the
+    table was truncated, the listener reconnected (op "reconnect") or this
+    process wrote rows in bulk (op "bulk", see publish()).
+    project_id / requirement_id tell whose rows they were where known, so a
+    tab can ignore changes to lists it does not show.
+    """
+
+    def __init__(self, table, op, id=None, project_id=None, requirement_id=None):
+        self.table = table
+        self.op = op
+        self.id = id
+        self.project_id = project_id
+        self.requirement_id = requirement_id
+
+    @classmethod
+    def from_payload(cls, payload):
+        data = json.loads(payload)
+        return cls(data["table"], data["op"], data.get("id"), data.get("project_id"), data.get("requirement_id"))
+
+    def __repr__(self):
+        return f"Change({self.table!r}, {self.op!r}, id={self.id!r})"
+
+
+def select_changes(changes, table, **owner):
+    """Changes to table whose rows may belong to owner, e.g. project_id=3
+
+    Changes that do not say whose rows they were (bulk statements) are included.
+    """
+    return [change for change in changes if change.table == table
+            and all(getattr(change, name) in (value, None) for name, value in owner.items())]
+
+
+class ChangeListener:
+    """Background LISTEN on CHANNEL, delivering lists of Change to subscribers"""
+
+    def __init__(self, pool=None):
+        self._pool = pool
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        # Set to DBExecutor.call_soon so subscribers run on the Tk thread
+        self.dispatch = None
+
+    @property
+    def pool(self):
+        return self._pool or get_pool()
+
+    # --- Subscribers ---
+
+    def subscribe(self, callback):
+        """Call callback(changes) with every burst of changes made by other clients"""
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def publish(self, changes):
+        """Pass changes this process made in bulk to the subscribers, as if another client made them"""
+        self._deliver(changes)
+
+    # --- Thread ---
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="db-change-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(POLL_INTERVAL * 2)
+            self._thread = None
+
+    def _run(self):
+        connected_before = False
+        failing = False
+        while not self._stop.is_set():
+            try:
+                conn = psycopg2.connect(**self.pool.connect_kwargs)
+            except psycopg2.Error as e:
+                if not failing:
+                    print(f"Live updates unavailable, retrying: {e}")
+                failing = True
+                self._stop.wait(RECONNECT_DELAY)
+                continue
+
+            try:
+                conn.autocommit = True
+                conn.cursor().execute(f"LISTEN {CHANNEL}")
+                if connected_before:
+                    # Whatever was sent while disconnected is lost: have every list re-read
+                    self._deliver([Change(table, "reconnect") for table in TABLES])
+                connected_before = True
+                failing = False
+                self._listen(conn)
+            except (psycopg2.Error, OSError) as e:
+                print(f"Live updates connection lost, reconnecting: {e}")
+                self._stop.wait(RECONNECT_DELAY)
+            finally:
+                conn.close()
+
+    def _listen(self, conn):
+        while not self._stop.is_set():
+            if not select.select([conn], [], [], POLL_INTERVAL)[0]:
+                continue
+            conn.poll()
+            # Take everything already on the socket, so one commit is one burst
+            while select.select([conn], [], [], 0)[0]:
+                conn.poll()
+
+            own_pids = self.pool.backend_pids()
+            changes = []
+            for notify in conn.notifies:
+                if notify.pid in own_pids:
+                    continue
+                try:
+                    changes.append(Change.from_payload(notify.payload))
+                except (ValueError, KeyError) as e:
+                    print(f"Ignored malformed change notification {notify.payload!r}: {e}")
+            conn.notifies.clear()
+            if changes:
+                self._deliver(changes)
+
+    def _deliver(self, changes):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            if self.dispatch is not None:
+                self.dispatch(self._notify, callback, changes)
+            else:
+                self._notify(callback, changes)
+
+    def _notify(self, callback, changes):
+        try:
+            callback(changes)
+        except tk.TclError:
+            # The subscribing window was destroyed (e.g. after logout)
+            self.unsubscribe(callback)
@@ -0,0 +1,359 @@
+"""
+Connection Pool - Shared PostgreSQL connection pool for the Project Management System
+Keeps a small set of open connections alive so every database call reuses an
+existing session instead of paying for a new TCP + authentication handshake.
+"""
+
+import threading
+import time
+
+import psycopg2
+from psycopg2 import extensions
+
+
+class PoolExhaustedError(psycopg2.OperationalError):
+    """Raised when no connection becomes available before the checkout timeout"""
+
+
+class AppConnection(extensions.connection):
+    """psycopg2 connection that can carry per-session bookkeeping
+
+    The data access layer records which statements it has already PREPAREd on
+    this session here, so they are reused for as long as the connection lives.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements = set()
+
+
+class PooledConnection:
+    """Wrapper around a pooled connection
+
+    Behaves like a normal psycopg2 connection, except that close() hands the
+    connection back to the pool instead of closing the socket. It can also be
+    used as a context manager: the transaction is committed on success, rolled
+    back on error, and the connection is returned to the pool either way.
+    """
+
+    def __init__(self, pool, conn):
+        self._pool = pool
+        self._conn = conn
+        self._released = False
+
+    @property
+    def raw(self):
+        """The underlying psycopg2 connection"""
+        return self._conn
+
+    def close(self):
+        """Return the connection to the pool"""
+        if not self._released:
+            self._released = True
+            self._pool.putconn(self._conn)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if not self._conn.closed:
+                if exc_type is None:
+                    self._conn.commit()
+                else:
+                    self._conn.rollback()
+        finally:
+            self.close()
+        return False
+
+    def __del__(self):
+        # Safety net for code paths that raise before calling close()
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    """Thread-safe pool of psycopg2 connections
+
+    - minconn connections are kept open even when idle
+    - at most maxconn connections exist at any time; further checkouts wait
+    - connections idle for longer than health_check_after seconds are pinged
+      with SELECT 1 before being handed out
+    - connections idle for longer than max_idle seconds are closed by the reaper
+    """
+
+    def __init__(self, minconn=1, maxconn=10, max_idle=300, health_check_after=30,
+                 reap_interval=60, checkout_timeout=30, **connect_kwargs):
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise ValueError("Invalid pool size: minconn=%s maxconn=%s" % (minconn, maxconn))
+
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.max_idle = max_idle
+        self.health_check_after = health_check_after
+        self.reap_interval = reap_interval
+        self.checkout_timeout = checkout_timeout
+        self.connect_kwargs = connect_kwargs
+
+        self._cond = threading.Condition()
+        self._idle = []       # list of (connection, last_used) - used as a LIFO stack
+        self._in_use = 0
+        self._closed = False
+        self._reaper = None
+        self._backend_pids = {}  # open connection -> server process id
+
+        # Counters exposed through stats()
+        self._hits = 0
+        self._misses = 0
+        self._waits = 0
+        self._health_check_failures = 0
+        self._discarded = 0
+        self._reaped = 0
+
+    # --- Checkout / return ---
+
+    def getconn(self, timeout=None):
+        """Check out a raw connection, opening a new one only when none is idle"""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            candidate = None
+            with self._cond:
+                if self._closed:
+                    raise psycopg2.InterfaceError("Connection pool is closed")
+
+                if self._idle:
+                    candidate = self._idle.pop()
+                    self._in_use += 1
+                elif self._in_use < self.maxconn:
+                    self._in_use += 1
+                    self._misses += 1
+                else:
+                    self._waits += 1
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._cond.wait(remaining):
+                        raise PoolExhaustedError(
+                            "No database connection available after %s seconds" % timeout)
+                    continue
+
+            # Network I/O happens outside the lock
+            if candidate is None:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    self._forget_checkout()
+                    raise
+                self._start_reaper()
+                return conn
+
+            conn, last_used = candidate
+            if self._is_healthy(conn, last_used):
+                with self._cond:
+                    self._hits += 1
+                return conn
+
+            # Stale connection - drop it and try again
+            self._close_quietly(conn)
+            with self._cond:
+                self._health_check_failures += 1
+                self._discarded += 1
+                self._in_use -= 1
+
+    def putconn(self, conn):
+        """Return a raw connection to the pool"""
+        healthy = not conn.closed
+        if healthy and conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+            # Never hand out a connection with an open or failed transaction
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                healthy = False
+
+        with self._cond:
+            self._in_use -= 1
+            keep = healthy and not self._closed
+            if keep:
+                self._idle.append((conn, time.monotonic()))
+            else:
+                self._discarded += 1
+            self._cond.notify()
+
+        if not keep:
+            self._close_quietly(conn)
+
+    def connection(self, timeout=None):
+        """Check out a connection wrapped so close() / with-blocks return it to the pool"""
+        return PooledConnection(self, self.getconn(timeout))
+
+    # --- Maintenance ---
+
+    def reap_idle(self):
+        """Close connections idle for longer than max_idle, keeping minconn open"""
+        now = time.monotonic()
+        to_close = []
+        with self._cond:
+            keep = []
+            total_open = len(self._idle) + self._in_use
+            # Oldest connections are at the front of the stack
+            for conn, last_used in self._idle:
+                if now - last_used > self.max_idle and total_open > self.minconn:
+                    to_close.append(conn)
+                    total_open -= 1
+                else:
+                    keep.append((conn, last_used))
+            self._idle = keep
+            self._reaped += len(to_close)
+
+        for conn in to_close:
+            self._close_quietly(conn)
+        return len(to_close)
+
+    def prefill(self):
+        """Open connections until minconn are idle and ready"""
+        opened = []
+        with self._cond:
+            needed = self.minconn - (len(self._idle) + self._in_use)
+            needed = max(0, min(needed, self.maxconn - (len(self._idle) + self._in_use)))
+            self._in_use += needed
+        try:
+            for _ in range(needed):
+                opened.append(self._connect())
+        finally:
+            with self._cond:
+                self._in_use -= needed
+                self._misses += len(opened)
+                now = time.monotonic()
+                self._idle.extend((conn, now) for conn in opened)
+                self._cond.notify_all()
+        self._start_reaper()
+
+    def closeall(self):
+        """Close every idle connection and refuse further checkouts"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    def stats(self):
+        """Snapshot of pool counters
+
+        hits   - checkouts served by an already open connection
+        misses - checkouts that had to open a new connection (a full handshake)
+        """
+        with self._cond:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": (self._hits / total) if total else 0.0,
+                "waits": self._waits,
+                "health_check_failures": self._health_check_failures,
+                "discarded": self._discarded,
+                "reaped": self._reaped,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "minconn": self.minconn,
+                "maxconn": self.maxconn,
+            }
+
+    def backend_pids(self):
+        """Server process ids of the connections this pool has open
+
+        A NOTIFY carries the pid of the session that sent it, so this tells
+        this process's own writes apart from other clients'.
+        """
+        with self._cond:
+            return set(self._backend_pids.values())
+
+    # --- Internals ---
+
+    def _connect(self):
+        kwargs = dict(self.connect_kwargs)
+        kwargs.setdefault("connection_factory", AppConnection)
+        conn = psycopg2.connect(**kwargs)
+        with self._cond:
+            self._backend_pids[conn] = conn.get_backend_pid()
+        return conn
+
+    def _forget_checkout(self):
+        with self._cond:
+            self._in_use -= 1
+            self._misses -= 1
+            self._cond.notify()
+
+    def _is_healthy(self, conn, last_used):
+        if conn.closed:
+            return False
+        if time.monotonic() - last_used < self.health_check_after:
+            return True
+        try:
+            cur = conn.cursor()
+            cur.execute("SELECT 1")
+            cur.close()
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _start_reaper(self):
+        if self.reap_interval is None or self._reaper is not None:
+            return
+        with self._cond:
+            if self._reaper is not None:
+                return
+            self._reaper = threading.Thread(target=self._reap_loop, name="db-pool-reaper", daemon=True)
+        self._reaper.start()
+
+    def _reap_loop(self):
+        while True:
+            time.sleep(self.reap_interval)
+            if self._closed:
+                return
+            self.reap_idle()
+
+    def _close_quietly(self, conn):
+        with self._cond:
+            self._backend_pids.pop(conn, None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+# === PROCESS-WIDE POOL ===
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def configure_pool(**kwargs):
+    """Create (or replace) the process-wide pool
+
+    Accepts the ConnectionPool sizing options plus any psycopg2.connect() keyword.
+    """
+    global _pool
+    with _pool_lock:
+        old, _pool = _pool, ConnectionPool(**kwargs)
+    if old is not None:
+        old.closeall()
+    return _pool
+
+
+def get_pool():
+    """Return the process-wide pool configured by configure_pool()"""
+    if _pool is None:
+        raise RuntimeError("Connection pool has not been configured - call configure_pool() first")
+    return _pool
+
+
+def pool_stats():
+    """Hit/miss counters of the process-wide pool, or None if it was never configured"""
+    return _pool.stats() if _pool is not None else None
@@ -0,0 +1,115 @@
+"""
+CSV Export - Streaming table exports for the Exports tab
+The header row is written with the csv module, then Postgres produces the
+data itself with COPY (<report query>) TO STDOUT (FORMAT csv). Chunks go
+straight from the socket to the file, so memory use stays flat no matter how
+large the table is, and a progress callback is told how far the export got.
+"""
+
+import csv
+import io
+import os
+
+from psycopg2 import extensions
+
+from .database import (Statement, ProjectRepository, RequirementRepository, EffortRepository, RiskRepository,
+                       TeamMemberRepository)
+
+# Report progress every this many rows
+PROGRESS_EVERY = 5000
+
+# Planner estimate of a table's row count; free to read, good enough for a progress bar
+ESTIMATE_ROWS = Statement("export.estimate_rows",
+                          "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)")
+
+
+class CsvExport:
+    """One report query exported to a CSV file"""
+
+    def __init__(self, name, filename, header, statement, table):
+        self.name = name
+        self.filename = filename    # File name used by "export all"
+        self.header = header
+        self.statement = statement  # Parameterless report Statement
+        self.table = table          # Table whose size drives the progress estimate
+
+
+CSV_EXPORTS = {
+    "projects": CsvExport(
+        "projects", "projects_export.csv",
+        ["Project Name", "Owner", "Description", "Scope", "Target Users", "Technology Stack", "Platform"],
+        ProjectRepository.REPORT, "projects"),
+    "requirements": CsvExport(
+        "requirements", "requirements_export.csv",
+        ["Project", "Requirement Name", "Type", "Status", "Description"],
+        RequirementRepository.REPORT, "requirements"),
+    "effort": CsvExport(
+        "effort", "effort_export.csv",
+        ["Project", "Requirement", "Date", "Requirements Analysis", "Designing", "Coding", "Testing",
+         "Project Management"],
+        EffortRepository.REPORT, "effort_tracking"),
+    "effort_weekly": CsvExport(
+        "effort_weekly", "effort_weekly_export.csv",
+        ["Project", "Week", "Entries", "Requirements Analysis", "Designing", "Coding", "Testing",
+         "Project Management"],
+        EffortRepository.WEEKLY_REPORT, "effort_weekly"),
+    "risks": CsvExport(
+        "risks", "risks_export.csv",
+        ["Project", "Risk Name", "Description", "Status"],
+        RiskRepository.REPORT, "risks"),
+    "team_members": CsvExport(
+        "team_members", "team_members_export.csv",
+        ["Project", "Name", "Role", "Responsibilities", "Skill Level"],
+        TeamMemberRepository.REPORT, "team_members"),
+}
+
+
+class _ProgressWriter:
+    """Binary file wrapper that counts the lines COPY writes through it"""
+
+    def __init__(self, file, progress, total):
+        self._file = file
+        self._progress = progress
+        self._total = total
+        self._next_report = PROGRESS_EVERY
+        self.rows = 0
+
+    def write(self, data):
+        self._file.write(data)
+        # Quoted values containing newlines make this an overestimate, which is fine for progress
+        self.rows += data.count(b"\n")
+        if self._progress is not None and self.rows >= self._next_report:
+            self._next_report = self.rows + PROGRESS_EVERY
+            self._progress(self.rows, self._total)
+
+
+def export_csv(db, export, path, progress=None):
+    """Stream export to path and return the number of data rows written
+
+    progress(rows_written, estimated_total) is called every PROGRESS_EVERY
+    rows and once at the end; estimated_total is None when unknown. The file
+    is written under a temporary name and only moved into place once the
+    export has finished, so a failed export never leaves a truncated file.
+    """
+    partial_path = path + ".part"
+    try:
+        with db.transaction() as tx:
+            total = tx.query_value(ESTIMATE_ROWS, (export.table,))
+            total = total if total and total > 0 else None
+            # COPY sends bytes in the connection encoding; write the header the same way
+            encoding = extensions.encodings.get(tx.conn.encoding, "utf-8")
+
+            with open(partial_path, "wb") as f:
+                header = io.StringIO()
+                csv.writer(header, lineterminator="\n").writerow(export.header)
+                f.write(header.getvalue().encode(encoding))
+                rows = tx.copy_out(export.statement, _ProgressWriter(f, progress, total))
+        os.replace(partial_path, path)
+    except Exception:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+    if progress is not None:
+        progress(rows, rows)
+    return rows
@@ -0,0 +1,398 @@
+"""
+CSV Import - Bulk load of the CSV files the Exports tab writes
+Files use exactly the layouts in csv_export.CSV_EXPORTS, so an "export all"
+folder can be imported as it is. For each file:
+- rows are read and checked one at a time; project and requirement names
+  are resolved to ids from lookup tables read once per import (an effort
+  line naming a requirement that several in its project share is invalid)
+- valid rows are streamed straight into COPY ... FROM STDIN, filling a
+  temporary staging table, so nothing is held in memory
+- the staging table is merged into the real table: rows whose natural key
+  (e.g. project + risk name) already exists are updated, the rest inserted
+- where the database does not enforce that key (risk, team member and
+  requirement names may repeat within a project), a line whose key repeats
+  in the file or matches several existing rows is reported as invalid, since
+  it cannot tell which row it means
+Everything runs in one transaction. If any row is invalid nothing is kept,
+and a dry run always rolls back, which makes it a full validation pass
+(database constraints included) that reports what an import would do.
+"""
+
+import csv
+import io
+import os
+from datetime import date
+
+from .csv_export import CSV_EXPORTS
+from .database import Statement
+
+# Report progress every this many rows
+PROGRESS_EVERY = 50000
+# Rows per chunk handed to COPY
+CHUNK_ROWS = 1000
+# Error messages kept per file (all errors are counted)
+MAX_ERRORS = 50
+
+RISK_STATUSES = ("low", "medium", "high")
+REQUIREMENT_TYPES = ("functional", "non-functional")
+REQUIREMENT_STATUSES = ("pending", "in progress", "completed", "rejected")
+
+PROJECT_IDS = Statement("import.project_ids", "SELECT project_name, id FROM projects", prepare=False)
+REQUIREMENT_IDS = Statement("import.requirement_ids",
+                            "SELECT project_id, requirement_name, id FROM requirements", prepare=False)
+
+
+class Lookups:
+    """Name -> id maps, re-read after each file so later files can refer to rows imported earlier"""
+
+    def __init__(self):
+        self.projects = {}      # project_name -> id
+        self.requirements = {}  # (project_id, requirement_name) -> id
+        self.ambiguous = {}     # (project_id, requirement_name) -> number of requirements sharing it
+
+    def load(self, tx):
+        self.projects = {name: pid for name, pid in tx.query(PROJECT_IDS)}
+        self.requirements = {}
+        self.ambiguous = {}
+        for pid, name, rid in tx.query(REQUIREMENT_IDS):
+            if (pid, name) in self.requirements:
+                self.ambiguous[pid, name] = self.ambiguous.get((pid, name), 1) + 1
+            self.requirements[pid, name] = rid
+
+    def project_id(self, name):
+        pid = self.projects.get(name)
+        if pid is None:
+            raise ValueError(f"unknown project '{name}'")
+        return pid
+
+    def requirement_id(self, project_name, requirement_name):
+        key = (self.project_id(project_name), requirement_name)
+        if key in self.ambiguous:
+            raise ValueError(f"ambiguous requirement name '{requirement_name}': {self.ambiguous[key]} "
+                             f"requirements in project '{project_name}' have it; rename them before importing")
+        rid = self.requirements.get(key)
+        if rid is None:
+            raise ValueError(f"unknown requirement '{requirement_name}' in project '{project_name}'")
+        return rid
+
+
+def _required(value, what):
+    if not value:
+        raise ValueError(f"{what} is empty")
+    return value
+
+
+def _choice(value, choices, what):
+    if value not in choices:
+        raise ValueError(f"{what} '{value}' is not one of {', '.join(choices)}")
+    return value
+
+
+def _hours(values):
+    """Effort hours as given (empty means 0); raises ValueError for anything else"""
+    hours = []
+    for value in values:
+        try:
+            valid = not value or float(value) >= 0
+        except ValueError:
+            raise ValueError(f"'{value}' is not a number of hours")
+        if not valid:
+            raise ValueError(f"negative hours ({value})")
+        hours.append(value or "0")
+    return hours
+
+
+def _date(value):
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise ValueError(f"'{value}' is not a YYYY-MM-DD date")
+
+
+class CsvImport:
+    """How one export layout is loaded back into its table
+
+    columns  - target columns filled from each CSV row, key columns included
+    key      - columns that identify an existing row to update; the last one is the name
+               shown in error messages
+    convert  - convert(fields, lookups) -> values for columns; raises ValueError
+    unique   - a unique index covers key, so at most one row matches and a key
+               repeated in the file can simply take its last line
+    """
+
+    def __init__(self, name, table, columns, key, convert, unique=False):
+        self.name = name
+        self.export = CSV_EXPORTS[name]
+        self.table = table
+        self.columns = columns
+        self.key = key
+        self.convert = convert
+        self.unique = unique
+
+        staging = f"import_{name}"
+        column_list = ", ".join(columns)
+        values = [c for c in columns if c not in key]
+        matches = " AND ".join(f"t.{c} = s.{c}" for c in key)
+        key_list = ", ".join(key)
+        label = key[-1]
+
+        self.CREATE_STAGING = Statement(f"import.{name}.create", f"""
+            CREATE TEMP TABLE {staging} ON COMMIT DROP AS
+            SELECT 0 AS line, {column_list} FROM {table} WITH NO DATA
+        """, prepare=False)
+        # NULL '\N' keeps empty fields as empty strings; the files have no NULLs
+        self.COPY = Statement(f"import.{name}.copy",
+                              f"COPY {staging} (line, {column_list}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                              prepare=False)
+        # Temporary tables are never auto-analyzed; the merge plans need row estimates
+        self.ANALYZE = Statement(f"import.{name}.analyze", f"ANALYZE {staging}", prepare=False)
+        # Keys that name no single row (only checked when no unique index covers key):
+        # (line, name, first line with the same key) for lines repeating an earlier one ...
+        self.REPEATED = Statement(f"import.{name}.repeated", f"""
+            SELECT line, {label}, first_line
+            FROM (SELECT line, {label}, min(line) OVER (PARTITION BY {key_list}) AS first_line FROM {staging}) d
+            WHERE line > first_line
+        """, prepare=False)
+        # ... and (line, name, matching rows) for lines matching more than one existing row
+        self.AMBIGUOUS = Statement(f"import.{name}.ambiguous", f"""
+            SELECT s.line, s.{label}, count(*)
+            FROM {staging} s
+            JOIN {table} t ON {matches}
+            GROUP BY s.line, s.{label}
+            HAVING count(*) > 1
+        """, prepare=False)
+        # A key repeated within the file: the last line wins (unique keys only)
+        self.DEDUPLICATE = Statement(f"import.{name}.deduplicate", f"""
+            DELETE FROM {staging} t USING {staging} s
+            WHERE {matches} AND t.line < s.line
+        """, prepare=False)
+        self.UPDATE = Statement(f"import.{name}.update", f"""
+            UPDATE {table} t SET {", ".join(f"{c} = s.{c}" for c in values)}
+            FROM {staging} s
+            WHERE {matches}
+        """, prepare=False)
+        self.INSERT = Statement(f"import.{name}.insert", f"""
+            INSERT INTO {table} ({column_list})
+            SELECT {column_list} FROM {staging} s
+            WHERE NOT EXISTS (SELECT 1 FROM {table} t WHERE {matches})
+        """, prepare=False)
+
+
+# Imported in this order, so that e.g. requirements can refer to projects from the same folder
+CSV_IMPORTS = {
+    "projects": CsvImport(
+        "projects", "projects",
+        ("project_name", "owner", "project_description", "project_scope", "target_users",
+         "technology_stack", "platform"),
+        ("project_name",),
+        lambda f, lookups: (_required(f[0], "project name"), *f[1:7]),
+        unique=True),  # idx_projects_name_unique (migration 0008)
+    "requirements": CsvImport(
+        "requirements", "requirements",
+        ("project_id", "requirement_name", "requirement_type", "status", "description"),
+        ("project_id", "requirement_name"),
+        lambda f, lookups: (lookups.project_id(f[0]), _required(f[1], "requirement name"),
+                            _choice(f[2], REQUIREMENT_TYPES, "type"),
+                            _choice(f[3], REQUIREMENT_STATUSES, "status"), f[4])),
+    "team_members": CsvImport(
+        "team_members", "team_members",
+        ("project_id", "name", "role", "responsibilities", "skill_level"),
+        ("project_id", "name"),
+        lambda f, lookups: (lookups.project_id(f[0]), _required(f[1], "name"), f[2], f[3], f[4])),
+    "risks": CsvImport(
+        "risks", "risks",
+        ("project_id", "name", "description", "status"),
+        ("project_id", "name"),
+        lambda f, lookups: (lookups.project_id(f[0]), _required(f[1], "risk name"), f[2],
+                            _choice(f[3], RISK_STATUSES, "status"))),
+    "effort": CsvImport(
+        "effort", "effort_tracking",
+        ("requirement_id", "date", "requirements_analysis", "designing", "coding", "testing",
+         "project_management"),
+        ("requirement_id", "date"),
+        lambda f, lookups: (lookups.requirement_id(f[0], f[1]), _date(f[2]), *_hours(f[3:8])),
+        unique=True),  # effort_tracking_requirement_date_key (migration 0003)
+}
+
+
+class ImportResult:
+    """Outcome of importing one file"""
+
+    def __init__(self, name, path):
+        self.name = name
+        self.path = path
+        self.rows = 0         # Data rows read
+        self.error_count = 0  # Invalid rows
+        self.errors = []      # (line, message), at most MAX_ERRORS
+        self.inserted = 0
+        self.updated = 0
+        self.duplicates = 0   # Lines overridden by a later line with the same key
+
+    def add_error(self, line, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append((line, message))
+
+
+class _ChunkReader:
+    """Read-only file object whose contents are produced by an iterator of strings, on demand"""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._rest = ""
+
+    def read(self, size=-1):
+        parts, length = [self._rest], len(self._rest)
+        while size < 0 or length < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            parts.append(chunk)
+            length += len(chunk)
+        data = "".join(parts)
+        if size < 0:
+            self._rest = ""
+            return data
+        self._rest = data[size:]
+        return data[:size]
+
+
+def _copy_chunks(spec, reader, lookups, result, progress):
+    """Validated rows as CSV text for COPY, CHUNK_ROWS rows at a time"""
+    width = len(spec.export.header)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    pending = 0
+
+    for fields in reader:
+        if not any(fields):
+            continue  # Blank line
+        result.rows += 1
+        line = reader.line_num
+        if len(fields) != width:
+            result.add_error(line, f"expected {width} columns, found {len(fields)}")
+            continue
+        try:
+            values = spec.convert([field.strip() for field in fields], lookups)
+        except ValueError as e:
+            result.add_error(line, str(e))
+            continue
+
+        writer.writerow((line, *values))
+        pending += 1
+        if pending == CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+        if progress is not None and result.rows % PROGRESS_EVERY == 0:
+            progress(spec.name, result.rows)
+
+    if pending:
+        yield buffer.getvalue()
+
+
+def _check_keys(tx, spec, result):
+    """Report lines whose key does not name exactly one row (keys without a unique index)"""
+    errors = [(line, f"'{name}' repeats line {first_line} (same project)")
+              for line, name, first_line in tx.query(spec.REPEATED)]
+    errors += [(line, f"'{name}' matches {count} existing rows in its project; "
+                      "rename them so each name is unique before importing")
+               for line, name, count in tx.query(spec.AMBIGUOUS)]
+    # One error per line, however many reasons it has
+    by_line = {}
+    for line, message in errors:
+        by_line.setdefault(line, []).append(message)
+    for line in sorted(by_line):
+        result.add_error(line, "; ".join(by_line[line]))
+
+
+def _import_file(tx, spec, path, lookups, progress):
+    result = ImportResult(spec.name, path)
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        expected = [h.lower() for h in spec.export.header]
+        if header is None or [h.strip().lower() for h in header] != expected:
+            result.add_error(1, "unexpected columns; expected: " + ", ".join(spec.export.header))
+            return result
+
+        tx.execute(spec.CREATE_STAGING)
+        tx.copy_in(spec.COPY, _ChunkReader(_copy_chunks(spec, reader, lookups, result, progress)))
+
+    if not result.error_count:
+        tx.execute(spec.ANALYZE)
+        if spec.unique:
+            result.duplicates = tx.execute(spec.DEDUPLICATE)
+        else:
+            _check_keys(tx, spec, result)
+    if not result.error_count:
+        # Counts are the rows the statements changed, not the lines staged
+        result.updated = tx.execute(spec.UPDATE)
+        result.inserted = tx.execute(spec.INSERT)
+    if progress is not None:
+        progress(spec.name, result.rows)
+    return result
+
+
+class _Rollback(Exception):
+    pass
+
+
+def import_folder(db, directory, dry_run=False, progress=None):
+    """Import every export file found in directory (see CSV_IMPORTS for the order)
+
+    Returns a list of ImportResult; nothing is written if any row is invalid
+    or dry_run is true. progress(name, rows_read) is called now and then.
+    """
+    paths = {name: os.path.join(directory, spec.export.filename) for name, spec in CSV_IMPORTS.items()}
+    return import_files(db, {name: path for name, path in paths.items() if os.path.exists(path)},
+                        dry_run, progress)
+
+
+def import_files(db, paths, dry_run=False, progress=None):
+    """Import {name: path} files in one transaction; see import_folder()"""
+    results = []
+    lookups = Lookups()
+    try:
+        with db.transaction() as tx:
+            for name, spec in CSV_IMPORTS.items():
+                if name not in paths:
+                    continue
+                lookups.load(tx)
+                results.append(_import_file(tx, spec, paths[name], lookups, progress))
+            if dry_run or any(result.error_count for result in results):
+                raise _Rollback()
+    except _Rollback:
+        pass
+    else:
+        if any(result.name == "projects" for result in results):
+            db.projects.notify_changed()
+    return results
+
+
+def format_report(results, dry_run):
+    """Plain-text summary of an import for the user"""
+    if not results:
+        return "No export files were found."
+    failed = any(result.error_count for result in results)
+    lines = []
+    for result in results:
+        lines.append(f"{os.path.basename(result.path)}: {result.rows:,} rows")
+        if result.error_count:
+            lines.append(f"  {result.error_count:,} invalid rows")
+            for line, message in result.errors:
+                lines.append(f"    line {line}: {message}")
+            if result.error_count > len(result.errors):
+                lines.append(f"    ... and {result.error_count - len(result.errors):,} more")
+        else:
+            verb = "would be" if dry_run else "were"
+            lines.append(f"  {result.inserted:,} {verb} added, {result.updated:,} {verb} updated"
+                         + (f", {result.duplicates:,} repeated lines ignored" if result.duplicates else ""))
+    if failed:
+        lines.append("")
+        lines.append("Nothing was imported. Fix the rows above and try again.")
+    elif dry_run:
+        lines.append("")
+        lines.append("Validation only: nothing was imported.")
+    return "\n".join(lines)
@@ -0,0 +1,1037 @@
+"""
+Database - Data access layer for the Project Management System
+All SQL used by the application lives here, grouped into one repository class
+per table. Statements are prepared once per pooled connection, executed with
+bound parameters, and timed in a single place (Session._run) so slow queries
+can be found and optimized without touching the GUI code.
+"""
+
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+import psycopg2
+from psycopg2 import errors
+from psycopg2.extras import execute_batch, execute_values
+
+from .connection_pool import get_pool
+
+# Queries slower than this are printed to the console
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+
+
+class Statement:
+    """A named SQL statement with %s placeholders
+
+    When prepare is True the statement is sent to the server once per
+    connection as PREPARE <name> and afterwards run with EXECUTE, so Postgres
+    skips parsing and planning on every call.
+    """
+
+    def __init__(self, name, sql, prepare=True):
+        self.name = name
+        self.sql = sql
+        self.prepare = prepare
+        self.param_count = sql.count("%s")
+        self.server_name = "pms_" + re.sub(r"\W", "_", name)
+
+        # PREPARE uses $1..$n positional parameters
+        counter = iter(range(1, self.param_count + 1))
+        self.prepare_sql = "PREPARE %s AS %s" % (
+            self.server_name, re.sub(r"%s", lambda _: "$%d" % next(counter), sql))
+        if self.param_count:
+            self.execute_sql = "EXECUTE %s (%s)" % (self.server_name, ", ".join(["%s"] * self.param_count))
+        else:
+            self.execute_sql = "EXECUTE %s" % self.server_name
+
+    def __repr__(self):
+        return "Statement(%r)" % self.name
+
+
+class QueryStats:
+    """Per-statement call counts and timings, shared by every Session"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, name, elapsed_ms, rows=None):
+        with self._lock:
+            entry = self._stats.setdefault(name, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+            entry["calls"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+        if elapsed_ms >= SLOW_QUERY_MS:
+            suffix = f", {rows} rows" if rows is not None else ""
+            print(f"Slow query {name}: {elapsed_ms:.1f} ms{suffix}")
+
+    def snapshot(self):
+        """Copy of the collected stats, slowest total time first"""
+        with self._lock:
+            items = [(name, dict(entry)) for name, entry in self._stats.items()]
+        items.sort(key=lambda item: item[1]["total_ms"], reverse=True)
+        return items
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+query_stats = QueryStats()
+
+
+class Session:
+    """Runs statements on one checked-out connection"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        # Prepared statement names are tracked on the connection itself (see
+        # AppConnection) so they survive the connection going back to the pool.
+        # Connections created elsewhere simply run statements unprepared.
+        self.prepared = getattr(conn, "prepared_statements", None)
+
+    def query(self, statement, params=()):
+        """Run a statement and return all rows"""
+        return self._run(statement, params, lambda cur: cur.fetchall())
+
+    def query_one(self, statement, params=()):
+        """Run a statement and return the first row (or None)"""
+        return self._run(statement, params, lambda cur: cur.fetchone())
+
+    def query_value(self, statement, params=()):
+        """Run a statement and return the first column of the first row"""
+        row = self.query_one(statement, params)
+        return row[0] if row else None
+
+    def execute(self, statement, params=()):
+        """Run a statement and return the affected row count"""
+        return self._run(statement, params, lambda cur: cur.rowcount)
+
+    def execute_many(self, statement, rows, page_size=100):
+        """Run a statement once per parameter tuple, batched into few round trips"""
+        rows = list(rows)
+        if not rows:
+            return 0
+        return self._run(statement, rows, lambda cur: len(rows), many=page_size)
+
+    def copy_out(self, statement, file):
+        """Stream the result of a parameterless statement to file as CSV via COPY ... TO STDOUT
+
+        Rows are written to file as the server sends them, so nothing is
+        buffered in memory. Returns the number of rows copied.
+        """
+        cur = self.conn.cursor()
+        try:
+            start = time.perf_counter()
+            cur.copy_expert("COPY (%s) TO STDOUT WITH (FORMAT csv)" % statement.sql.strip(), file)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            query_stats.record(statement.name + ".copy", elapsed_ms, cur.rowcount if cur.rowcount >= 0 else None)
+            return cur.rowcount
+        finally:
+            cur.close()
+
+    def execute_values(self, statement, rows, page_size=100):
+        """Run an "INSERT ... VALUES %s" statement for many rows in a few round trips
+
+        Rows are sent as multi-row VALUES lists of page_size rows each. Returns
+        the rows produced by the statement's RETURNING clause (if any).
+        """
+        rows = list(rows)
+        if not rows:
+            return []
+        cur = self.conn.cursor()
+        try:
+            start = time.perf_counter()
+            result = execute_values(cur, statement.sql, rows, page_size=page_size, fetch=True)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            query_stats.record(statement.name, elapsed_ms, len(rows))
+            return result
+        finally:
+            cur.close()
+
+    def copy_in(self, statement, file):
+        """Load rows into a table with a "COPY ... FROM STDIN" statement, reading them from file
+
+        file only needs a read(size) method, so rows can be produced while
+        COPY consumes them. Returns the number of rows loaded.
+        """
+        cur = self.conn.cursor()
+        try:
+            start = time.perf_counter()
+            cur.copy_expert(statement.sql, file)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            query_stats.record(statement.name, elapsed_ms, cur.rowcount if cur.rowcount >= 0 else None)
+            return cur.rowcount
+        finally:
+            cur.close()
+
+    def _run(self, statement, params, collect, many=None):
+        if isinstance(statement, str):
+            statement = Statement("adhoc", statement, prepare=False)
+
+        cur = self.conn.cursor()
+        try:
+            sql = statement.sql
+            if statement.prepare and self.prepared is not None:
+                self._ensure_prepared(cur, statement)
+                sql = statement.execute_sql
+
+            start = time.perf_counter()
+            try:
+                if many:
+                    execute_batch(cur, sql, params, page_size=many)
+                else:
+                    cur.execute(sql, params or None)
+                result = collect(cur)
+            except errors.InvalidSqlStatementName:
+                # The server forgot the statement (e.g. after DISCARD ALL) - re-prepare next time
+                if self.prepared is not None:
+                    self.prepared.discard(statement.name)
+                raise
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            query_stats.record(statement.name, elapsed_ms, cur.rowcount if cur.rowcount >= 0 else None)
+            return result
+        finally:
+            cur.close()
+
+    def _ensure_prepared(self, cur, statement):
+        if statement.name not in self.prepared:
+            cur.execute(statement.prepare_sql)
+            self.prepared.add(statement.name)
+
+
+class Database:
+    """Entry point to the data access layer
+
+    Repositories are available as attributes (db.projects, db.risks, ...).
+    Each repository call checks a connection out of the shared pool, runs in
+    its own transaction and returns plain tuples. Use transaction() to group
+    several calls into one unit of work.
+    """
+
+    def __init__(self, pool=None):
+        self._pool = pool
+        self._conn = None  # held between connect() / disconnect()
+
+        self.projects = ProjectRepository(self)
+        self.team_members = TeamMemberRepository(self)
+        self.risks = RiskRepository(self)
+        self.requirements = RequirementRepository(self)
+        self.effort = EffortRepository(self)
+        self.users = UserRepository(self)
+        self.search = SearchRepository(self)
+
+    @property
+    def pool(self):
+        return self._pool or get_pool()
+
+    @contextmanager
+    def transaction(self):
+        """Yield a Session; commit on success, roll back on error"""
+        if self._conn is not None:
+            # Reuse the connection opened with connect()
+            session = Session(self._conn.raw)
+            try:
+                yield session
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+            return
+
+        conn = self.pool.connection()
+        try:
+            session = Session(conn.raw)
+            yield session
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def query(self, statement, params=()):
+        with self.transaction() as tx:
+            return tx.query(statement, params)
+
+    def query_one(self, statement, params=()):
+        with self.transaction() as tx:
+            return tx.query_one(statement, params)
+
+    def query_value(self, statement, params=()):
+        with self.transaction() as tx:
+            return tx.query_value(statement, params)
+
+    def execute(self, statement, params=()):
+        with self.transaction() as tx:
+            return tx.execute(statement, params)
+
+    def execute_many(self, statement, rows, page_size=100):
+        with self.transaction() as tx:
+            return tx.execute_many(statement, rows, page_size)
+
+    def copy_out(self, statement, file):
+        with self.transaction() as tx:
+            return tx.copy_out(statement, file)
+
+    def execute_values(self, statement, rows, page_size=100):
+        with self.transaction() as tx:
+            return tx.execute_values(statement, rows, page_size)
+
+    # --- Compatibility API used by src/views ---
+
+    def connect(self):
+        """Hold one pooled connection until disconnect() is called"""
+        if self._conn is None:
+            self._conn = self.pool.connection()
+
+    def disconnect(self):
+        """Return the held connection to the pool"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def fetch_all(self, query, params=None):
+        """Run raw SQL and return all rows"""
+        return self.query(query, params or ())
+
+    def execute_query(self, query, params=None):
+        """Run raw SQL; returns True on success, False (and prints the error) on failure"""
+        try:
+            self.execute(query, params or ())
+            return True
+        except psycopg2.Error as e:
+            print(f"Database error: {e}")
+            return False
+
+
+class Repository:
+    """Base class for the per-table repositories"""
+
+    def __init__(self, db):
+        self.db = db
+
+
+# === KEYSET PAGINATION ===
+
+class KeysetQuery:
+    """Statements for reading one filtered query a page at a time
+
+    Pages are read with "key > last key of the previous page ORDER BY key
+    LIMIT n", which is an index range scan no matter how deep the page is,
+    rather than OFFSET, which reads and discards every row in front of it.
+    key may be a tuple of columns (compared as a row, key_index then gives
+    their positions) and descending reverses the order of all of them.
+    """
+
+    def __init__(self, name, columns, table, where, key, key_index=0, descending=False):
+        keys = (key,) if isinstance(key, str) else tuple(key)
+        # Positions of the key columns in the selected columns
+        self.key_indexes = (key_index,) if isinstance(key_index, int) else tuple(key_index)
+        key_list = ", ".join(keys)
+        order = ", ".join(f"{k} DESC" for k in keys) if descending else key_list
+        compare = "<" if descending else ">"
+        before_compare = ">" if descending else "<"
+        if len(keys) == 1:
+            after = f"{key_list} {compare} %s"
+            before = f"{key_list} {before_compare} %s"
+        else:
+            placeholders = ", ".join(["%s"] * len(keys))
+            after = f"({key_list}) {compare} ({placeholders})"
+            before = f"({key_list}) {before_compare} ({placeholders})"
+
+        self.COUNT = Statement(f"{name}.count", f"SELECT count(*) FROM {table} WHERE {where}")
+        self.FIRST = Statement(f"{name}.first",
+                               f"SELECT {columns} FROM {table} WHERE {where} ORDER BY {order} LIMIT %s")
+        self.AFTER = Statement(f"{name}.after",
+                               f"SELECT {columns} FROM {table} WHERE {where} AND {after} ORDER BY {order} LIMIT %s")
+        # Only needed when jumping to a page whose predecessor was never read
+        self.KEY_AT = Statement(f"{name}.key_at",
+                                f"SELECT {key_list} FROM {table} WHERE {where} ORDER BY {order} OFFSET %s LIMIT 1")
+        # Position of a key in the result, for scrolling straight to one row
+        self.INDEX_OF = Statement(f"{name}.index_of", f"SELECT count(*) FROM {table} WHERE {where} AND {before}")
+
+    def bind(self, db, *params):
+        return PagedResult(db, self, params)
+
+
+class PagedResult:
+    """One keyset-paged result set, e.g. the risks of a single project
+
+    Remembers the last key of every page it has returned, so reading the next
+    page (the common case while scrolling) never needs an OFFSET. Safe to use
+    from several worker threads at once.
+    """
+
+    def __init__(self, db, query, params):
+        self.db = db
+        self.query = query
+        self.params = tuple(params)
+        self._anchors = {}  # row offset -> key (tuple) of the row just before it
+        self._lock = threading.Lock()
+
+    def count(self):
+        return self.db.query_value(self.query.COUNT, self.params)
+
+    def fetch(self, start, limit):
+        """Rows start .. start + limit - 1 (fewer at the end of the result)"""
+        if start == 0:
+            rows = self.db.query(self.query.FIRST, self.params + (limit,))
+        else:
+            with self._lock:
+                anchor = self._anchors.get(start)
+            if anchor is None:
+                anchor = self.db.query_one(self.query.KEY_AT, self.params + (start - 1,))
+                if anchor is None:
+                    return []
+            rows = self.db.query(self.query.AFTER, self.params + tuple(anchor) + (limit,))
+
+        if rows:
+            with self._lock:
+                self._anchors[start + len(rows)] = tuple(rows[-1][i] for i in self.query.key_indexes)
+        return rows
+
+    def index_of(self, key):
+        """Index the row with this key has (or would have) in the result; key is a tuple for tuple keys"""
+        key = tuple(key) if isinstance(key, (tuple, list)) else (key,)
+        return self.db.query_value(self.query.INDEX_OF, self.params + key)
+
+    def removed(self, index):
+        """Row index was deleted: every remembered page start after it moves up by one"""
+        with self._lock:
+            self._anchors = {start - 1 if start > index + 1 else start: key
+                             for start, key in self._anchors.items() if start != index + 1}
+
+
+# === PROJECTS ===
+
+class ProjectRepository(Repository):
+    LIST_NAMES = Statement("projects.list_names", "SELECT id, project_name FROM projects")
+    # id and version come first; the version is what update() and delete() check
+    LIST_ALL = Statement("projects.list_all", """
+        SELECT id, version, project_name, owner, project_description, project_scope, target_users,
+               technology_stack, platform
+        FROM projects
+        ORDER BY project_name
+    """)
+    REPORT = Statement("projects.report", """
+        SELECT project_name, owner, project_description, project_scope, target_users,
+               technology_stack, platform
+        FROM projects
+        ORDER BY project_name
+    """)
+    INSERT = Statement("projects.insert", """
+        INSERT INTO projects (project_name, owner, project_description, project_scope, target_users, technology_stack, platform)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        RETURNING id
+    """)
+    # Optimistic concurrency: only the version the client read is written; a
+    # trigger moves the version on (migration 0008)
+    UPDATE = Statement("projects.update", """
+        UPDATE projects
+        SET project_name = %s,
+            owner = %s,
+            project_description = %s,
+            project_scope = %s,
+            target_users = %s,
+            technology_stack = %s,
+            platform = %s
+        WHERE id = %s AND version = %s
+        RETURNING version
+    """)
+    DELETE = Statement("projects.delete", "DELETE FROM projects WHERE id = %s AND version = %s")
+
+    def __init__(self, db):
+        super().__init__(db)
+        self._listeners = []
+
+    def add_listener(self, callback):
+        """Call callback() after every committed insert, update or delete"""
+        self._listeners.append(callback)
+
+    def notify_changed(self):
+        """Tell the listeners; also used after bulk writes that bypass this repository"""
+        for callback in list(self._listeners):
+            callback()
+
+    def list_names(self):
+        """(id, project_name) for every project"""
+        return self.db.query(self.LIST_NAMES)
+
+    def list_all(self):
+        return self.db.query(self.LIST_ALL)
+
+    def report_rows(self):
+        return self.db.query(self.REPORT)
+
+    def insert(self, data):
+        """Insert a project and return its id; raises errors.UniqueViolation if the name is taken"""
+        project_id = self.db.query_value(self.INSERT, data)
+        self.notify_changed()
+        return project_id
+
+    def insert_many(self, rows):
+        count = self.db.execute_many(self.INSERT, rows)
+        self.notify_changed()
+        return count
+
+    def update(self, project_id, version, data):
+        """Write the 7 field values if the project is still at version
+
+        Returns the new version, or None if the project was changed or
+        deleted since it was read.
+        """
+        new_version = self.db.query_value(self.UPDATE, (*data, project_id, version))
+        if new_version is not None:
+            self.notify_changed()
+        return new_version
+
+    def delete(self, project_id, version):
+        """Delete the project if it is still at version; returns False if it was changed or deleted meanwhile"""
+        count = self.db.execute(self.DELETE, (project_id, version))
+        if count:
+            self.notify_changed()
+        return count > 0
+
+
+# === TEAM MEMBERS ===
+
+class TeamMemberRepository(Repository):
+    BY_PROJECT = Statement("team_members.by_project", """
+        SELECT id, name, role, responsibilities, skill_level
+        FROM team_members
+        WHERE project_id = %s
+    """)
+    REPORT = Statement("team_members.report", """
+        SELECT p.project_name, t.name, t.role, t.responsibilities, t.skill_level
+        FROM team_members t
+        JOIN projects p ON t.project_id = p.id
+        ORDER BY p.project_name, t.name
+    """)
+    INSERT = Statement("team_members.insert", """
+        INSERT INTO team_members (project_id, name, role, responsibilities, skill_level)
+        VALUES (%s, %s, %s, %s, %s)
+        RETURNING id, name, role, responsibilities, skill_level
+    """)
+    UPDATE = Statement("team_members.update", """
+        UPDATE team_members
+        SET name = %s, role = %s, responsibilities = %s, skill_level = %s
+        WHERE id = %s
+        RETURNING id, name, role, responsibilities, skill_level
+    """)
+    DELETE = Statement("team_members.delete", "DELETE FROM team_members WHERE id = %s")
+    BY_IDS = Statement("team_members.by_ids", """
+        SELECT id, name, role, responsibilities, skill_level
+        FROM team_members
+        WHERE id = ANY(%s)
+    """)
+    PAGED = KeysetQuery("team_members.paged", "id, name, role, responsibilities, skill_level",
+                        "team_members", "project_id = %s", "id")
+
+    def by_project(self, project_id):
+        return self.db.query(self.BY_PROJECT, (project_id,))
+
+    def paged_by_project(self, project_id):
+        """Team members of one project, read a page at a time in id order"""
+        return self.PAGED.bind(self.db, project_id)
+
+    def by_ids(self, member_ids):
+        """Members with these ids as paged_by_project() lists them (deleted ones are missing)"""
+        return self.db.query(self.BY_IDS, (list(member_ids),))
+
+    def insert(self, project_id, name, role, responsibilities, skill_level):
+        """Insert a member and return the new row as paged_by_project() lists it"""
+        return self.db.query_one(self.INSERT, (project_id, name, role, responsibilities, skill_level))
+
+    def insert_many(self, rows):
+        return self.db.execute_many(self.INSERT, rows)
+
+    def update(self, member_id, name, role, responsibilities, skill_level):
+        """Update a member and return the changed row, or None if it no longer exists"""
+        return self.db.query_one(self.UPDATE, (name, role, responsibilities, skill_level, member_id))
+
+    def delete(self, member_id):
+        return self.db.execute(self.DELETE, (member_id,))
+
+
+# === RISKS ===
+
+class RiskRepository(Repository):
+    BY_PROJECT = Statement("risks.by_project", "SELECT id, name, description, status FROM risks WHERE project_id = %s")
+    # priority is generated as impact * probability (migration 0006)
+    MATRIX_BY_PROJECT = Statement("risks.matrix_by_project", """
+        SELECT id, name, description, status, impact, probability, priority
+        FROM risks
+        WHERE project_id = %s
+    """)
+    TOP = Statement("risks.top", """
+        SELECT p.project_name, r.name, r.status, r.impact, r.probability, r.priority
+        FROM risks r
+        JOIN projects p ON r.project_id = p.id
+        ORDER BY r.priority DESC, r.id DESC
+        LIMIT %s
+    """)
+    TOP_WITH_STATUS = Statement("risks.top_with_status", """
+        SELECT p.project_name, r.name, r.status, r.impact, r.probability, r.priority
+        FROM risks r
+        JOIN projects p ON r.project_id = p.id
+        WHERE r.status = %s
+        ORDER BY r.priority DESC, r.id DESC
+        LIMIT %s
+    """)
+    REPORT = Statement("risks.report", """
+        SELECT p.project_name, r.name, r.description, r.status
+        FROM risks r
+        JOIN projects p ON r.project_id = p.id
+        ORDER BY p.project_name, r.name
+    """)
+    INSERT = Statement("risks.insert", """
+        INSERT INTO risks (project_id, name, description, status, impact, probability)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        RETURNING id, name, description, status, impact, probability, priority
+    """)
+    UPDATE = Statement("risks.update", """
+        UPDATE risks SET name = %s, description = %s, status = %s, impact = %s, probability = %s
+        WHERE id = %s
+        RETURNING id, name, description, status, impact, probability, priority
+    """)
+    DELETE = Statement("risks.delete", "DELETE FROM risks WHERE id = %s")
+
+    # Risk List paging: one KeysetQuery per sort order and set of filters in use
+    PAGED_COLUMNS = "id, name, description, status, impact, probability, priority"
+    SORTS = {
+        "entry": ("id", 0, False),                           # Order of entry
+        "priority": (("priority", "id"), (6, 0), True),      # Highest priority first
+    }
+    FILTERS = {"status": "status = %s", "impact": "impact = %s", "probability": "probability = %s"}
+    BY_IDS = Statement("risks.by_ids", f"SELECT {PAGED_COLUMNS} FROM risks WHERE id = ANY(%s)")
+    _paged_queries = {}
+
+    def by_project(self, project_id):
+        return self.db.query(self.BY_PROJECT, (project_id,))
+
+    def paged_by_project(self, project_id, sort="entry", **filters):
+        """Risks of one project, read a page at a time
+
+        sort is a key of SORTS; filters are FILTERS names with the value to
+        match (None means no filter), e.g. status="high", impact=4.
+        """
+        active = tuple(name for name in self.FILTERS if filters.get(name) is not None)
+        key = (sort, active)
+        query = self._paged_queries.get(key)
+        if query is None:
+            columns, indexes, descending = self.SORTS[sort]
+            where = " AND ".join(["project_id = %s"] + [self.FILTERS[name] for name in active])
+            query = KeysetQuery("risks.paged." + ".".join((sort,) + active), self.PAGED_COLUMNS, "risks",
+                                where, columns, indexes, descending)
+            self._paged_queries[key] = query
+        return query.bind(self.db, project_id, *(filters[name] for name in active))
+
+    def by_ids(self, risk_ids):
+        """Risks with these ids as paged_by_project() lists them (deleted ones are missing)"""
+        return self.db.query(self.BY_IDS, (list(risk_ids),))
+
+    def matrix_by_project(self, project_id):
+        return self.db.query(self.MATRIX_BY_PROJECT, (project_id,))
+
+    def top(self, limit, status=None):
+        """The limit highest-priority risks over all projects, with their project names"""
+        if status is None:
+            return self.db.query(self.TOP, (limit,))
+        return self.db.query(self.TOP_WITH_STATUS, (status, limit))
+
+    def report_rows(self):
+        return self.db.query(self.REPORT)
+
+    def insert(self, project_id, name, description, status, impact=3, probability=3):
+        """Insert a risk and return the new row as paged_by_project() lists it"""
+        return self.db.query_one(self.INSERT, (project_id, name, description, status, impact, probability))
+
+    def insert_many(self, rows):
+        """rows = (project_id, name, description, status, impact, probability) tuples"""
+        return self.db.execute_many(self.INSERT, rows)
+
+    def update(self, risk_id, name, description, status, impact, probability):
+        """Update a risk and return the changed row, or None if it no longer exists"""
+        return self.db.query_one(self.UPDATE, (name, description, status, impact, probability, risk_id))
+
+    def delete(self, risk_id):
+        return self.db.execute(self.DELETE, (risk_id,))
+
+
+# === REQUIREMENTS ===
+
+class RequirementRepository(Repository):
+    BY_PROJECT = Statement("requirements.by_project", """
+        SELECT id, requirement_name, requirement_type, status, description
+        FROM requirements
+        WHERE project_id = %s
+    """)
+    NAMES_BY_PROJECT = Statement("requirements.names_by_project",
+                                 "SELECT id, requirement_name FROM requirements WHERE project_id = %s")
+    REPORT = Statement("requirements.report", """
+        SELECT p.project_name, r.requirement_name, r.requirement_type, r.status, r.description
+        FROM requirements r
+        JOIN projects p ON r.project_id = p.id
+        ORDER BY p.project_name, r.requirement_name
+    """)
+    INSERT = Statement("requirements.insert", """
+        INSERT INTO requirements (project_id, requirement_name, description, requirement_type, status)
+        VALUES (%s, %s, %s, %s, %s)
+        RETURNING id, requirement_name, status, description, requirement_type
+    """)
+    UPDATE = Statement("requirements.update", """
+        UPDATE requirements
+        SET requirement_name = %s, requirement_type = %s, status = %s, description = %s
+        WHERE id = %s
+        RETURNING id, requirement_name, status, description, requirement_type
+    """)
+    DELETE = Statement("requirements.delete", "DELETE FROM requirements WHERE id = %s")
+    BY_IDS = Statement("requirements.by_ids", """
+        SELECT id, requirement_name, status, description, requirement_type
+        FROM requirements
+        WHERE id = ANY(%s)
+    """)
+    PAGED = KeysetQuery("requirements.paged", "id, requirement_name, status, description", "requirements",
+                        "project_id = %s AND requirement_type = %s", "id")
+
+    def by_project(self, project_id):
+        return self.db.query(self.BY_PROJECT, (project_id,))
+
+    def paged_by_project(self, project_id, requirement_type):
+        """Requirements of one project and type, read a page at a time in id order"""
+        return self.PAGED.bind(self.db, project_id, requirement_type)
+
+    def by_ids(self, requirement_ids):
+        """Requirements with these ids as paged_by_project() lists them, plus their type"""
+        return self.db.query(self.BY_IDS, (list(requirement_ids),))
+
+    def names_by_project(self, project_id):
+        """(id, requirement_name) for every requirement of a project"""
+        return self.db.query(self.NAMES_BY_PROJECT, (project_id,))
+
+    def report_rows(self):
+        return self.db.query(self.REPORT)
+
+    def insert(self, project_id, name, description, requirement_type, status):
+        """Insert a requirement; returns the new row as paged_by_project() lists it, plus its type"""
+        return self.db.query_one(self.INSERT, (project_id, name, description, requirement_type, status))
+
+    def insert_many(self, rows):
+        return self.db.execute_many(self.INSERT, rows)
+
+    def update(self, requirement_id, name, requirement_type, status, description):
+        """Update a requirement; returns the row plus its type, or None if it no longer exists"""
+        return self.db.query_one(self.UPDATE, (name, requirement_type, status, description, requirement_id))
+
+    def delete(self, requirement_id):
+        return self.db.execute(self.DELETE, (requirement_id,))
+
+
+# === EFFORT TRACKING ===
+
+class EffortRepository(Repository):
+    BY_REQUIREMENT = Statement("effort.by_requirement", """
+        SELECT date, requirements_analysis, designing, coding, testing, project_management
+        FROM effort_tracking
+        WHERE requirement_id = %s
+        ORDER BY date
+    """)
+    # effort_totals / effort_weekly are kept up to date by triggers (migration 0005)
+    TOTALS = Statement("effort.totals", """
+        SELECT requirements_analysis, designing, coding, testing, project_management
+        FROM effort_totals
+        WHERE requirement_id = %s
+    """)
+    PROJECT_TOTALS = Statement("effort.project_totals", """
+        SELECT
+            COALESCE(SUM(t.requirements_analysis), 0),
+            COALESCE(SUM(t.designing), 0),
+            COALESCE(SUM(t.coding), 0),
+            COALESCE(SUM(t.testing), 0),
+            COALESCE(SUM(t.project_management), 0)
+        FROM effort_totals t
+        JOIN requirements r ON t.requirement_id = r.id
+        WHERE r.project_id = %s
+    """)
+    WEEKLY_BY_PROJECT = Statement("effort.weekly_by_project", """
+        SELECT w.week, SUM(w.requirements_analysis), SUM(w.designing), SUM(w.coding),
+               SUM(w.testing), SUM(w.project_management)
+        FROM effort_weekly w
+        JOIN requirements r ON w.requirement_id = r.id
+        WHERE r.project_id = %s
+        GROUP BY w.week
+        ORDER BY w.week
+    """)
+    # Dashboard input: plain numbers (float hours, week as days since 1970-01-01) load straight into arrays
+    DASHBOARD = Statement("effort.dashboard", """
+        SELECT w.requirement_id, w.week - DATE '1970-01-01', w.entries,
+               w.requirements_analysis::float8, w.designing::float8, w.coding::float8,
+               w.testing::float8, w.project_management::float8
+        FROM effort_weekly w
+        JOIN requirements r ON w.requirement_id = r.id
+        WHERE r.project_id = %s
+    """)
+    WEEKLY_REPORT = Statement("effort.weekly_report", """
+        SELECT p.project_name, w.week, SUM(w.entries),
+               SUM(w.requirements_analysis), SUM(w.designing), SUM(w.coding),
+               SUM(w.testing), SUM(w.project_management)
+        FROM effort_weekly w
+        JOIN requirements r ON w.requirement_id = r.id
+        JOIN projects p ON r.project_id = p.id
+        GROUP BY p.project_name, w.week
+        ORDER BY p.project_name, w.week
+    """)
+    REPORT = Statement("effort.report", """
+        SELECT p.project_name, r.requirement_name, e.date,
+               e.requirements_analysis, e.designing, e.coding,
+               e.testing, e.project_management
+        FROM effort_tracking e
+        JOIN requirements r ON e.requirement_id = r.id
+        JOIN projects p ON r.project_id = p.id
+        ORDER BY p.project_name, r.requirement_name, e.date
+    """)
+    INSERT = Statement("effort.insert", """
+        INSERT INTO effort_tracking (requirement_id, date, requirements_analysis, designing, coding, testing, project_management)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+    """)
+    # A day that already has an entry is left alone; only inserted rows come back
+    INSERT_NEW = Statement("effort.insert_new", """
+        INSERT INTO effort_tracking (requirement_id, date, requirements_analysis, designing, coding, testing, project_management)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        ON CONFLICT (requirement_id, date) DO NOTHING
+        RETURNING date, requirements_analysis, designing, coding, testing, project_management
+    """)
+    # Batch saves (execute_values); "inserted" is false for rows that replaced an existing entry
+    SAVE_BATCH_KEEP = Statement("effort.save_batch_keep", """
+        INSERT INTO effort_tracking (requirement_id, date, requirements_analysis, designing, coding, testing, project_management)
+        VALUES %s
+        ON CONFLICT (requirement_id, date) DO NOTHING
+        RETURNING (xmax = 0) AS inserted
+    """, prepare=False)
+    SAVE_BATCH_REPLACE = Statement("effort.save_batch_replace", """
+        INSERT INTO effort_tracking (requirement_id, date, requirements_analysis, designing, coding, testing, project_management)
+        VALUES %s
+        ON CONFLICT (requirement_id, date) DO UPDATE
+        SET requirements_analysis = EXCLUDED.requirements_analysis,
+            designing = EXCLUDED.designing,
+            coding = EXCLUDED.coding,
+            testing = EXCLUDED.testing,
+            project_management = EXCLUDED.project_management
+        RETURNING (xmax = 0) AS inserted
+    """, prepare=False)
+    # Deletes hand back the full rows, so they can be put back with restore()
+    DELETED_COLUMNS = """id, project_id, requirement_id, date, requirements_analysis, designing, coding,
+                         testing, project_management"""
+    DELETE_MANY = Statement("effort.delete_many",
+                            f"DELETE FROM effort_tracking WHERE id = ANY(%s) RETURNING {DELETED_COLUMNS}")
+    DELETE_FOR_REQUIREMENT = Statement("effort.delete_for_requirement",
+                                       f"DELETE FROM effort_tracking WHERE requirement_id = %s RETURNING {DELETED_COLUMNS}")
+    # Original ids are reused; a day entered again in the meantime keeps the new entry
+    RESTORE = Statement("effort.restore", f"""
+        INSERT INTO effort_tracking ({DELETED_COLUMNS})
+        VALUES %s
+        ON CONFLICT DO NOTHING
+        RETURNING id
+    """, prepare=False)
+    # (requirement_id, date) is unique, so the date alone is a valid page key
+    PAGED_COLUMNS = "id, date, requirements_analysis, designing, coding, testing, project_management"
+    PAGED = KeysetQuery("effort.paged", PAGED_COLUMNS, "effort_tracking", "requirement_id = %s", "date", key_index=1)
+    BY_IDS = Statement("effort.by_ids", f"SELECT {PAGED_COLUMNS} FROM effort_tracking WHERE id = ANY(%s)")
+
+    def by_requirement(self, requirement_id):
+        return self.db.query(self.BY_REQUIREMENT, (requirement_id,))
+
+    def paged_by_requirement(self, requirement_id):
+        """Effort entries (id, date, 5 category hours) of one requirement, read a page at a time in date order"""
+        return self.PAGED.bind(self.db, requirement_id)
+
+    def by_ids(self, entry_ids):
+        """Entries with these ids as paged_by_requirement() lists them (deleted ones are missing)"""
+        return self.db.query(self.BY_IDS, (list(entry_ids),))
+
+    def totals(self, requirement_id):
+        """Summed hours per category for one requirement"""
+        return self.db.query_one(self.TOTALS, (requirement_id,)) or (0, 0, 0, 0, 0)
+
+    def project_totals(self, project_id):
+        """Summed hours per category over all requirements of a project"""
+        return self.db.query_one(self.PROJECT_TOTALS, (project_id,))
+
+    def weekly_by_project(self, project_id):
+        """(week, 5 category hours) rows for a project, oldest week first"""
+        return self.db.query(self.WEEKLY_BY_PROJECT, (project_id,))
+
+    def dashboard_rows(self, project_id):
+        """(requirement_id, week as days since epoch, entries, 5 category hours) per requirement and week"""
+        return self.db.query(self.DASHBOARD, (project_id,))
+
+    def report_rows(self):
+        return self.db.query(self.REPORT)
+
+    def weekly_report_rows(self):
+        return self.db.query(self.WEEKLY_REPORT)
+
+    def insert(self, requirement_id, date, hours):
+        """Add one day's entry; returns the new row, or None if that day already has an entry"""
+        return self.db.query_one(self.INSERT_NEW, (requirement_id, date, *hours))
+
+    def insert_many(self, rows):
+        """rows = (requirement_id, date, 5 category hours) tuples"""
+        return self.db.execute_many(self.INSERT, rows)
+
+    def save_batch(self, rows, replace=False):
+        """Save many (requirement_id, date, 5 category hours) rows in one transaction
+
+        Days that already have an entry are overwritten when replace is true
+        and skipped otherwise. (requirement_id, date) must be unique within
+        rows. Returns (inserted, replaced, skipped) counts.
+        """
+        rows = list(rows)
+        statement = self.SAVE_BATCH_REPLACE if replace else self.SAVE_BATCH_KEEP
+        results = self.db.execute_values(statement, rows)
+        inserted = sum(1 for (is_new,) in results if is_new)
+        replaced = len(results) - inserted
+        return inserted, replaced, len(rows) - len(results)
+
+    def delete_many(self, entry_ids):
+        """Delete entries by id in one statement; returns the deleted rows for restore()"""
+        return self.db.query(self.DELETE_MANY, (list(entry_ids),))
+
+    def delete_for_requirement(self, requirement_id):
+        """Delete every entry of a requirement; returns the deleted rows for restore()"""
+        return self.db.query(self.DELETE_FOR_REQUIREMENT, (requirement_id,))
+
+    def restore(self, rows):
+        """Insert rows returned by a delete again; returns how many were restored"""
+        return len(self.db.execute_values(self.RESTORE, rows))
+
+
+# === SEARCH ===
+
+def search_query(text):
+    """to_tsquery() input matching every word of text as a prefix, or None if text has no words
+
+    Only word characters are kept, so whatever the user types the result is
+    valid tsquery syntax.
+    """
+    words = re.findall(r"\w+", text)
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+class SearchRepository(Repository):
+    """Ranked full-text search over the search columns of migration 0007"""
+
+    # Every table is searched through its GIN index and the hits are ranked
+    # together; snippets are only built for the page being returned.
+    # Result rows: (kind, id, project_id, project_name, title, detail, snippet)
+    # where detail is the requirement type, risk status or member role.
+    SEARCH = Statement("search.search", """
+        WITH q AS (SELECT to_tsquery('english', %s) AS query),
+        hits AS (
+            SELECT 'project' AS kind, p.id, p.id AS project_id, p.project_name AS title,
+                   NULL AS detail, p.project_description AS body, ts_rank(p.search, q.query) AS rank
+            FROM projects p, q
+            WHERE p.search @@ q.query
+            UNION ALL
+            SELECT 'requirement', r.id, r.project_id, r.requirement_name,
+                   r.requirement_type, r.description, ts_rank(r.search, q.query)
+            FROM requirements r, q
+            WHERE r.search @@ q.query
+            UNION ALL
+            SELECT 'risk', k.id, k.project_id, k.name, k.status, k.description, ts_rank(k.search, q.query)
+            FROM risks k, q
+            WHERE k.search @@ q.query
+            UNION ALL
+            SELECT 'team_member', t.id, t.project_id, t.name, t.role, t.responsibilities, ts_rank(t.search, q.query)
+            FROM team_members t, q
+            WHERE t.search @@ q.query
+        ),
+        page AS (
+            SELECT * FROM hits
+            ORDER BY rank DESC, kind, id
+            LIMIT %s OFFSET %s
+        )
+        SELECT page.kind, page.id, page.project_id, p.project_name, page.title, page.detail,
+               ts_headline('english', coalesce(page.body, ''), q.query,
+                           'MaxWords=15, MinWords=5, MaxFragments=1, StartSel=[, StopSel=]')
+        FROM page
+        CROSS JOIN q
+        LEFT JOIN projects p ON p.id = page.project_id
+        ORDER BY page.rank DESC, page.kind, page.id
+    """)
+
+    def search(self, text, limit=50, offset=0):
+        """One page of hits for text, best match first; [] if text has nothing to search for"""
+        query = search_query(text)
+        if query is None:
+            return []
+        return self.db.query(self.SEARCH, (query, limit, offset))
+
+
+# === USERS ===
+
+class UserRepository(Repository):
+    TABLE_EXISTS = Statement("users.table_exists", """
+        SELECT EXISTS (
+            SELECT FROM information_schema.tables
+            WHERE table_name = 'users'
+        )
+    """, prepare=False)
+    CREATE_TABLE = Statement("users.create_table", """
+        CREATE TABLE users (
+            id SERIAL PRIMARY KEY,
+            username VARCHAR(50) UNIQUE NOT NULL,
+            password_hash VARCHAR(128) NOT NULL,
+            role VARCHAR(20) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """, prepare=False)
+    FIND_LOGIN = Statement("users.find_login", """
+        SELECT id, role FROM users
+        WHERE username = %s AND password_hash = %s
+    """)
+    USERNAME_EXISTS = Statement("users.username_exists", "SELECT COUNT(*) FROM users WHERE username = %s")
+    PASSWORD_MATCHES = Statement("users.password_matches", """
+        SELECT COUNT(*) FROM users
+        WHERE id = %s AND password_hash = %s
+    """)
+    INSERT = Statement("users.insert", """
+        INSERT INTO users (username, password_hash, role)
+        VALUES (%s, %s, %s)
+    """)
+    UPDATE_PASSWORD = Statement("users.update_password", """
+        UPDATE users
+        SET password_hash = %s
+        WHERE id = %s
+    """)
+
+    def ensure_table(self, admin_password_hash):
+        """Create the users table with a default admin account; returns True if it was created"""
+        with self.db.transaction() as tx:
+            if tx.query_value(self.TABLE_EXISTS):
+                return False
+            tx.execute(self.CREATE_TABLE)
+            tx.execute(self.INSERT, ("admin", admin_password_hash, "Project Manager"))
+            return True
+
+    def find_login(self, username, password_hash):
+        """(id, role) for matching credentials, or None"""
+        return self.db.query_one(self.FIND_LOGIN, (username, password_hash))
+
+    def username_exists(self, username):
+        return self.db.query_value(self.USERNAME_EXISTS, (username,)) > 0
+
+    def password_matches(self, user_id, password_hash):
+        return self.db.query_value(self.PASSWORD_MATCHES, (user_id, password_hash)) > 0
+
+    def insert(self, username, password_hash, role):
+        self.db.execute(self.INSERT, (username, password_hash, role))
+
+    def update_password(self, user_id, password_hash):
+        return self.db.execute(self.UPDATE_PASSWORD, (password_hash, user_id))
@@ -0,0 +1,199 @@
+"""
+DB Executor - Runs database calls off the Tk thread
+Tkinter widgets may only be touched from the thread running mainloop(), so
+queries are submitted to a small thread pool and their results are queued.
+A root.after() poll on the Tk thread drains the queue and runs the success
+or error callback there.
+
+Requests can carry a key (e.g. "risks.list"). Submitting a new request with
+the same key cancels the previous one: it is dropped before it starts, or
+its result is discarded if it was already running. This is what keeps a slow
+answer for the previously selected project from overwriting the new one.
+"""
+
+import queue
+import threading
+import traceback
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Request:
+    """Handle for one submitted call"""
+
+    def __init__(self, key, on_done, on_error):
+        self.key = key
+        self.on_done = on_done
+        self.on_error = on_error
+        self.cancelled = False
+        self.future = None
+
+    def cancel(self):
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+
+class DBExecutor:
+    """Thread pool for database calls with results delivered on the Tk thread"""
+
+    def __init__(self, max_workers=4, poll_interval=25, error_handler=None):
+        self.poll_interval = poll_interval
+        self.error_handler = error_handler
+        self._workers = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-worker")
+        self._results = queue.Queue()
+        self._latest = {}        # key -> most recent Request
+        self._pending = set()    # Requests whose callbacks have not run yet
+        self._busy_listeners = []
+        self._lock = threading.Lock()
+        self._root = None
+        self._poll_id = None
+
+    # --- Tk integration ---
+
+    def attach(self, root):
+        """Start delivering results through root's event loop"""
+        if self._root is not None and self._poll_id is not None:
+            try:
+                self._root.after_cancel(self._poll_id)
+            except tk.TclError:
+                pass
+        self._root = root
+        self._poll_id = root.after(self.poll_interval, self._poll)
+
+    def add_busy_listener(self, callback):
+        """Call callback(busy) when the executor goes from idle to busy and back"""
+        self._busy_listeners.append(callback)
+        callback(self.busy)
+
+    @property
+    def busy(self):
+        with self._lock:
+            return bool(self._pending)
+
+    # --- Submitting work ---
+
+    def submit(self, fn, *args, on_done=None, on_error=None, key=None):
+        """Run fn(*args) on a worker; on_done(result) runs later on the Tk thread"""
+        request = Request(key, on_done, on_error)
+        with self._lock:
+            if key is not None:
+                previous = self._latest.get(key)
+                if previous is not None:
+                    previous.cancel()
+                self._latest[key] = request
+            was_busy = bool(self._pending)
+            self._pending.add(request)
+
+        request.future = self._workers.submit(self._run, request, fn, args)
+        if not was_busy:
+            self._notify_busy(True)
+        return request
+
+    def cancel(self, key):
+        """Cancel the outstanding request for key, if any"""
+        with self._lock:
+            request = self._latest.get(key)
+        if request is not None:
+            request.cancel()
+
+    def call_soon(self, fn, *args):
+        """Run fn(*args) on the Tk thread; safe to call from any thread"""
+        self._results.put((None, fn, args))
+
+    def poll(self):
+        """Run every queued callback on the calling (Tk) thread"""
+        while True:
+            try:
+                request, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            if request is None:
+                # call_soon() item: result is the function, error its arguments
+                self._invoke(result, *error)
+                continue
+
+            self._finish(request, result, error)
+
+        # Requests cancelled before a worker picked them up never report back
+        with self._lock:
+            dropped = {r for r in self._pending if r.future is not None and r.future.cancelled()}
+            if dropped:
+                self._pending -= dropped
+                self._forget(dropped)
+                idle = not self._pending
+            else:
+                idle = False
+        if idle:
+            self._notify_busy(False)
+
+    def shutdown(self):
+        """Cancel queued requests and stop the workers"""
+        with self._lock:
+            for request in self._pending:
+                request.cancel()
+        self._workers.shutdown(wait=False)
+
+    # --- Internals ---
+
+    def _run(self, request, fn, args):
+        # Worker thread: never touch Tk here
+        if request.cancelled:
+            self._results.put((request, None, None))
+            return
+        try:
+            self._results.put((request, fn(*args), None))
+        except Exception as e:
+            self._results.put((request, None, e))
+
+    def _finish(self, request, result, error):
+        with self._lock:
+            self._pending.discard(request)
+            self._forget((request,))
+            idle = not self._pending
+            stale = request.cancelled
+
+        if not stale:
+            if error is None:
+                if request.on_done is not None:
+                    self._invoke(request.on_done, result)
+            elif request.on_error is not None:
+                self._invoke(request.on_error, error)
+            elif self.error_handler is not None:
+                self._invoke(self.error_handler, error)
+            else:
+                print(f"Background database call failed: {error}")
+
+        if idle:
+            self._notify_busy(False)
+
+    def _forget(self, requests):
+        # Caller holds self._lock
+        for request in requests:
+            if request.key is not None and self._latest.get(request.key) is request:
+                del self._latest[request.key]
+
+    def _invoke(self, fn, *args):
+        try:
+            fn(*args)
+        except tk.TclError as e:
+            # Widget destroyed while the query was running
+            print(f"Skipped update for a closed window: {e}")
+        except Exception:
+            traceback.print_exc()
+
+    def _notify_busy(self, busy):
+        for callback in list(self._busy_listeners):
+            try:
+                callback(busy)
+            except tk.TclError:
+                self._busy_listeners.remove(callback)
+
+    def _poll(self):
+        self.poll()
+        try:
+            self._poll_id = self._root.after(self.poll_interval, self._poll)
+        except tk.TclError:
+            # Root window destroyed
+            self._poll_id = None
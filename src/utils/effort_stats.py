@@ -0,0 +1,117 @@
+"""
+Effort Stats - Project-wide effort figures for the Dashboard tab
+The input is one row per requirement and week from the effort_weekly rollup,
+read with a single query. The rows are loaded into NumPy arrays and every
+figure (category totals, hours per week, share per requirement, moving
+average) is computed with whole-array operations, so the cost barely grows
+with the number of effort entries behind the rollup. Run this module with
+--benchmark to time the computation on synthetic data.
+NumPy is optional; the dashboard is disabled without it.
+"""
+
+import importlib.util
+import sys
+import time
+
+# Optional NumPy dependency - for the dashboard (checked without importing it)
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+CATEGORIES = ["Requirements Analysis", "Designing", "Coding", "Testing", "Project Management"]
+# Weeks in the trailing moving average of weekly hours
+MOVING_AVERAGE_WEEKS = 4
+
+
+class EffortStats:
+    """Effort figures of one project; the array attributes are None when there is no effort"""
+
+    def __init__(self, project_id, window=MOVING_AVERAGE_WEEKS):
+        self.project_id = project_id
+        self.window = window
+        self.entries = 0
+        self.total_hours = 0.0
+        self.category_totals = None  # Hours per category, in CATEGORIES order
+        self.weeks = None            # datetime64[D] Mondays, first to last week without gaps
+        self.burn = None             # Hours per week and category, shape (weeks, categories)
+        self.weekly_totals = None    # Hours per week
+        self.moving_average = None   # Trailing window-week average of weekly_totals
+        self.requirements = []       # (name, hours, share) sorted by hours, largest first
+
+    @property
+    def empty(self):
+        return self.entries == 0
+
+
+def compute_stats(project_id, rows, requirement_names, window=MOVING_AVERAGE_WEEKS):
+    """EffortStats from EffortRepository.dashboard_rows() rows; requirement_names = {id: name}"""
+    import numpy as np
+
+    stats = EffortStats(project_id, window)
+    if not rows:
+        return stats
+
+    data = np.array(rows, dtype=np.float64)
+    requirement_ids = data[:, 0].astype(np.int64)
+    days = data[:, 1].astype(np.int64)
+    hours = data[:, 3:]
+
+    stats.entries = int(data[:, 2].sum())
+    stats.category_totals = hours.sum(axis=0)
+    stats.total_hours = float(stats.category_totals.sum())
+
+    # Weeks as consecutive indexes from the first one, so empty weeks show up as zero
+    first = days.min()
+    week_index = (days - first) // 7
+    span = int(week_index.max()) + 1
+    stats.weeks = (first + 7 * np.arange(span)).astype("datetime64[D]")
+    stats.burn = np.column_stack([np.bincount(week_index, weights=hours[:, c], minlength=span)
+                                  for c in range(hours.shape[1])])
+    stats.weekly_totals = stats.burn.sum(axis=1)
+
+    # Trailing average from a running sum; the first weeks average over what exists
+    running = np.concatenate(([0.0], np.cumsum(stats.weekly_totals)))
+    end = np.arange(1, span + 1)
+    start = np.maximum(end - window, 0)
+    stats.moving_average = (running[end] - running[start]) / (end - start)
+
+    ids, inverse = np.unique(requirement_ids, return_inverse=True)
+    per_requirement = np.bincount(inverse, weights=hours.sum(axis=1))
+    order = np.argsort(-per_requirement, kind="stable")
+    total = stats.total_hours or 1.0
+    stats.requirements = [(requirement_names.get(int(ids[i]), f"#{ids[i]}"), float(per_requirement[i]),
+                           float(per_requirement[i]) / total) for i in order]
+    return stats
+
+
+def load_stats(db, project_id, window=MOVING_AVERAGE_WEEKS):
+    """Read a project's effort rollup and compute its EffortStats"""
+    rows = db.effort.dashboard_rows(project_id)
+    names = {rid: name for rid, name in db.requirements.names_by_project(project_id)}
+    return compute_stats(project_id, rows, names, window)
+
+
+def _sample_rows(count, requirements=50):
+    # Rollup-shaped rows: each requirement gets a run of consecutive weeks
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    requirement_ids = np.arange(count) % requirements
+    weeks = 19000 + 7 * (np.arange(count) // requirements)
+    hours = rng.uniform(0, 40, size=(count, len(CATEGORIES)))
+    return [(int(r), int(w), 5, *h) for r, w, h in zip(requirement_ids, weeks, hours.tolist())]
+
+
+def benchmark(rows=100000):
+    """Seconds compute_stats takes for rows synthetic rollup rows"""
+    sample = _sample_rows(rows)
+    start = time.perf_counter()
+    compute_stats(0, sample, {})
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    # python -m src.utils.effort_stats --benchmark [rows]
+    if not NUMPY_AVAILABLE or "--benchmark" not in sys.argv:
+        sys.exit("usage: python -m src.utils.effort_stats --benchmark [rows]  (requires numpy)")
+    args = [a for a in sys.argv[1:] if a != "--benchmark"]
+    count = int(args[0]) if args else 100000
+    print(f"{count} rows in {benchmark(count) * 1000:.1f} ms")
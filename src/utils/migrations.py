@@ -0,0 +1,111 @@
+"""
+Migrations - Versioned schema upgrades for the Project Management System
+Migration files live in the top-level migrations/ directory and are named
+NNNN_description.sql or NNNN_description.py. They are applied in version
+order, each in its own transaction, and recorded in the schema_version table
+so every migration runs exactly once per database.
+
+A .py migration must define upgrade(tx, catalog), where tx is a
+database.Session and catalog is a schema.SchemaCatalog read inside the same
+transaction, so it can decide what to change without probing the server.
+"""
+
+import importlib.util
+import os
+import re
+
+from .database import Statement
+from .schema import SchemaCatalog, invalidate_catalog
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                              "migrations")
+
+# Arbitrary constant used with pg_advisory_xact_lock so that two clients
+# starting at the same time never apply the same migration twice
+MIGRATION_LOCK_ID = 4718201
+
+_FILE_PATTERN = re.compile(r"^(\d+)_(\w+)\.(sql|py)$")
+
+
+class Migration:
+    """One migration file"""
+
+    def __init__(self, version, name, path):
+        self.version = version
+        self.name = name
+        self.path = path
+
+    def apply(self, tx):
+        if self.path.endswith(".sql"):
+            with open(self.path, encoding="utf-8") as f:
+                tx.execute(Statement("migration.%04d" % self.version, f.read(), prepare=False))
+        else:
+            spec = importlib.util.spec_from_file_location("migration_%04d" % self.version, self.path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            module.upgrade(tx, SchemaCatalog.fetch(tx))
+
+    def __repr__(self):
+        return "Migration(%04d, %r)" % (self.version, self.name)
+
+
+class MigrationRunner:
+    """Applies pending migrations from MIGRATIONS_DIR"""
+
+    CREATE_VERSION_TABLE = Statement("schema_version.create", """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """, prepare=False)
+    LOCK = Statement("schema_version.lock", "SELECT pg_advisory_xact_lock(%s)", prepare=False)
+    APPLIED = Statement("schema_version.applied", "SELECT version FROM schema_version", prepare=False)
+    RECORD = Statement("schema_version.record",
+                       "INSERT INTO schema_version (version, name) VALUES (%s, %s)", prepare=False)
+
+    def __init__(self, db, directory=MIGRATIONS_DIR):
+        self.db = db
+        self.directory = directory
+
+    def discover(self):
+        """All migration files, sorted by version"""
+        migrations = []
+        for filename in os.listdir(self.directory):
+            match = _FILE_PATTERN.match(filename)
+            if match:
+                migrations.append(Migration(int(match.group(1)), match.group(2),
+                                            os.path.join(self.directory, filename)))
+        migrations.sort(key=lambda m: m.version)
+
+        versions = [m.version for m in migrations]
+        if len(versions) != len(set(versions)):
+            raise RuntimeError(f"Duplicate migration versions in {self.directory}")
+        return migrations
+
+    def applied_versions(self):
+        with self.db.transaction() as tx:
+            tx.execute(self.CREATE_VERSION_TABLE)
+            return {row[0] for row in tx.query(self.APPLIED)}
+
+    def pending(self):
+        applied = self.applied_versions()
+        return [m for m in self.discover() if m.version not in applied]
+
+    def run(self):
+        """Apply every pending migration; returns the list that was applied"""
+        applied_now = []
+        for migration in self.pending():
+            with self.db.transaction() as tx:
+                tx.execute(self.LOCK, (MIGRATION_LOCK_ID,))
+                # Another client may have applied it while we waited for the lock
+                if migration.version in {row[0] for row in tx.query(self.APPLIED)}:
+                    continue
+                migration.apply(tx)
+                tx.execute(self.RECORD, (migration.version, migration.name))
+            print(f"Applied migration {migration.version:04d}_{migration.name}")
+            applied_now.append(migration)
+
+        if applied_now:
+            invalidate_catalog()
+        return applied_now
@@ -0,0 +1,68 @@
+"""
+Parallel Export - "Export all" across a pool of worker processes
+Each report is rendered by its own process: ReportLab layout is CPU bound
+and holds the GIL, so threads would not help. Workers open their own
+database connections (connections cannot cross a process boundary) and
+write their file directly; only the row count travels back.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .connection_pool import configure_pool
+from .csv_export import CSV_EXPORTS, export_csv
+from .database import Database
+from .pdf_export import PDF_REPORTS, export_pdf
+
+
+class ExportJob:
+    """One file to produce: fmt is "csv" or "pdf", name a key of CSV_EXPORTS / PDF_REPORTS"""
+
+    def __init__(self, fmt, name, path):
+        self.fmt = fmt
+        self.name = name
+        self.path = path
+
+    def __repr__(self):
+        return "ExportJob(%r, %r)" % (self.fmt, self.name)
+
+
+def _init_worker(connect_kwargs):
+    # One connection is all a worker ever needs
+    configure_pool(minconn=0, maxconn=1, reap_interval=None, **connect_kwargs)
+
+
+def _run_job(fmt, name, path):
+    db = Database()
+    if fmt == "csv":
+        return export_csv(db, CSV_EXPORTS[name], path)
+    return export_pdf(db, PDF_REPORTS[name], path)
+
+
+def export_all(jobs, connect_kwargs, progress=None, max_workers=None):
+    """Run jobs in parallel and block until every one has finished
+
+    progress(job, rows, error, finished, total) is called from this thread
+    as each job completes. Returns {job: row count or the exception raised}.
+    """
+    if not jobs:
+        return {}
+    max_workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+
+    # spawn rather than fork: the parent has live sockets and threads that a forked child must not inherit
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                             initializer=_init_worker, initargs=(connect_kwargs,)) as pool:
+        futures = {pool.submit(_run_job, job.fmt, job.name, job.path): job for job in jobs}
+        for finished, future in enumerate(as_completed(futures), 1):
+            job = futures[future]
+            try:
+                rows, error = future.result(), None
+            except Exception as e:
+                rows, error = None, e
+            results[job] = rows if error is None else error
+            if progress is not None:
+                progress(job, rows, error, finished, len(jobs))
+    return results
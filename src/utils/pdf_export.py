@@ -0,0 +1,99 @@
+"""
+PDF Export - ReportLab reports for the Exports tab
+Each report is a title, a generation date and one table built from a
+repository's report_rows(). The definitions live here rather than in the GUI
+so the same code can run in the Exports tab and in export worker processes.
+Layout is done by ReportBuilder; run this module with --benchmark to see how
+many rows per second each report renders.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from .report_builder import REPORTLAB_AVAILABLE, ReportBuilder
+
+
+def _truncate(text, limit=100):
+    # Long free-text fields would make rows taller than a page
+    text = text or ""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+class PdfReport:
+    """Definition of one PDF report"""
+
+    def __init__(self, name, filename, title, header, fetch, to_cells):
+        self.name = name
+        self.filename = filename  # File name used by "export all"
+        self.title = title
+        self.header = header
+        self.fetch = fetch        # fetch(db) -> rows
+        self.to_cells = to_cells  # to_cells(row) -> list of table cells
+
+
+PDF_REPORTS = {
+    "projects": PdfReport(
+        "projects", "projects_export.pdf", "Project Management System - Projects Report",
+        ["Project Name", "Owner", "Description", "Scope", "Target Users", "Tech Stack", "Platform"],
+        lambda db: db.projects.report_rows(),
+        lambda p: [p[0], p[1], _truncate(p[2]), _truncate(p[3]), p[4], p[5], p[6]]),
+    "requirements": PdfReport(
+        "requirements", "requirements_export.pdf", "Project Management System - Requirements Report",
+        ["Project", "Requirement Name", "Type", "Status", "Description"],
+        lambda db: db.requirements.report_rows(),
+        lambda r: [r[0], r[1], r[2], r[3], _truncate(r[4])]),
+    "effort": PdfReport(
+        "effort", "effort_export.pdf", "Project Management System - Effort Tracking Report",
+        ["Project", "Requirement", "Date", "Req. Analysis", "Design", "Coding", "Testing", "PM"],
+        lambda db: db.effort.report_rows(),
+        list),
+    "effort_weekly": PdfReport(
+        "effort_weekly", "effort_weekly_export.pdf", "Project Management System - Weekly Effort Summary",
+        ["Project", "Week", "Entries", "Req. Analysis", "Design", "Coding", "Testing", "PM"],
+        lambda db: db.effort.weekly_report_rows(),
+        list),
+    "risks": PdfReport(
+        "risks", "risks_export.pdf", "Project Management System - Risk Management Report",
+        ["Project", "Risk", "Description", "Status"],
+        lambda db: db.risks.report_rows(),
+        lambda r: [r[0], r[1], _truncate(r[2]), r[3]]),
+}
+
+
+def export_pdf(db, report, path, builder=None):
+    """Render one report to path and return the number of table rows"""
+    rows = report.fetch(db)
+    builder = builder or ReportBuilder()
+    return builder.build(path, report.title, report.header, [report.to_cells(row) for row in rows])
+
+
+def _sample_rows(report, count):
+    # Raw report rows with text of varying length in every column
+    words = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor".split()
+    return [tuple(" ".join(words[:(i + col) % len(words) + 1]) for col in range(len(report.header)))
+            for i in range(count)]
+
+
+def benchmark(rows=5000, builder=None):
+    """Render every report from rows synthetic rows and return {name: rows per second}"""
+    builder = builder or ReportBuilder()
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, report in PDF_REPORTS.items():
+            cells = [report.to_cells(row) for row in _sample_rows(report, rows)]
+            start = time.perf_counter()
+            builder.build(os.path.join(directory, report.filename), report.title, report.header, cells)
+            results[name] = rows / (time.perf_counter() - start)
+    return results
+
+
+if __name__ == "__main__":
+    # python -m src.utils.pdf_export --benchmark [rows]
+    if not REPORTLAB_AVAILABLE or "--benchmark" not in sys.argv:
+        sys.exit("usage: python -m src.utils.pdf_export --benchmark [rows]  (requires reportlab)")
+    args = [a for a in sys.argv[1:] if a != "--benchmark"]
+    count = int(args[0]) if args else 5000
+    for name, rate in benchmark(count).items():
+        print(f"{name:<14}{count:>8} rows {rate:>10.0f} rows/s")
@@ -0,0 +1,104 @@
+"""
+Project Catalog - Shared in-memory list of projects
+Every tab needs the id/name list of projects for its dropdown. The catalog
+loads it once (on the DB executor, see when_loaded), hands the same data to
+every tab, and reloads it only when a project is inserted, renamed or
+deleted through ProjectRepository, pushing the new list to all subscribers.
+"""
+
+import threading
+import tkinter as tk
+
+
+class ProjectCatalog:
+    """Observable id <-> name map of all projects"""
+
+    def __init__(self, db):
+        self.db = db
+        self._lock = threading.RLock()
+        self._by_name = None  # None until first load
+        self._by_id = {}
+        self._subscribers = []
+        # Set to DBExecutor.call_soon so subscribers always run on the Tk thread,
+        # even when the project write happened on a worker
+        self.dispatch = None
+        # Set to the DBExecutor so the first load is read off the Tk thread
+        self.executor = None
+
+        # Project writes are the only thing that can make the list stale
+        db.projects.add_listener(self.invalidate)
+
+    # --- Data access ---
+
+    @property
+    def loaded(self):
+        return self._by_name is not None
+
+    def ensure_loaded(self):
+        with self._lock:
+            if self._by_name is None:
+                self._load()
+
+    def when_loaded(self, callback):
+        """Call callback(catalog) once the list is in memory, reading it on the executor first if needed"""
+        if self.loaded or self.executor is None:
+            callback(self)
+        else:
+            self.executor.submit(self.ensure_loaded, on_done=lambda _: callback(self))
+
+    def as_map(self):
+        """{project_name: project_id} copy, loading the catalog if needed"""
+        self.ensure_loaded()
+        with self._lock:
+            return dict(self._by_name)
+
+    def names(self):
+        self.ensure_loaded()
+        with self._lock:
+            return list(self._by_name)
+
+    def id_for(self, name):
+        self.ensure_loaded()
+        with self._lock:
+            return self._by_name.get(name)
+
+    def name_for(self, project_id):
+        self.ensure_loaded()
+        with self._lock:
+            return self._by_id.get(project_id)
+
+    # --- Change notification ---
+
+    def subscribe(self, callback):
+        """Call callback(catalog) whenever the project list changes"""
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def invalidate(self):
+        """Reload the list and push it to every subscriber"""
+        with self._lock:
+            self._load()
+            subscribers = list(self._subscribers)
+
+        for callback in subscribers:
+            if self.dispatch is not None:
+                self.dispatch(self._notify, callback)
+            else:
+                self._notify(callback)
+
+    def _notify(self, callback):
+        try:
+            callback(self)
+        except tk.TclError:
+            # The subscribing widget was destroyed (e.g. after logout)
+            self.unsubscribe(callback)
+
+    def _load(self):
+        rows = self.db.projects.list_names()
+        self._by_name = {name: pid for pid, name in rows}
+        self._by_id = {pid: name for pid, name in rows}
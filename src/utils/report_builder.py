@@ -0,0 +1,137 @@
+"""
+Report Builder - Shared layout for the PDF reports
+Every report is a title, a generation date and one long table. The builder
+keeps the expensive parts out of the per-report path:
+- the paragraph and table styles are created once per process
+- column widths are measured on a sample of rows and passed to ReportLab,
+  which otherwise measures every cell of the table to size the columns
+- long tables are split into chunks of CHUNK_ROWS rows, each repeating the
+  header, because laying out one giant Table gets slower than linear
+ReportLab itself is only imported when the first report is built; importing
+it costs more than the rest of application startup put together.
+"""
+
+import functools
+import importlib.util
+from datetime import datetime
+
+# Optional ReportLab dependency - for PDF export (checked without importing it)
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+
+# Rows per Table flowable
+CHUNK_ROWS = 500
+# Rows measured when computing column widths
+SAMPLE_ROWS = 200
+
+HEADER_FONT = ("Helvetica-Bold", 12)
+BODY_FONT = ("Helvetica", 10)
+CELL_PADDING = 12  # Left + right padding of a cell in points
+
+
+@functools.lru_cache(maxsize=None)
+def paragraph_styles():
+    """(title, normal) ParagraphStyles, built once per process"""
+    from reportlab.lib.styles import getSampleStyleSheet
+    sheet = getSampleStyleSheet()
+    return sheet['Title'], sheet['Normal']
+
+
+@functools.lru_cache(maxsize=None)
+def table_style():
+    """TableStyle shared by every table chunk of every report"""
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), HEADER_FONT[0]),
+        ('FONTSIZE', (0, 0), (-1, 0), HEADER_FONT[1]),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('FONTNAME', (0, 1), (-1, -1), BODY_FONT[0]),
+        ('FONTSIZE', (0, 1), (-1, -1), BODY_FONT[1]),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+
+
+class ReportBuilder:
+    """Lays out title/date/table reports"""
+
+    def __init__(self, pagesize=None, chunk_rows=CHUNK_ROWS, sample_rows=SAMPLE_ROWS):
+        self.pagesize = pagesize  # None means letter
+        self.chunk_rows = chunk_rows
+        self.sample_rows = sample_rows
+
+    def build(self, path, title, header, rows):
+        """Write the report to path; rows are lists of cell values. Returns the row count."""
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
+        doc = SimpleDocTemplate(path, pagesize=self.pagesize or letter)
+        title_style, normal_style = paragraph_styles()
+
+        date_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        elements = [
+            Paragraph(title, title_style),
+            Spacer(1, 20),
+            Paragraph(f"Generated on: {date_str}", normal_style),
+            Spacer(1, 20),
+        ]
+
+        widths, limits = self.column_widths(header, rows, doc.width)
+        elements.extend(self.tables(header, rows, widths, limits))
+        doc.build(elements)
+        return len(rows)
+
+    def column_widths(self, header, rows, available):
+        """Column widths that fit the page, and the max characters each body column can show
+
+        Widths are measured on the header and the first sample_rows rows. When
+        the natural widths are wider than the page they are scaled down
+        together, and body text is cut to what fits in the scaled column.
+        """
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+
+        sample = rows[:self.sample_rows]
+        natural = []
+        for col, heading in enumerate(header):
+            width = stringWidth(str(heading), *HEADER_FONT)
+            for row in sample:
+                width = max(width, stringWidth(_text(row[col]), *BODY_FONT))
+            natural.append(width + CELL_PADDING)
+
+        total = sum(natural)
+        if total <= available:
+            return natural, [None] * len(header)
+
+        scale = available / total
+        widths = [w * scale for w in natural]
+        # Average Helvetica glyph is about half the font size wide
+        limits = [max(4, int((w - CELL_PADDING) / (BODY_FONT[1] * 0.5))) for w in widths]
+        return widths, limits
+
+    def tables(self, header, rows, widths, limits=None):
+        """Table flowables of at most chunk_rows rows, each with the header row"""
+        from reportlab.platypus import Table
+
+        if limits and any(limits):
+            rows = [[_clip(value, limit) for value, limit in zip(row, limits)] for row in rows]
+
+        style = table_style()
+        chunks = []
+        for start in range(0, max(len(rows), 1), self.chunk_rows):
+            table = Table([header] + rows[start:start + self.chunk_rows], colWidths=widths, repeatRows=1)
+            table.setStyle(style)
+            chunks.append(table)
+        return chunks
+
+
+def _text(value):
+    return "" if value is None else str(value)
+
+
+def _clip(value, limit):
+    if limit is None or not isinstance(value, str) or len(value) <= limit:
+        return value
+    return value[:limit - 3] + "..."
@@ -0,0 +1,86 @@
+"""
+Schema - Cached view of the database catalog
+Loads the column metadata of every application table with a single
+information_schema query and keeps it for the lifetime of the process, so
+startup code and migrations can ask "does this table/column exist?" without a
+round trip per question.
+"""
+
+import threading
+
+from .database import Statement
+
+# Tables the application owns
+APP_TABLES = ("projects", "team_members", "risks", "requirements", "effort_tracking", "users", "schema_version")
+
+
+class Column:
+    """Metadata for one table column"""
+
+    def __init__(self, name, data_type, nullable, default, generated):
+        self.name = name
+        self.data_type = data_type
+        self.nullable = nullable
+        self.default = default
+        self.generated = generated
+
+    def __repr__(self):
+        return "Column(%r, %r)" % (self.name, self.data_type)
+
+
+class SchemaCatalog:
+    """Columns of the application tables, keyed by table name"""
+
+    COLUMNS = Statement("schema.columns", """
+        SELECT table_name, column_name, data_type, is_nullable = 'YES', column_default, is_generated = 'ALWAYS'
+        FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = ANY(%s)
+        ORDER BY table_name, ordinal_position
+    """, prepare=False)
+
+    def __init__(self, tables):
+        self.tables = tables  # {table_name: {column_name: Column}}
+
+    @classmethod
+    def fetch(cls, tx, tables=APP_TABLES):
+        """Build a catalog with one query on an open Session"""
+        result = {}
+        for table, column, data_type, nullable, default, generated in tx.query(cls.COLUMNS, (list(tables),)):
+            result.setdefault(table, {})[column] = Column(column, data_type, nullable, default, generated)
+        return cls(result)
+
+    def has_table(self, table):
+        return table in self.tables
+
+    def has_column(self, table, column):
+        return column in self.tables.get(table, {})
+
+    def columns(self, table):
+        """Column names of a table in definition order (empty if the table is missing)"""
+        return list(self.tables.get(table, {}))
+
+    def column(self, table, column):
+        return self.tables.get(table, {}).get(column)
+
+
+# === PROCESS-WIDE CACHE ===
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog(db, refresh=False):
+    """Memoized catalog for this process; loaded on first use"""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None or refresh:
+            with db.transaction() as tx:
+                _catalog = SchemaCatalog.fetch(tx)
+        return _catalog
+
+
+def invalidate_catalog():
+    """Forget the cached catalog (call after changing the schema)"""
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
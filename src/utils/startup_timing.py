@@ -0,0 +1,77 @@
+"""
+Startup Timing - Where the application's cold start goes
+Running the application with --startup-timing starts it once more in a child
+process under python -X importtime. The child closes itself as soon as the
+login window has been drawn and prints how long each startup phase took; the
+parent then prints the slowest imports from the child's import trace.
+"""
+
+import os
+import sys
+import time
+
+FLAG = "--startup-timing"
+# Set in the child so it knows to report and exit instead of running the GUI
+CHILD_ENV = "PMS_STARTUP_TIMING"
+IMPORT_PREFIX = "import time:"
+
+
+class StartupTimer:
+    """Wall-clock time of consecutive startup phases"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases = []
+
+    def mark(self, label):
+        """End the current phase and name it label"""
+        now = time.perf_counter()
+        self.phases.append((label, now - self.last))
+        self.last = now
+
+    def report(self):
+        lines = ["Startup phases:"]
+        for label, seconds in self.phases:
+            lines.append(f"  {seconds * 1000:9.1f} ms  {label}")
+        lines.append(f"  {(self.last - self.start) * 1000:9.1f} ms  total")
+        return "\n".join(lines)
+
+
+def timing_child():
+    """True inside the child started by run_timed()"""
+    return os.environ.get(CHILD_ENV) == "1"
+
+
+def parse_importtime(text):
+    """Split -X importtime output into [(cumulative_us, self_us, module)] and the other lines"""
+    imports, other = [], []
+    for line in text.splitlines():
+        if not line.startswith(IMPORT_PREFIX):
+            other.append(line)
+            continue
+        fields = line[len(IMPORT_PREFIX):].split("|")
+        try:
+            imports.append((int(fields[1]), int(fields[0]), fields[2].rstrip()))
+        except (IndexError, ValueError):
+            pass  # The "self [us] | cumulative | imported package" header line
+    return imports, other
+
+
+def run_timed(script, limit=20):
+    """Start script in a timed child process, print the import report and return its exit code"""
+    import subprocess  # Only the timing run needs it; keep it out of normal startup
+
+    env = dict(os.environ, **{CHILD_ENV: "1"})
+    args = [sys.executable, "-X", "importtime", script] + [a for a in sys.argv[1:] if a != FLAG]
+    child = subprocess.run(args, env=env, stderr=subprocess.PIPE, text=True)
+
+    imports, other = parse_importtime(child.stderr)
+    if other:
+        print("\n".join(other), file=sys.stderr)
+
+    print(f"\nSlowest imports (of {len(imports)}):")
+    print(f"  {'cumulative':>10}  {'self':>8}  module")
+    for cumulative, own, module in sorted(imports, reverse=True)[:limit]:
+        print(f"  {cumulative / 1000:7.1f} ms  {own / 1000:5.1f} ms  {module}")
+    return child.returncode
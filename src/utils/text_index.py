@@ -0,0 +1,179 @@
+"""
+Text Index - In-memory word index for filtering a list as the user types
+Built once from a list of rows: every row's text is split into lowercase
+words, and each distinct word points at the rows containing it. The sorted
+word list turns a typed prefix into one bisect range, so filter() only
+touches the rows that can match instead of re-reading every row's text.
+Very short prefixes match most of the word list; for those (and while the
+user keeps typing, when only the previous matches can still match) the
+candidate rows are checked directly, which is cheaper than merging the
+index lists. After a write the index is patched (add, replace, remove)
+rather than rebuilt, so the rows never have to be read again. Run this
+module with --benchmark to time filtering.
+"""
+
+import re
+import sys
+import time
+from bisect import bisect_left, insort
+from itertools import accumulate
+
+WORD = re.compile(r"\w+")
+# Sorts after every word that starts with the same prefix
+_HIGHEST = chr(0x10FFFF)
+# Placeholder for a removed row, so the positions of the others stay valid
+_REMOVED = object()
+
+
+def tokenize(text):
+    return WORD.findall(text.lower())
+
+
+class TextIndex:
+    """Word-prefix index over rows; text_of(row) gives the text a row is found by
+
+    key(row) identifies a row for replace() and remove() (default: the first column).
+    """
+
+    def __init__(self, rows, text_of, key=None):
+        self.text_of = text_of
+        self.key = key or (lambda row: row[0])
+        self.rows = list(rows)
+        self._positions = {self.key(row): pos for pos, row in enumerate(self.rows)}
+        self._removed = 0  # Positions left empty by remove(); rows[pos] is _REMOVED
+        postings = {}
+        # Each row's words as "\nword\nword...", so a prefix test is one substring search
+        self._row_words = []
+        for pos, row in enumerate(self.rows):
+            words = set(tokenize(text_of(row)))
+            self._row_words.append("\n" + "\n".join(words))
+            for word in words:
+                postings.setdefault(word, []).append(pos)
+        self._words = sorted(postings)
+        self._postings = [postings[word] for word in self._words]
+        # Number of postings before each word, to size a prefix range without walking it
+        self._sizes = [0, *accumulate(len(p) for p in self._postings)]
+        self._last = ((), None)  # Words and positions of the previous filter() call
+
+    def __len__(self):
+        return len(self.rows) - self._removed
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    # --- Patching after writes ---
+
+    def add(self, row):
+        """Index a new row; it is listed after every other row"""
+        pos = len(self.rows)
+        self.rows.append(row)
+        self._row_words.append("")
+        self._positions[self.key(row)] = pos
+        self._set_words(pos, set(tokenize(self.text_of(row))))
+
+    def replace(self, row):
+        """Re-index the row with the same key as row, keeping its place"""
+        pos = self._positions[self.key(row)]
+        self.rows[pos] = row
+        self._set_words(pos, set(tokenize(self.text_of(row))))
+
+    def remove(self, key):
+        """Drop the row with this key, if indexed"""
+        pos = self._positions.pop(key, None)
+        if pos is None:
+            return
+        self.rows[pos] = _REMOVED
+        self._removed += 1
+        self._set_words(pos, set())
+
+    def _set_words(self, pos, words):
+        old = set(self._row_words[pos][1:].split("\n")) - {""}
+        for word in old - words:
+            postings = self._postings[bisect_left(self._words, word)]
+            del postings[bisect_left(postings, pos)]
+        for word in words - old:
+            i = bisect_left(self._words, word)
+            if i == len(self._words) or self._words[i] != word:
+                self._words.insert(i, word)
+                self._postings.insert(i, [])
+            insort(self._postings[i], pos)
+        self._row_words[pos] = "\n" + "\n".join(words) if words else ""
+        self._sizes = [0, *accumulate(len(p) for p in self._postings)]
+        self._last = ((), None)
+
+    # --- Filtering ---
+
+    def filter(self, text):
+        """Rows that have a word starting with each word of text, in their original order"""
+        words = tokenize(text)
+        if not words:
+            if self._removed:
+                return [row for row in self.rows if row is not _REMOVED]
+            return self.rows
+
+        # Typing on (each word only got longer, or words were added) can only drop rows
+        last_words, positions = self._last
+        if not (last_words and len(words) >= len(last_words)
+                and all(word.startswith(prev) for word, prev in zip(words, last_words))):
+            positions = None
+        # Longest words first: they usually narrow the candidates the most
+        for word in sorted(set(words), key=len, reverse=True):
+            positions = self._match(word, positions)
+            if not positions:
+                break
+        self._last = (words, positions)
+        return [self.rows[pos] for pos in positions]
+
+    def _match(self, word, candidates):
+        """Sorted positions of rows with a word starting with word, limited to candidates if given"""
+        lo = bisect_left(self._words, word)
+        hi = bisect_left(self._words, word + _HIGHEST, lo)
+        size = self._sizes[hi] - self._sizes[lo]
+        scan = range(len(self.rows)) if candidates is None else candidates
+
+        if len(scan) <= size:
+            needle = "\n" + word
+            row_words = self._row_words
+            return [pos for pos in scan if needle in row_words[pos]]
+
+        if hi - lo == 1:
+            matched = self._postings[lo]
+        else:
+            matched = sorted(set().union(*self._postings[lo:hi]))
+        if candidates is None:
+            return matched
+        matched = set(matched)
+        return [pos for pos in candidates if pos in matched]
+
+
+def _sample_rows(count):
+    import random
+
+    rng = random.Random(0)
+    vocabulary = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 10)))
+                  for _ in range(5000)]
+    return [(i, " ".join(rng.choice(vocabulary) for _ in range(12))) for i in range(count)]
+
+
+def benchmark(rows=50000, text="re quire ments"):
+    """(build seconds, slowest keystroke seconds) for typing text over rows synthetic rows"""
+    sample = _sample_rows(rows)
+    start = time.perf_counter()
+    index = TextIndex(sample, lambda row: row[1])
+    build = time.perf_counter() - start
+    slowest = 0.0
+    for end in range(1, len(text) + 1):
+        start = time.perf_counter()
+        index.filter(text[:end])
+        slowest = max(slowest, time.perf_counter() - start)
+    return build, slowest
+
+
+if __name__ == "__main__":
+    # python -m src.utils.text_index --benchmark [rows]
+    if "--benchmark" not in sys.argv:
+        sys.exit("usage: python -m src.utils.text_index --benchmark [rows]")
+    args = [a for a in sys.argv[1:] if a != "--benchmark"]
+    count = int(args[0]) if args else 50000
+    build, slowest = benchmark(count)
+    print(f"{count} rows: index built in {build * 1000:.1f} ms, slowest keystroke {slowest * 1000:.1f} ms")
@@ -0,0 +1,162 @@
+"""
+Effort Batch Dialog - Grid for entering many days of effort at once
+Pick requirements and a date range, then fill in one line of hours per
+requirement and day. Every cell is checked here before anything is sent;
+the caller writes all lines in a single transaction.
+"""
+
+import tkinter as tk
+from datetime import datetime, timedelta
+from tkinter import messagebox, ttk
+
+CATEGORIES = ["Requirements Analysis", "Designing", "Coding", "Testing", "Project Management"]
+# Each line is five Entry widgets; beyond this the grid gets sluggish
+MAX_LINES = 400
+ERROR_COLOR = "#ffd0d0"
+
+
+class EffortBatchDialog:
+    """Batch entry window; on_save(dialog, rows, replace) gets (requirement_id, date, 5 hours) tuples"""
+
+    def __init__(self, parent, requirements, on_save):
+        self.requirements = requirements  # {name: id}
+        self.on_save = on_save
+        self.lines = []  # (requirement_id, date, [Entry per category])
+
+        self.top = tk.Toplevel(parent)
+        self.top.title("Batch Effort Entry")
+        self.top.geometry("900x600")
+
+        # Requirements and date range
+        options = ttk.Frame(self.top, padding=10)
+        options.pack(fill=tk.X)
+
+        ttk.Label(options, text="Requirements:").grid(row=0, column=0, sticky="nw")
+        self.requirement_listbox = tk.Listbox(options, selectmode=tk.EXTENDED, height=5, width=40,
+                                              exportselection=False)
+        for name in requirements:
+            self.requirement_listbox.insert(tk.END, name)
+        self.requirement_listbox.grid(row=0, column=1, rowspan=3, padx=5, sticky="w")
+
+        today = datetime.today().date()
+        ttk.Label(options, text="From:").grid(row=0, column=2, padx=(20, 5), sticky="e")
+        self.from_entry = ttk.Entry(options, width=12)
+        self.from_entry.grid(row=0, column=3, sticky="w")
+        self.from_entry.insert(0, (today - timedelta(days=today.weekday())).strftime('%Y-%m-%d'))
+
+        ttk.Label(options, text="To:").grid(row=1, column=2, padx=(20, 5), sticky="e")
+        self.to_entry = ttk.Entry(options, width=12)
+        self.to_entry.grid(row=1, column=3, sticky="w")
+        self.to_entry.insert(0, today.strftime('%Y-%m-%d'))
+
+        self.weekdays_only = tk.BooleanVar(value=True)
+        ttk.Checkbutton(options, text="Weekdays only", variable=self.weekdays_only).grid(row=2, column=3, sticky="w")
+        ttk.Button(options, text="Build Grid", command=self.build_grid).grid(row=0, column=4, padx=20)
+
+        # Scrollable grid of hour entries
+        grid_area = ttk.Frame(self.top)
+        grid_area.pack(fill=tk.BOTH, expand=True, padx=10)
+        self.canvas = tk.Canvas(grid_area, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(grid_area, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill=tk.BOTH, expand=True)
+        self.grid_frame = ttk.Frame(self.canvas)
+        self.canvas.create_window((0, 0), window=self.grid_frame, anchor="nw")
+        self.grid_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+
+        # Save options
+        bottom = ttk.Frame(self.top, padding=10)
+        bottom.pack(fill=tk.X)
+        self.replace = tk.BooleanVar(value=False)
+        ttk.Checkbutton(bottom, text="Replace existing entries", variable=self.replace).pack(side="left")
+        self.status = ttk.Label(bottom, text="Select requirements and dates, then build the grid.")
+        self.status.pack(side="left", padx=20)
+        ttk.Button(bottom, text="Cancel", command=self.close).pack(side="right", padx=5)
+        self.save_button = ttk.Button(bottom, text="Save All", command=self.save)
+        self.save_button.pack(side="right", padx=5)
+
+    def build_grid(self):
+        """One line per selected requirement and day in the range"""
+        try:
+            first = datetime.strptime(self.from_entry.get().strip(), '%Y-%m-%d').date()
+            last = datetime.strptime(self.to_entry.get().strip(), '%Y-%m-%d').date()
+        except ValueError:
+            messagebox.showerror("Invalid Date", "Dates must be in YYYY-MM-DD format.", parent=self.top)
+            return
+        if first > last:
+            messagebox.showerror("Invalid Range", "The start date is after the end date.", parent=self.top)
+            return
+
+        names = [self.requirement_listbox.get(i) for i in self.requirement_listbox.curselection()]
+        if not names:
+            messagebox.showwarning("Select Requirement", "Please select at least one requirement.", parent=self.top)
+            return
+
+        days = [first + timedelta(days=n) for n in range((last - first).days + 1)]
+        if self.weekdays_only.get():
+            days = [day for day in days if day.weekday() < 5]
+        if len(names) * len(days) > MAX_LINES:
+            messagebox.showwarning("Too Many Lines",
+                                   f"{len(names) * len(days)} lines requested; please enter at most "
+                                   f"{MAX_LINES} at a time.", parent=self.top)
+            return
+
+        for widget in self.grid_frame.winfo_children():
+            widget.destroy()
+        for col, heading in enumerate(["Requirement", "Date"] + CATEGORIES):
+            ttk.Label(self.grid_frame, text=heading, font=("Arial", 9, "bold")).grid(row=0, column=col, padx=4, pady=2)
+
+        self.lines = []
+        for row, (name, day) in enumerate(((name, day) for name in names for day in days), start=1):
+            ttk.Label(self.grid_frame, text=name).grid(row=row, column=0, padx=4, sticky="w")
+            ttk.Label(self.grid_frame, text=day.strftime('%Y-%m-%d')).grid(row=row, column=1, padx=4)
+            entries = []
+            for col in range(len(CATEGORIES)):
+                entry = tk.Entry(self.grid_frame, width=10)
+                entry.grid(row=row, column=col + 2, padx=2, pady=1)
+                entries.append(entry)
+            self.lines.append((self.requirements[name], day, entries))
+        self.status.config(text=f"{len(self.lines)} lines. Empty lines are skipped; empty cells count as 0.")
+
+    def collect(self):
+        """Validated (requirement_id, date, 5 hours) rows, or None if any cell is invalid"""
+        rows, bad = [], 0
+        for requirement_id, day, entries in self.lines:
+            texts = [entry.get().strip() for entry in entries]
+            if not any(texts):
+                for entry in entries:
+                    entry.config(background="white")
+                continue
+            hours = []
+            for entry, text in zip(entries, texts):
+                try:
+                    value = float(text) if text else 0.0
+                    valid = value >= 0
+                except ValueError:
+                    value, valid = None, False
+                entry.config(background="white" if valid else ERROR_COLOR)
+                bad += not valid
+                hours.append(value)
+            rows.append((requirement_id, day, *hours))
+
+        if bad:
+            messagebox.showerror("Invalid Input", f"{bad} highlighted cell(s) are not valid hours.", parent=self.top)
+            return None
+        return rows
+
+    def save(self):
+        rows = self.collect()
+        if rows is None:
+            return
+        if not rows:
+            messagebox.showwarning("Nothing to Save", "Please enter hours on at least one line.", parent=self.top)
+            return
+        self.on_save(self, rows, self.replace.get())
+
+    def set_busy(self, busy):
+        self.save_button.config(state="disabled" if busy else "normal")
+        self.status.config(text="Saving..." if busy else "")
+
+    def close(self):
+        self.top.destroy()
@@ -0,0 +1,141 @@
+"""
+Effort Charts - Canvas drawing for the Dashboard tab
+Draws an EffortStats as three charts: hours per week with the moving
+average on top, totals per category bottom left and the requirements with
+the most hours bottom right. Series are turned into canvas coordinates with
+NumPy and drawn as one polygon or line each, so a chart costs the same
+handful of canvas items however many weeks it covers. Resizing the canvas
+redraws after a short pause instead of on every <Configure> event.
+"""
+
+CATEGORY_COLORS = ["#4e79a7", "#f28e2b", "#59a14f", "#e15759", "#76b7b2"]
+CATEGORY_LABELS = ["Analysis", "Design", "Coding", "Testing", "PM"]
+BURN_COLOR = "#a0c4e8"
+AVERAGE_COLOR = "#d62728"
+AXIS_COLOR = "#666666"
+FONT = ("Arial", 9)
+TITLE_FONT = ("Arial", 10, "bold")
+# Requirements listed in the share chart; the rest are summed as "Other"
+SHARE_ROWS = 8
+REDRAW_DELAY_MS = 100
+MARGIN = 45
+
+
+class EffortCharts:
+    """Keeps the latest EffortStats and draws it on canvas"""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.stats = None
+        self._redraw_job = None
+        canvas.bind("<Configure>", self.schedule_redraw)
+
+    def show(self, stats):
+        self.stats = stats
+        self.redraw()
+
+    def schedule_redraw(self, event=None):
+        if self._redraw_job is not None:
+            self.canvas.after_cancel(self._redraw_job)
+        self._redraw_job = self.canvas.after(REDRAW_DELAY_MS, self.redraw)
+
+    def redraw(self):
+        self._redraw_job = None
+        canvas = self.canvas
+        canvas.delete("all")
+        width, height = canvas.winfo_width(), canvas.winfo_height()
+        if width < 2 * MARGIN or height < 2 * MARGIN:
+            return  # Not laid out yet
+        if self.stats is None or self.stats.empty:
+            text = "Select a project" if self.stats is None else "No effort recorded for this project"
+            canvas.create_text(width / 2, height / 2, text=text, font=FONT, fill=AXIS_COLOR)
+            return
+
+        middle = height * 0.55
+        self.draw_burn(0, 0, width, middle)
+        self.draw_categories(0, middle, width / 2, height)
+        self.draw_requirements(width / 2, middle, width, height)
+
+    def draw_burn(self, x0, y0, x1, y1):
+        """Weekly hours as a filled step area with the moving average as a line"""
+        import numpy as np
+
+        stats = self.stats
+        canvas = self.canvas
+        canvas.create_text(x0 + MARGIN, y0 + 15, anchor="w", font=TITLE_FONT,
+                           text=f"Hours per week (line: {stats.window}-week moving average)")
+        left, top, right, bottom = x0 + MARGIN, y0 + 35, x1 - 20, y1 - 30
+        peak = max(float(stats.weekly_totals.max()), float(stats.moving_average.max())) or 1.0
+        scale = (bottom - top) / peak
+        count = len(stats.weekly_totals)
+        step = (right - left) / count
+
+        # Step outline: two points per week (its left and right edge at the week's height)
+        edges = left + step * np.arange(count + 1)
+        xs = np.repeat(edges, 2)[1:-1]
+        ys = np.repeat(bottom - stats.weekly_totals * scale, 2)
+        outline = np.column_stack((xs, ys)).ravel()
+        canvas.create_polygon([left, bottom, *outline.tolist(), right, bottom], fill=BURN_COLOR, outline="")
+
+        if count > 1:
+            centers = left + step * (np.arange(count) + 0.5)
+            line = np.column_stack((centers, bottom - stats.moving_average * scale)).ravel()
+            canvas.create_line(line.tolist(), fill=AVERAGE_COLOR, width=2)
+
+        self._axes(left, top, right, bottom, peak)
+        canvas.create_text(left, bottom + 5, anchor="nw", font=FONT, fill=AXIS_COLOR, text=str(stats.weeks[0]))
+        canvas.create_text(right, bottom + 5, anchor="ne", font=FONT, fill=AXIS_COLOR, text=str(stats.weeks[-1]))
+
+    def draw_categories(self, x0, y0, x1, y1):
+        """One bar per effort category"""
+        stats = self.stats
+        canvas = self.canvas
+        canvas.create_text(x0 + MARGIN, y0 + 15, anchor="w", font=TITLE_FONT,
+                           text=f"Total hours by category ({stats.total_hours:,.1f} h)")
+        left, top, right, bottom = x0 + MARGIN, y0 + 35, x1 - 20, y1 - 30
+        peak = float(stats.category_totals.max()) or 1.0
+        slot = (right - left) / len(stats.category_totals)
+
+        for i, value in enumerate(stats.category_totals.tolist()):
+            bar_left = left + slot * i + slot * 0.15
+            bar_right = left + slot * (i + 1) - slot * 0.15
+            bar_top = bottom - value / peak * (bottom - top)
+            canvas.create_rectangle(bar_left, bar_top, bar_right, bottom, fill=CATEGORY_COLORS[i], outline="")
+            canvas.create_text((bar_left + bar_right) / 2, bar_top - 2, anchor="s", font=FONT, text=f"{value:,.0f}")
+            canvas.create_text((bar_left + bar_right) / 2, bottom + 5, anchor="n", font=FONT,
+                               text=CATEGORY_LABELS[i])
+        self._axes(left, top, right, bottom, peak)
+
+    def draw_requirements(self, x0, y0, x1, y1):
+        """Share of the project's hours per requirement, largest first"""
+        stats = self.stats
+        canvas = self.canvas
+        canvas.create_text(x0 + 20, y0 + 15, anchor="w", font=TITLE_FONT, text="Share of hours by requirement")
+        rows = stats.requirements[:SHARE_ROWS]
+        rest = stats.requirements[SHARE_ROWS:]
+        if rest:
+            rows = rows + [(f"Other ({len(rest)})", sum(r[1] for r in rest), sum(r[2] for r in rest))]
+
+        left, top, right, bottom = x0 + 20, y0 + 35, x1 - 20, y1 - 10
+        label_width = (right - left) * 0.4
+        row_height = min((bottom - top) / max(len(rows), 1), 24)
+        bar_left = left + label_width
+        for i, (name, hours, share) in enumerate(rows):
+            y = top + row_height * i
+            canvas.create_text(bar_left - 5, y + row_height / 2, anchor="e", font=FONT, text=_clip(name, 28))
+            bar_right = bar_left + (right - bar_left - 50) * share
+            canvas.create_rectangle(bar_left, y + 3, max(bar_right, bar_left + 1), y + row_height - 3,
+                                    fill=CATEGORY_COLORS[0], outline="")
+            canvas.create_text(bar_right + 4, y + row_height / 2, anchor="w", font=FONT, text=f"{share:.1%}")
+
+    def _axes(self, left, top, right, bottom, peak):
+        canvas = self.canvas
+        canvas.create_line(left, top, left, bottom, right, bottom, fill=AXIS_COLOR)
+        for fraction in (0.5, 1.0):
+            y = bottom - (bottom - top) * fraction
+            canvas.create_line(left - 3, y, left, y, fill=AXIS_COLOR)
+            canvas.create_text(left - 5, y, anchor="e", font=FONT, fill=AXIS_COLOR, text=f"{peak * fraction:,.0f}")
+
+
+def _clip(text, limit):
+    return text if len(text) <= limit else text[:limit - 1] + "…"
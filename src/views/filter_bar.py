@@ -0,0 +1,195 @@
+"""
+Filter Bar - Type-ahead filter for the lists of a tab
+The first time something is typed, every row of an attached list's source is
+read once (on the DB executor) and put into a TextIndex. From then on each
+keystroke filters that index in memory and shows the matches through a
+ListSource, so the database is not queried again and the VirtualTreeview
+only rewrites its visible lines. Clearing the filter puts the database
+source back. After a write the tab passes the stored row to row_saved() or
+the key to row_removed(), which patch the index in place; changed() (rows
+written elsewhere, not known here) drops the indexes so they are rebuilt.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from ..utils.text_index import TextIndex
+from .virtual_tree import ListSource
+
+
+def row_text(row):
+    """Default text of a row: every column after the id"""
+    return " ".join(str(value) for value in row[1:] if value is not None)
+
+
+class _Target:
+    """Filter state of one attached list"""
+
+    def __init__(self, text_of, key):
+        self.text_of = text_of
+        self.key = key        # key(row) of the list, so the index can patch rows by key
+        self.source = None    # Database source the tab set
+        self.index = None     # TextIndex over all rows of source, built on first use
+        self.loading = False  # Index being built
+        self.filtered = False  # List shows filtered rows instead of source
+        self.error = None     # Why the last index build failed, shown until the next try
+
+
+class FilterBar(ttk.Frame):
+    """Filter entry for one or more VirtualTreeviews
+
+    Attached lists must get their source through set_source() rather than
+    VirtualTreeview.set_source(), so the bar knows what to filter.
+    """
+
+    def __init__(self, parent, executor=None):
+        super().__init__(parent)
+        self.executor = executor
+        self.targets = []  # (VirtualTreeview, _Target)
+        self.var = tk.StringVar()
+
+        ttk.Label(self, text="Filter:").pack(side="left")
+        ttk.Entry(self, textvariable=self.var, width=30).pack(side="left", padx=5)
+        ttk.Button(self, text="Clear", command=self.clear).pack(side="left")
+        self.status = ttk.Label(self, text="")
+        self.status.pack(side="left", padx=10)
+        self.var.trace_add("write", lambda *args: self.apply())
+
+    def attach(self, virtual_list, text_of=row_text):
+        self.targets.append((virtual_list, _Target(text_of, virtual_list.row_key)))
+
+    @property
+    def active(self):
+        return bool(self.var.get().strip())
+
+    def set_source(self, virtual_list, source, focus=None):
+        """Give virtual_list a new database source, filtered if there is filter text
+
+        Scrolling to a row (focus) clears the filter, since the row may not match it.
+        """
+        if focus is not None and self.active:
+            self.clear()
+        target = self._target(virtual_list)
+        target.source = source
+        target.index = None
+        target.loading = False
+        target.error = None
+        if self.active and source is not None:
+            self._filter(virtual_list, target)
+        else:
+            target.filtered = False
+            virtual_list.set_source(source, focus=focus)
+        self._show_status()
+
+    def row_saved(self, virtual_list, row):
+        """row (as virtual_list shows it) was inserted or updated: patch the index"""
+        target = self._target(virtual_list)
+        if target.index is not None:
+            if target.key(row) in target.index:
+                target.index.replace(row)
+            else:
+                target.index.add(row)
+        self._patched(virtual_list, target)
+
+    def row_removed(self, virtual_list, key):
+        """The row with key was deleted, or no longer belongs to virtual_list"""
+        target = self._target(virtual_list)
+        if target.index is not None:
+            target.index.remove(key)
+        self._patched(virtual_list, target)
+
+    def _patched(self, virtual_list, target):
+        if target.loading:
+            # The rows being read may predate the write: read them again
+            target.loading = False
+            if target.filtered:
+                self._filter(virtual_list, target)
+        elif target.index is not None and target.filtered:
+            self._filter(virtual_list, target)
+        self._show_status()
+
+    def changed(self):
+        """Rows were written elsewhere: rebuild the indexes, straight away for lists showing a filter"""
+        for virtual_list, target in self.targets:
+            target.index = None
+            target.loading = False
+            if target.filtered:
+                self._filter(virtual_list, target)
+        self._show_status()
+
+    def clear(self):
+        self.var.set("")
+
+    def apply(self):
+        """Filter every attached list by the current text (called on each change of the entry)"""
+        active = self.active
+        for virtual_list, target in self.targets:
+            if target.source is None:
+                continue
+            if active:
+                self._filter(virtual_list, target)
+            elif target.filtered:
+                target.filtered = False
+                virtual_list.set_source(target.source)
+        self._show_status()
+
+    def _filter(self, virtual_list, target):
+        target.filtered = True
+        if target.index is not None:
+            virtual_list.set_source(ListSource(target.index.filter(self.var.get())))
+            return
+        if target.loading:
+            return  # The index is on its way; it is applied with the text current by then
+
+        # First use: read every row of the source once and index it
+        source = target.source
+        target.loading = True
+        target.error = None
+
+        def build():
+            return TextIndex(source.fetch(0, source.count()), target.text_of, target.key)
+
+        def built(index):
+            if target.source is not source or not target.loading:
+                return  # The project changed or rows were written meanwhile
+            target.index = index
+            target.loading = False
+            if target.filtered and self.active:
+                self._filter(virtual_list, target)
+            self._show_status()
+
+        def failed(error):
+            if target.source is not source or not target.loading:
+                return
+            # The list still shows the unfiltered rows; the next keystroke retries
+            target.loading = False
+            target.filtered = False
+            target.error = error
+            self._show_status()
+
+        if self.executor is not None:
+            self.executor.submit(build, on_done=built, on_error=failed,
+                                 key=f"filter_bar.{id(self)}.{id(virtual_list)}")
+        else:
+            built(build())
+
+    def _target(self, virtual_list):
+        for attached, target in self.targets:
+            if attached is virtual_list:
+                return target
+        raise KeyError(virtual_list)
+
+    def _show_status(self):
+        filtered = [(virtual_list, target) for virtual_list, target in self.targets if target.filtered]
+        errors = [target.error for _, target in self.targets if target.error is not None]
+        if errors and self.active:
+            text = f"Filter failed: {errors[0]}"
+        elif not filtered:
+            text = ""
+        elif any(target.index is None for _, target in filtered):
+            text = "Loading rows..."
+        else:
+            shown = sum(virtual_list.row_count for virtual_list, _ in filtered)
+            total = sum(len(target.index) for _, target in filtered)
+            text = f"{shown:,} of {total:,} rows"
+        self.status.config(text=text)
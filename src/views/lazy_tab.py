@@ -0,0 +1,30 @@
+"""
+Lazy Tab - Notebook page that is built the first time it is shown
+The notebook gets an empty placeholder frame straight away so the tab strip
+is complete; the real tab object (and the queries its constructor runs) is
+only created when build() is called, normally on first selection.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+
+class LazyTab:
+    """Placeholder page in notebook; factory(parent) creates the tab object, which must have a .frame"""
+
+    def __init__(self, notebook, text, factory):
+        self.factory = factory
+        self.tab = None
+        self.placeholder = ttk.Frame(notebook)
+        notebook.add(self.placeholder, text=text)
+
+    @property
+    def built(self):
+        return self.tab is not None
+
+    def build(self):
+        """Create the tab if it does not exist yet; returns the tab object"""
+        if self.tab is None:
+            self.tab = self.factory(self.placeholder)
+            self.tab.frame.pack(fill=tk.BOTH, expand=True)
+        return self.tab
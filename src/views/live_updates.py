@@ -0,0 +1,71 @@
+"""
+Live Updates - Apply other clients' changes to open VirtualTreeviews
+ChangeListener reports which rows of a table were inserted, updated or
+deleted. patch_rows() applies one batch to the lists showing that table:
+deleted rows are dropped in place, new and changed rows are read back by id
+(one query for the whole batch) and patched in, so only the affected lines
+are redrawn and nothing is re-read while the rows are off screen. A change
+without a row id (a bulk statement, TRUNCATE, a reconnect) or a large batch
+re-reads the lists instead, which keeps their scroll position.
+"""
+
+# Beyond this many changed rows one refresh is cheaper than patching row by row
+PATCH_LIMIT = 50
+
+
+def patch_rows(lists, changes, fetch, executor, place=None, append=True):
+    """Bring lists (VirtualTreeviews sharing row keys) up to date with changes
+
+    fetch(ids) returns the current rows with those ids; rows it leaves out
+    were deleted meanwhile. place(row) gives (list that shows row, row as
+    that list shows it), or (None, None) if no list does; by default every
+    row belongs to the first list. append says a new row sorts after every
+    other row (lists in id order); otherwise new rows make the list re-read.
+    """
+    if not changes:
+        return
+    if len(changes) > PATCH_LIMIT or any(change.id is None for change in changes):
+        for virtual_list in lists:
+            virtual_list.refresh()
+        return
+    place = place or (lambda row: (lists[0], row))
+
+    # Only the last change to a row matters
+    last_op = {}
+    for change in changes:
+        last_op[change.id] = change.op
+    stale = set()  # Lists whose row count is off, re-read at the end
+
+    for key, op in last_op.items():
+        if op == "delete" and not any(virtual_list.remove_row(key) for virtual_list in lists):
+            # Not on a loaded page, but the counts are off
+            stale.update(lists)
+
+    wanted = [key for key, op in last_op.items() if op != "delete"]
+    if not wanted:
+        for virtual_list in stale:
+            virtual_list.refresh()
+        return
+    sources = [virtual_list.source for virtual_list in lists]
+
+    def patched(rows):
+        if [virtual_list.source for virtual_list in lists] != sources:
+            return  # The lists show something else now, read fresh
+        found = {lists[0].row_key(row): row for row in rows}
+        for key in wanted:
+            target, row = place(found[key]) if key in found else (None, None)
+            others = [virtual_list for virtual_list in lists if virtual_list is not target]
+            # A row that moved to another list (or was deleted again) leaves the one that had it
+            moved = any(virtual_list.remove_row(key) for virtual_list in others)
+            if target is None or target.update_row(row):
+                continue
+            if last_op[key] == "insert" or moved:
+                if append and not moved:
+                    target.append_row(row)
+                else:
+                    stale.add(target)
+            # An updated row that is not loaded is read when it is scrolled to
+        for virtual_list in stale:
+            virtual_list.refresh()
+
+    executor.submit(fetch, wanted, on_done=patched)
@@ -0,0 +1,52 @@
+"""
+Progress Dialog - Window showing the progress of a long background task
+Shows a progress bar, the current step and a log of finished steps. It
+cannot be closed while the task runs; finish() enables the Close button.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+
+class ProgressDialog:
+    """Progress window for a task made of total steps"""
+
+    def __init__(self, parent, title, total):
+        self.total = total
+        self.running = True
+
+        self.top = tk.Toplevel(parent)
+        self.top.title(title)
+        self.top.resizable(False, False)
+        self.top.transient(parent.winfo_toplevel())
+        self.top.protocol("WM_DELETE_WINDOW", self.close)
+
+        frame = ttk.Frame(self.top, padding=15)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        self.label = ttk.Label(frame, text="Starting...")
+        self.label.pack(anchor="w")
+        self.bar = ttk.Progressbar(frame, mode="determinate", maximum=max(total, 1), length=360)
+        self.bar.pack(fill=tk.X, pady=10)
+        self.log = tk.Listbox(frame, height=max(total, 4), width=60)
+        self.log.pack(fill=tk.BOTH, expand=True)
+        self.close_button = ttk.Button(frame, text="Close", command=self.close, state="disabled")
+        self.close_button.pack(anchor="e", pady=(10, 0))
+
+    def update(self, done, text, line=None):
+        """Set the number of finished steps and the status text; line is added to the log"""
+        self.bar["value"] = done
+        self.label.config(text=text)
+        if line:
+            self.log.insert(tk.END, line)
+            self.log.see(tk.END)
+
+    def finish(self, text):
+        self.running = False
+        self.bar["value"] = self.total
+        self.label.config(text=text)
+        self.close_button.config(state="normal")
+
+    def close(self):
+        if not self.running:
+            self.top.destroy()
@@ -0,0 +1,244 @@
+"""
+Risk Matrix - Impact x probability grid for the Risks tab
+The grid, axis labels and legend are drawn once, when the view is created.
+show() only touches the markers of cells whose risks changed: each cell keeps
+its canvas items, which are re-texted, moved into place or hidden instead of
+being deleted and drawn again. A cell shows up to MAX_DOTS risks as numbered
+dots; more are drawn as a single count badge, so a cell holding hundreds of
+risks costs the same three canvas items. Tooltips come from one <Motion>
+binding on the canvas and the pooled Tooltip window, not from bindings per
+item, and their text is built from the cell's current risks when shown.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from .tooltip import Tooltip
+
+CELL_SIZE = 80
+LEFT_MARGIN = 130  # Space for impact labels
+TOP_MARGIN = 100   # Space for probability labels
+RIGHT_MARGIN = 20
+BOTTOM_MARGIN = 20
+BACKGROUND = "#f0f0f0"
+
+# (fill, border) by priority band
+COLORS = {
+    "critical": ("#e53935", "#c62828"),  # Red
+    "high": ("#f57c00", "#e65100"),      # Orange
+    "medium": ("#fbc02d", "#f9a825"),    # Amber
+    "low": ("#7cb342", "#558b2f"),       # Green
+}
+IMPACT_LABELS = ["Severe (5)", "Significant (4)", "Moderate (3)", "Minor (2)", "Minimal (1)"]
+PROBABILITY_LABELS = ["Rare (1)", "Unlikely (2)", "Possible (3)", "Likely (4)", "Almost Certain (5)"]
+
+# Cells with more risks than this show a count badge instead of dots
+MAX_DOTS = 4
+# Dot positions relative to the cell center, by number of dots in the cell
+DOT_OFFSETS = {
+    1: [(0, 0)],
+    2: [(-15, 0), (15, 0)],
+    3: [(0, -15), (-15, 10), (15, 10)],
+    4: [(-15, -15), (15, -15), (-15, 15), (15, 15)],
+}
+# Names listed in a badge's tooltip
+TOOLTIP_NAMES = 20
+BADGE = "badge"
+
+
+def priority_band(priority):
+    if priority >= 16:
+        return "critical"
+    if priority >= 10:
+        return "high"
+    if priority >= 5:
+        return "medium"
+    return "low"
+
+
+class _Cell:
+    """Marker items of one grid cell, kept for reuse"""
+
+    def __init__(self, center_x, center_y):
+        self.center = (center_x, center_y)
+        self.dots = []      # (shadow, dot, label) item ids, created as needed
+        self.badge = None   # (shadow, circle, label) item ids
+        self.risks = ()     # Risk rows currently shown
+
+
+class RiskMatrixView:
+    """Risk matrix in a frame; call show(title, rows) with RiskRepository.matrix_by_project() rows
+
+    on_cell_click(impact, probability) is called when a cell is clicked.
+    """
+
+    def __init__(self, parent, on_cell_click=None):
+        self.on_cell_click = on_cell_click
+        self.frame = ttk.Frame(parent)
+        self.title_label = ttk.Label(self.frame, text="", font=("Arial", 12, "bold"))
+        self.title_label.pack(anchor="w")
+
+        width = LEFT_MARGIN + 5 * CELL_SIZE + RIGHT_MARGIN
+        height = TOP_MARGIN + 5 * CELL_SIZE + BOTTOM_MARGIN
+        self.canvas = tk.Canvas(self.frame, width=width, height=height, background=BACKGROUND,
+                                highlightthickness=0)
+        self.canvas.pack(anchor="center", pady=5)
+
+        # Canvas item -> (cell key, dot index or BADGE), for the tooltip
+        self.item_targets = {}
+        self.cells = {}
+        self.tooltip = Tooltip(self.canvas)
+
+        self.draw_grid()
+        self.draw_legend()
+        ttk.Label(self.frame, text="Hover over risk indicators to see details. Click a cell to list its risks.",
+                  font=("Arial", 10, "italic")).pack(anchor="w")
+
+        self.canvas.bind("<Motion>", self.on_motion)
+        self.canvas.bind("<Leave>", lambda e: self.tooltip.hide())
+        self.canvas.bind("<Button-1>", self.on_click)
+
+    # --- Static parts (drawn once) ---
+
+    def draw_grid(self):
+        canvas = self.canvas
+        for row in range(5):  # Impact 5 .. 1
+            for col in range(5):  # Probability 1 .. 5
+                priority = (5 - row) * (col + 1)
+                fill, border = COLORS[priority_band(priority)]
+                x1 = LEFT_MARGIN + col * CELL_SIZE
+                y1 = TOP_MARGIN + row * CELL_SIZE
+                x2, y2 = x1 + CELL_SIZE, y1 + CELL_SIZE
+
+                # Subtle shadow for a 3D effect, then the cell and its priority
+                canvas.create_rectangle(x1 + 3, y1 + 3, x2 + 3, y2 + 3, fill="#d0d0d0", outline="", width=0)
+                canvas.create_rectangle(x1, y1, x2, y2, fill=fill, outline=border, width=2)
+                canvas.create_text(x1 + CELL_SIZE / 2, y1 + CELL_SIZE / 2, text=str(priority),
+                                   font=("Arial", 11, "bold"), fill="#ffffff")
+                self.cells[(col, row)] = _Cell(x1 + CELL_SIZE / 2, y1 + CELL_SIZE / 2)
+
+        # Axis titles and labels
+        canvas.create_text(20, TOP_MARGIN + 5 * CELL_SIZE / 2, text="IMPACT", font=("Arial", 12, "bold"),
+                           angle=90, anchor="center", fill="#333333")
+        canvas.create_text(LEFT_MARGIN + 5 * CELL_SIZE / 2, 20, text="PROBABILITY", font=("Arial", 12, "bold"),
+                           anchor="center", fill="#333333")
+        for i, label in enumerate(IMPACT_LABELS):
+            canvas.create_text(LEFT_MARGIN - 15, TOP_MARGIN + i * CELL_SIZE + CELL_SIZE / 2, text=label,
+                               font=("Arial", 10), anchor="e", fill="#333333")
+        for j, label in enumerate(PROBABILITY_LABELS):
+            canvas.create_text(LEFT_MARGIN + j * CELL_SIZE + CELL_SIZE / 2, TOP_MARGIN - 15, text=label,
+                               font=("Arial", 10), anchor="s", fill="#333333")
+
+    def draw_legend(self):
+        legend_frame = ttk.LabelFrame(self.frame, text="Risk Priority Legend", padding=5)
+        legend_frame.pack(fill="x", pady=5)
+        legend_items = [("Low (1-4)", "low"), ("Medium (5-9)", "medium"), ("High (10-15)", "high"),
+                        ("Critical (16-25)", "critical")]
+        for text, band in legend_items:
+            item_frame = ttk.Frame(legend_frame)
+            item_frame.pack(side="left", padx=20, pady=2)
+            color_box = tk.Canvas(item_frame, width=20, height=20, bg=BACKGROUND, highlightthickness=0)
+            color_box.create_rectangle(0, 0, 18, 18, fill=COLORS[band][0], outline="#666666")
+            color_box.pack(side="left", padx=5)
+            ttk.Label(item_frame, text=text).pack(side="left")
+
+    # --- Risk markers ---
+
+    def show(self, title, rows):
+        """Place the risks in rows; cells whose risks did not change are left alone"""
+        self.title_label.config(text=title)
+        by_cell = {key: [] for key in self.cells}
+        for row in rows:
+            impact, probability = row[4], row[5]
+            by_cell[(probability - 1, 5 - impact)].append(row)
+
+        for key, risks in by_cell.items():
+            self.update_cell(key, tuple(risks))
+        self.tooltip.hide()
+
+    def clear(self):
+        self.show("", [])
+
+    def update_cell(self, key, risks):
+        cell = self.cells[key]
+        if risks == cell.risks:
+            return
+        cell.risks = risks
+        count = len(risks)
+
+        # Dots for a few risks
+        shown = count if count <= MAX_DOTS else 0
+        for i in range(shown):
+            if i == len(cell.dots):
+                cell.dots.append(self._create_marker(key, i, fill="#3f51b5", outline="#303f9f",
+                                                     font=("Arial", 9, "bold")))
+            dx, dy = DOT_OFFSETS[shown][i]
+            self._place_marker(cell.dots[i], cell.center[0] + dx, cell.center[1] + dy, 12, str(risks[i][0]))
+        for items in cell.dots[shown:]:
+            self._hide_marker(items)
+
+        # One badge for many
+        if count > MAX_DOTS:
+            if cell.badge is None:
+                cell.badge = self._create_marker(key, BADGE, fill="#3949ab", outline="#1a237e",
+                                                 font=("Arial", 11, "bold"))
+            self._place_marker(cell.badge, cell.center[0], cell.center[1], 20, str(count))
+        elif cell.badge is not None:
+            self._hide_marker(cell.badge)
+
+    def _create_marker(self, key, target, fill, outline, font):
+        canvas = self.canvas
+        shadow = canvas.create_oval(0, 0, 0, 0, fill="#d0d0d0", outline="")
+        circle = canvas.create_oval(0, 0, 0, 0, fill=fill, outline=outline, width=2)
+        label = canvas.create_text(0, 0, text="", fill="white", font=font)
+        self.item_targets[circle] = self.item_targets[label] = (key, target)
+        return shadow, circle, label
+
+    def _place_marker(self, items, x, y, radius, text):
+        shadow, circle, label = items
+        canvas = self.canvas
+        canvas.coords(shadow, x - radius + 4, y - radius + 4, x + radius, y + radius)
+        canvas.coords(circle, x - radius, y - radius, x + radius, y + radius)
+        canvas.coords(label, x, y)
+        canvas.itemconfigure(label, text=text)
+        for item in items:
+            canvas.itemconfigure(item, state="normal")
+
+    def _hide_marker(self, items):
+        for item in items:
+            self.canvas.itemconfigure(item, state="hidden")
+
+    # --- Tooltip ---
+
+    def on_motion(self, event):
+        current = self.canvas.find_withtag("current")
+        target = self.item_targets.get(current[0]) if current else None
+        if target is None:
+            self.tooltip.hide()
+        else:
+            self.tooltip.show_later(target, event.x_root, event.y_root, lambda: self.tooltip_text(target))
+
+    def on_click(self, event):
+        col = int((event.x - LEFT_MARGIN) // CELL_SIZE)
+        row = int((event.y - TOP_MARGIN) // CELL_SIZE)
+        if self.on_cell_click is not None and 0 <= col < 5 and 0 <= row < 5:
+            self.on_cell_click(5 - row, col + 1)
+
+    def tooltip_text(self, target):
+        key, index = target
+        risks = self.cells[key].risks
+        if index == BADGE:
+            lines = [f"Multiple risks ({len(risks)}) in this cell:", ""]
+            lines += [f"{i + 1}. {risk[1]}" for i, risk in enumerate(risks[:TOOLTIP_NAMES])]
+            if len(risks) > TOOLTIP_NAMES:
+                lines.append(f"... and {len(risks) - TOOLTIP_NAMES} more")
+            return "\n".join(lines)
+
+        risk_id, name, description, status, impact, probability, priority = risks[index]
+        lines = [f"Risk ID: {risk_id}", f"Name: {name}"]
+        if description:
+            lines.append(f"Description: {description[:50]}..." if len(description) > 50
+                         else f"Description: {description}")
+        lines += [f"Impact: {impact}", f"Probability: {probability}", f"Priority: {priority}",
+                  f"Status: {status}"]
+        return "\n".join(lines)
@@ -0,0 +1,108 @@
+"""
+Search Window - Ranked results of the global search box
+Runs SearchRepository.search() a page at a time on the DB executor and lists
+the hits best match first; "More Results" appends the next page. Opening a
+hit (double-click, Enter or "Go to") hands it to on_open, which switches to
+the tab that owns the row and scrolls to it. The window is kept and reused
+for later searches.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+PAGE_SIZE = 50
+KIND_LABELS = {"project": "Project", "requirement": "Requirement", "risk": "Risk", "team_member": "Team Member"}
+
+
+class SearchWindow:
+    """Results window; search(text, limit, offset) returns hit rows, on_open(hit) jumps to one"""
+
+    def __init__(self, parent, search, executor, on_open):
+        self.search = search
+        self.executor = executor
+        self.on_open = on_open
+        self.text = ""
+        self.hits = []  # Result rows, in the order they are listed
+
+        self.top = tk.Toplevel(parent)
+        self.top.title("Search")
+        self.top.geometry("900x450")
+        self.top.protocol("WM_DELETE_WINDOW", self.top.withdraw)
+
+        bar = ttk.Frame(self.top, padding=(10, 10, 10, 0))
+        bar.pack(fill=tk.X)
+        self.entry = ttk.Entry(bar, width=50)
+        self.entry.pack(side="left")
+        self.entry.bind("<Return>", lambda e: self.run(self.entry.get()))
+        ttk.Button(bar, text="Search", command=lambda: self.run(self.entry.get())).pack(side="left", padx=5)
+        self.status = ttk.Label(bar, text="")
+        self.status.pack(side="left", padx=10)
+
+        columns = ("Type", "Project", "Name", "Detail", "Match")
+        frame = ttk.Frame(self.top, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(frame, columns=columns, show="headings", selectmode="browse")
+        for col, width in zip(columns, (90, 160, 180, 90, 360)):
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=width, stretch=col == "Match")
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill=tk.BOTH, expand=True)
+        scrollbar.pack(side="right", fill="y")
+        self.tree.bind("<Double-1>", lambda e: self.open_selected())
+        self.tree.bind("<Return>", lambda e: self.open_selected())
+
+        buttons = ttk.Frame(self.top, padding=(10, 0, 10, 10))
+        buttons.pack(fill=tk.X)
+        self.more_button = ttk.Button(buttons, text="More Results", command=self.load_more, state="disabled")
+        self.more_button.pack(side="left")
+        ttk.Button(buttons, text="Go to", command=self.open_selected).pack(side="right")
+
+    def run(self, text):
+        """Show the first page of results for text"""
+        self.text = text.strip()
+        self.entry.delete(0, tk.END)
+        self.entry.insert(0, self.text)
+        self.hits = []
+        self.tree.delete(*self.tree.get_children())
+        self.top.deiconify()
+        self.top.lift()
+        if not self.text:
+            self.status.config(text="")
+            self.more_button.config(state="disabled")
+            return
+        self._fetch()
+
+    def load_more(self):
+        if self.text:
+            self._fetch()
+
+    def _fetch(self):
+        text, offset = self.text, len(self.hits)
+        self.status.config(text="Searching...")
+        self.more_button.config(state="disabled")
+
+        def shown(rows):
+            if text != self.text or offset != len(self.hits):
+                return  # A newer search replaced this one
+            # One extra row was read to tell whether another page exists
+            more = len(rows) > PAGE_SIZE
+            for row in rows[:PAGE_SIZE]:
+                kind, _, _, project_name, title, detail, snippet = row
+                self.tree.insert("", tk.END, iid=str(len(self.hits)),
+                                 values=(KIND_LABELS.get(kind, kind), project_name or "", title, detail or "",
+                                         " ".join(snippet.split())))
+                self.hits.append(row)
+            self.status.config(text=f"{len(self.hits)}{'+' if more else ''} results" if self.hits else "No matches")
+            self.more_button.config(state="normal" if more else "disabled")
+
+        def failed(e):
+            self.status.config(text=f"Search failed: {e}")
+
+        self.executor.submit(self.search, text, PAGE_SIZE + 1, offset, on_done=shown, on_error=failed,
+                             key="search.results")
+
+    def open_selected(self):
+        selected = self.tree.focus()
+        if selected:
+            self.on_open(self.hits[int(selected)])
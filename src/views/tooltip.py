@@ -0,0 +1,71 @@
+"""
+Tooltip - One reusable hover tooltip window
+The window is created on first use; after that it is only re-texted, moved
+and withdrawn, never destroyed and rebuilt. show_later() waits
+HOVER_DELAY_MS before showing, so sweeping the pointer across many items
+does not flash a tooltip for each one, and once a tooltip is up, moving
+straight to another item switches it without waiting. The text comes from a
+callback that only runs when the tooltip actually appears.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+HOVER_DELAY_MS = 400
+OFFSET_X, OFFSET_Y = 15, 10
+
+
+class Tooltip:
+    """Hover tooltip shared by every item of widget"""
+
+    def __init__(self, widget, delay_ms=HOVER_DELAY_MS):
+        self.widget = widget
+        self.delay_ms = delay_ms
+        self.window = None
+        self.label = None
+        self.visible = False
+        self.target = None    # What the shown or pending tooltip belongs to
+        self._position = None
+        self._text = None
+        self._job = None
+
+    def show_later(self, target, x_root, y_root, text):
+        """Show text() for target near the pointer, after the hover delay; target is any hashable key"""
+        self._position = (x_root, y_root)
+        if target == self.target:
+            return
+        self._cancel()
+        self.target = target
+        self._text = text
+        if self.visible:
+            self._show()
+        else:
+            self._job = self.widget.after(self.delay_ms, self._show)
+
+    def hide(self):
+        self._cancel()
+        self.target = None
+        if self.visible:
+            self.window.withdraw()
+            self.visible = False
+
+    def _show(self):
+        self._job = None
+        if self.window is None:
+            self.window = tk.Toplevel(self.widget)
+            self.window.wm_overrideredirect(True)  # Remove window border
+            frame = ttk.Frame(self.window, relief="solid", borderwidth=1)
+            frame.pack(fill="both", expand=True)
+            self.label = ttk.Label(frame, background="#fffde7", padding=8, justify="left", font=("Arial", 10))
+            self.label.pack()
+        self.label.config(text=self._text())
+        x, y = self._position
+        self.window.geometry(f"+{x + OFFSET_X}+{y + OFFSET_Y}")
+        self.window.deiconify()
+        self.window.lift()
+        self.visible = True
+
+    def _cancel(self):
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
@@ -0,0 +1,422 @@
+"""
+Virtual Treeview - Scrollable list for result sets of any size
+A ttk.Treeview only holds as many items as fit on screen. Scrolling moves a
+window over the result set and rewrites those items in place, while the rows
+themselves are read from the database a page at a time (see
+database.PagedResult). Pages around the visible window are kept as a buffer;
+everything else is dropped, so memory stays flat however long the list is.
+After a write the caller can patch the loaded rows (update_row, append_row,
+remove_row) with the row the database returned instead of re-reading.
+Rows that are already in memory (e.g. a filtered list) are shown through a
+ListSource, which is read directly on the Tk thread.
+"""
+
+from tkinter import ttk
+
+DEFAULT_ROW_HEIGHT = 20
+DEFAULT_HEADING_HEIGHT = 25
+
+
+class ListSource:
+    """Source for rows that are already in memory"""
+
+    local = True
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+
+    def count(self):
+        return len(self.rows)
+
+    def fetch(self, start, limit):
+        return self.rows[start:start + limit]
+
+    def removed(self, index):
+        del self.rows[index]
+
+
+class VirtualTreeview(ttk.Frame):
+    """Treeview plus scrollbar backed by a paged source
+
+    source      - object with count() and fetch(start, limit), or None for an empty list;
+                  if it has removed(index) it is told about rows dropped with remove_row()
+    row_to_item - turns one source row into (values, tags) for the Treeview
+    row_key     - returns the key the source is ordered by (default: the first column)
+                  and that identifies selected rows
+    executor    - DBExecutor used to read pages off the Tk thread (optional); sources with
+                  local = True are read directly
+
+    With selectmode="extended" several rows can be selected. The selection is
+    kept as row keys, so it survives scrolling the rows out of view and back.
+    """
+
+    def __init__(self, parent, columns, row_to_item, executor=None, page_size=100, buffer_pages=1,
+                 row_key=None, **tree_options):
+        super().__init__(parent)
+        self.row_to_item = row_to_item
+        self.row_key = row_key or (lambda row: row[0])
+        self.executor = executor
+        self.page_size = page_size
+        self.buffer_pages = buffer_pages
+
+        tree_options.setdefault("show", "headings")
+        tree_options.setdefault("selectmode", "browse")
+        self.multiple = tree_options["selectmode"] == "extended"
+        self.tree = ttk.Treeview(self, columns=columns, **tree_options)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self._source = None
+        self._generation = 0      # Bumped on every reload so late pages are ignored
+        self._reloading = False   # Count and first page not read yet
+        self._total = 0           # Rows in the source
+        self._extra = []          # (values, tags) shown after the source rows, e.g. a totals line
+        self._pages = {}          # page number -> rows
+        self._loading = set()     # page numbers currently being read
+        self._offset = 0          # Index of the first visible row
+        self._visible = 1         # Rows that fit in the widget
+        self._slots = []          # Treeview item ids, one per visible line
+        self._focus_index = None  # Index of the focused row in the whole list
+        self._selected = set()    # Keys of the selected rows (extended selectmode)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self._on_wheel)
+        self.tree.bind("<Up>", lambda e: self._move_focus(-1))
+        self.tree.bind("<Down>", lambda e: self._move_focus(1))
+        self.tree.bind("<Prior>", lambda e: self._move_focus(-self._visible))
+        self.tree.bind("<Next>", lambda e: self._move_focus(self._visible))
+
+    # --- Public API ---
+
+    def set_source(self, source, focus=None):
+        """Show a new result set from the top, or scrolled to and focused on row index focus"""
+        self._source = source
+        self._extra = []
+        self._offset = 0 if focus is None else max(0, focus - self._visible // 2)
+        self._focus_index = focus
+        self._selected = set()
+        self._reload()
+
+    def refresh(self):
+        """Re-read the current source, keeping the scroll position (e.g. after a write)"""
+        self._reload()
+
+    def set_extra_rows(self, items):
+        """Rows appended after the source rows; items are (values, tags) pairs"""
+        self._extra = list(items)
+        self._render()
+
+    def update_row(self, row):
+        """Replace the loaded row with the same key; returns False if no loaded row has it"""
+        location = self._find(self.row_key(row))
+        if location is None:
+            return False
+        page, pos = location
+        self._pages[page][pos] = row
+        self._render()
+        return True
+
+    def append_row(self, row):
+        """Add a row whose key sorts after every other row, e.g. one with a new serial id"""
+        if self._reloading or self._source is None:
+            self.refresh()
+            return
+        page, pos = divmod(self._total, self.page_size)
+        rows = self._pages.get(page)
+        if rows is not None and pos == len(rows):
+            rows.append(row)
+        elif pos == 0:
+            self._pages[page] = [row]
+        # Otherwise the last page is not loaded and will be read with the new row in it
+        self._total += 1
+        self._discard_loads()
+        self._render()
+
+    def remove_row(self, key):
+        """Drop the loaded row with this key; returns False if no loaded row has it"""
+        self._selected.discard(key)
+        location = None if self._reloading else self._find(key)
+        if location is None:
+            return False
+        page, pos = location
+        index = page * self.page_size + pos
+
+        # The rows after it move up: pull the first row of each following loaded page back
+        rows = self._pages[page]
+        del rows[pos]
+        while page + 1 in self._pages:
+            rows.append(self._pages[page + 1].pop(0))
+            page += 1
+            rows = self._pages[page]
+        self._total -= 1
+        # The last page touched is one row short unless it is the end of the list
+        if page * self.page_size + len(rows) < self._total or not rows:
+            del self._pages[page]
+        # Pages loaded past a gap were not shifted and are now one row off: read them again
+        for later in [number for number in self._pages if number > page]:
+            del self._pages[later]
+
+        if hasattr(self._source, "removed"):
+            self._source.removed(index)
+        if self._focus_index is not None:
+            if self._focus_index == index:
+                self._focus_index = None
+            elif self._focus_index > index:
+                self._focus_index -= 1
+        self._discard_loads()
+        self._render()
+        return True
+
+    @property
+    def row_count(self):
+        return self._total
+
+    @property
+    def source(self):
+        return self._source
+
+    @property
+    def extra_rows(self):
+        return list(self._extra)
+
+    def focus_row(self):
+        """Source row of the focused line, or None (nothing focused, extra row, or not loaded yet)"""
+        if self._focus_index is None:
+            return None
+        return self._row_at(self._focus_index)
+
+    def selected_keys(self):
+        """Keys of the selected rows, including ones scrolled out of view (extended selectmode)
+
+        In browse mode this is the focused row's key, if any.
+        """
+        if self.multiple:
+            return sorted(self._selected)
+        row = self.focus_row()
+        return [] if row is None else [self.row_key(row)]
+
+    def focus_extra(self):
+        """(values, tags) of the focused line if it is one of the extra rows"""
+        index = self._focus_index
+        if index is None or index < self._total or index - self._total >= len(self._extra):
+            return None
+        return self._extra[index - self._total]
+
+    # --- Loading ---
+
+    def _reload(self):
+        self._generation += 1
+        self._pages = {}
+        self._loading = set()
+        source = self._source
+        if source is None:
+            self._total = 0
+            self._reloading = False
+            self._render()
+            return
+        self._reloading = True
+
+        generation = self._generation
+        page = self._offset // self.page_size
+
+        def read():
+            return source.count(), source.fetch(page * self.page_size, self.page_size)
+
+        def loaded(result):
+            if generation != self._generation:
+                return
+            self._reloading = False
+            self._total, self._pages[page] = result
+            self._render()
+
+        self._run(read, loaded, key=f"virtual_tree.{id(self)}.reload")
+
+    def _load_page(self, page):
+        if page in self._loading:
+            return
+        self._loading.add(page)
+        generation = self._generation
+        source = self._source
+
+        def loaded(rows):
+            if generation != self._generation:
+                return
+            self._loading.discard(page)
+            self._pages[page] = rows
+            self._render()
+
+        self._run(lambda: source.fetch(page * self.page_size, self.page_size), loaded,
+                  key=f"virtual_tree.{id(self)}.{page}")
+
+    def _discard_loads(self):
+        # Pages still being read were requested for the old row positions
+        if self._loading:
+            self._generation += 1
+            self._loading = set()
+
+    def _row_at(self, index):
+        # Loaded source row at index, or None
+        if index >= self._total:
+            return None
+        page, pos = divmod(index, self.page_size)
+        rows = self._pages.get(page)
+        if rows is None or pos >= len(rows):
+            return None
+        return rows[pos]
+
+    def _find(self, key):
+        for page, rows in self._pages.items():
+            for pos, row in enumerate(rows):
+                if self.row_key(row) == key:
+                    return page, pos
+        return None
+
+    def _run(self, fn, on_done, key):
+        if self.executor is not None and not getattr(self._source, "local", False):
+            self.executor.submit(fn, on_done=on_done, key=key)
+        else:
+            on_done(fn())
+
+    # --- Drawing ---
+
+    def _render(self):
+        total_rows = self._total + len(self._extra)
+        self._offset = max(0, min(self._offset, total_rows - self._visible))
+        count = max(0, min(self._visible, total_rows - self._offset))
+
+        # Reuse the same items; only their contents change while scrolling
+        while len(self._slots) < count:
+            self._slots.append(self.tree.insert('', 'end'))
+        while len(self._slots) > count:
+            self.tree.delete(self._slots.pop())
+
+        missing = set()
+        for i, item in enumerate(self._slots):
+            index = self._offset + i
+            if index >= self._total:
+                values, tags = self._extra[index - self._total]
+            else:
+                page, pos = divmod(index, self.page_size)
+                rows = self._pages.get(page)
+                if rows is None:
+                    values, tags = ("Loading...",), ()
+                    missing.add(page)
+                elif pos < len(rows):
+                    values, tags = self.row_to_item(rows[pos])
+                else:
+                    # Rows were deleted after the count was taken
+                    values, tags = (), ()
+            self.tree.item(item, values=values, tags=tags)
+
+        # Keep the highlight on the same row, not the same line
+        focus_pos = None if self._focus_index is None else self._focus_index - self._offset
+        if self.multiple:
+            selected = []
+            for i, item in enumerate(self._slots):
+                row = self._row_at(self._offset + i)
+                if row is not None and self.row_key(row) in self._selected:
+                    selected.append(item)
+            self.tree.selection_set(selected)
+            if focus_pos is not None and 0 <= focus_pos < count:
+                self.tree.focus(self._slots[focus_pos])
+        elif focus_pos is not None and 0 <= focus_pos < count:
+            self.tree.selection_set(self._slots[focus_pos])
+            self.tree.focus(self._slots[focus_pos])
+        else:
+            self.tree.selection_set(())
+
+        if total_rows:
+            self.scrollbar.set(self._offset / total_rows, (self._offset + count) / total_rows)
+        else:
+            self.scrollbar.set(0, 1)
+
+        # Read what is on screen first, then one buffer page either side
+        if self._total:
+            first = self._offset // self.page_size
+            last = min(self._offset + max(count, 1) - 1, self._total - 1) // self.page_size
+            wanted = range(max(0, first - self.buffer_pages),
+                           min((self._total - 1) // self.page_size, last + self.buffer_pages) + 1)
+            for page in sorted(missing):
+                self._load_page(page)
+            for page in wanted:
+                if page not in self._pages:
+                    self._load_page(page)
+            for page in list(self._pages):
+                if page not in wanted:
+                    del self._pages[page]
+
+    # --- Events ---
+
+    def _scroll_to(self, offset):
+        self._offset = int(offset)
+        self._render()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self._scroll_to(float(amount) * (self._total + len(self._extra)))
+        elif action == "scroll":
+            step = self._visible if unit == "pages" else 1
+            self._scroll_to(self._offset + int(amount) * step)
+
+    def _on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self._scroll_to(self._offset - 3)
+        else:
+            self._scroll_to(self._offset + 3)
+        return "break"
+
+    def _on_resize(self, event):
+        row_height = DEFAULT_ROW_HEIGHT
+        top = DEFAULT_HEADING_HEIGHT
+        if self._slots:
+            bbox = self.tree.bbox(self._slots[0])
+            if bbox:
+                top, row_height = bbox[1], bbox[3]
+        visible = max(1, (event.height - top) // row_height)
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    def _on_select(self, event):
+        selection = self.tree.selection()
+        if not self.multiple:
+            if selection and selection[0] in self._slots:
+                self._focus_index = self._offset + self._slots.index(selection[0])
+            return
+
+        focus = self.tree.focus()
+        if focus in selection and focus in self._slots:
+            self._focus_index = self._offset + self._slots.index(focus)
+        # The tree only knows about the visible lines; selected rows elsewhere stay selected
+        visible, chosen = set(), set()
+        for i, item in enumerate(self._slots):
+            row = self._row_at(self._offset + i)
+            if row is not None:
+                visible.add(self.row_key(row))
+                if item in selection:
+                    chosen.add(self.row_key(row))
+        self._selected = (self._selected - visible) | chosen
+
+    def _move_focus(self, delta):
+        total_rows = self._total + len(self._extra)
+        if not total_rows:
+            return "break"
+        if self._focus_index is None:
+            self._focus_index = self._offset
+        else:
+            self._focus_index = max(0, min(self._focus_index + delta, total_rows - 1))
+        if self.multiple:
+            # Moving with the keyboard selects just the new row
+            row = self._row_at(self._focus_index)
+            self._selected = set() if row is None else {self.row_key(row)}
+        if self._focus_index < self._offset:
+            self._offset = self._focus_index
+        elif self._focus_index >= self._offset + self._visible:
+            self._offset = self._focus_index - self._visible + 1
+        self._render()
+        return "break"
@@ -140,7 +140,8 @@ def style_main_app(app):
 def patch_main_application():
     """
     Patch the main application to use the styles
-    This function should be called before the application is initialized
+    Not called on import: importing the main module from here loads it a
+    second time. The application now applies styles explicitly at startup.
     """
     if not STYLES_AVAILABLE:
         return
@@ -170,13 +171,9 @@ def patch_main_application():
         print(f"Styles integration error: {e}")
         return False
 
-# Apply the styles when this module is imported
-apply_result = patch_main_application()
-
 if __name__ == "__main__":
     print("Style Integration Module")
     print(f"Styles available: {STYLES_AVAILABLE}")
-    print(f"Patch result: {apply_result}")
     
     # Test the styles with a small demo
     if STYLES_AVAILABLE:
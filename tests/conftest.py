@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The modules are imported as src.utils.* / src.views.*, as the main script does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
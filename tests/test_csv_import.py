@@ -0,0 +1,134 @@
+import csv
+import io
+
+import pytest
+
+from src.utils.csv_import import (CSV_IMPORTS, ImportResult, Lookups, PROJECT_IDS, REQUIREMENT_IDS, _ChunkReader,
+                                  _check_keys, _choice, _copy_chunks, _date, _hours, _required, format_report)
+
+
+class FakeTx:
+    """Answers query() from a {statement: rows} map"""
+
+    def __init__(self, results):
+        self.results = results
+
+    def query(self, statement, params=None):
+        return self.results[statement]
+
+
+def lookups(requirements=()):
+    loaded = Lookups()
+    loaded.load(FakeTx({PROJECT_IDS: [("Alpha", 1), ("Beta", 2)], REQUIREMENT_IDS: list(requirements)}))
+    return loaded
+
+
+def test_required_and_choice():
+    assert _required("x", "name") == "x"
+    with pytest.raises(ValueError, match="name is empty"):
+        _required("", "name")
+    assert _choice("high", ("low", "high"), "status") == "high"
+    with pytest.raises(ValueError, match="status 'urgent' is not one of low, high"):
+        _choice("urgent", ("low", "high"), "status")
+
+
+def test_hours():
+    assert _hours(["1.5", "", "0", "8"]) == ["1.5", "0", "0", "8"]
+    with pytest.raises(ValueError, match="not a number"):
+        _hours(["1", "lots"])
+    with pytest.raises(ValueError, match="negative"):
+        _hours(["-2"])
+
+
+def test_date():
+    assert _date("2024-02-29") == "2024-02-29"
+    for value in ("2023-02-29", "29/02/2024", ""):
+        with pytest.raises(ValueError, match="YYYY-MM-DD"):
+            _date(value)
+
+
+def test_lookups_resolve_names():
+    loaded = lookups([(1, "Req A", 10), (2, "Req A", 20)])
+    assert loaded.project_id("Beta") == 2
+    assert loaded.requirement_id("Alpha", "Req A") == 10
+    assert loaded.requirement_id("Beta", "Req A") == 20
+    with pytest.raises(ValueError, match="unknown project 'Gamma'"):
+        loaded.project_id("Gamma")
+    with pytest.raises(ValueError, match="unknown requirement 'Req B'"):
+        loaded.requirement_id("Alpha", "Req B")
+
+
+def test_lookups_reject_ambiguous_requirement_names():
+    loaded = lookups([(1, "Req A", 10), (1, "Req A", 11), (1, "Req A", 12), (2, "Req A", 20)])
+    with pytest.raises(ValueError, match="ambiguous requirement name 'Req A': 3 requirements"):
+        loaded.requirement_id("Alpha", "Req A")
+    assert loaded.requirement_id("Beta", "Req A") == 20
+
+
+def test_converters():
+    loaded = lookups([(1, "Req A", 10)])
+    risks = CSV_IMPORTS["risks"].convert(["Alpha", "R1", "desc", "high"], loaded)
+    assert risks == (1, "R1", "desc", "high")
+    effort = CSV_IMPORTS["effort"].convert(["Alpha", "Req A", "2024-01-02", "1", "", "2", "3", "4"], loaded)
+    assert effort == (10, "2024-01-02", "1", "0", "2", "3", "4")
+    with pytest.raises(ValueError, match="type 'other'"):
+        CSV_IMPORTS["requirements"].convert(["Alpha", "Req", "other", "pending", ""], loaded)
+
+
+def copy_text(name, text, loaded):
+    """(CSV text handed to COPY, ImportResult) for a file's text"""
+    spec = CSV_IMPORTS[name]
+    reader = csv.reader(io.StringIO(text))
+    next(reader)  # The header, checked by _import_file()
+    result = ImportResult(name, "file.csv")
+    return _ChunkReader(_copy_chunks(spec, reader, loaded, result, None)).read(), result
+
+
+def test_copy_chunks_stage_valid_rows_with_line_numbers():
+    header = ",".join(CSV_IMPORTS["risks"].export.header)
+    staged, result = copy_text("risks", f"{header}\nAlpha, R1 ,d,low\n\nBeta,R2,\"a, b\",high\n", lookups())
+    assert staged == '2,1,R1,d,low\n4,2,R2,"a, b",high\n'
+    assert result.rows == 2 and result.error_count == 0
+
+
+def test_copy_chunks_report_invalid_rows():
+    header = ",".join(CSV_IMPORTS["risks"].export.header)
+    text = f"{header}\nAlpha,R1,d,low\nAlpha,R2\nGamma,R3,d,low\nAlpha,,d,low\nAlpha,R5,d,severe\n"
+    staged, result = copy_text("risks", text, lookups())
+    assert staged == "2,1,R1,d,low\n"
+    assert result.rows == 5 and result.error_count == 4
+    assert [line for line, _ in result.errors] == [3, 4, 5, 6]
+    assert "expected 4 columns, found 2" in result.errors[0][1]
+    assert "unknown project 'Gamma'" in result.errors[1][1]
+
+
+def test_chunk_reader_serves_reads_of_any_size():
+    reader = _ChunkReader(iter(["abc", "", "defg", "h"]))
+    assert reader.read(2) == "ab"
+    assert reader.read(4) == "cdef"
+    assert reader.read() == "gh"
+    assert reader.read(3) == ""
+
+
+def test_check_keys_reports_each_line_once():
+    spec = CSV_IMPORTS["risks"]
+    tx = FakeTx({spec.REPEATED: [(7, "R1", 3)], spec.AMBIGUOUS: [(7, "R1", 2), (9, "R2", 3)]})
+    result = ImportResult("risks", "file.csv")
+    _check_keys(tx, spec, result)
+    assert result.error_count == 2
+    assert result.errors[0][0] == 7 and "repeats line 3" in result.errors[0][1] and "matches 2" in result.errors[0][1]
+    assert result.errors[1][0] == 9 and "matches 3 existing rows" in result.errors[1][1]
+
+
+def test_format_report():
+    ok = ImportResult("risks", "/tmp/risks.csv")
+    ok.rows, ok.inserted, ok.updated = 3, 2, 1
+    assert format_report([ok], dry_run=True).splitlines() == [
+        "risks.csv: 3 rows", "  2 would be added, 1 would be updated", "", "Validation only: nothing was imported."]
+
+    bad = ImportResult("effort", "/tmp/effort.csv")
+    bad.rows = 1
+    bad.add_error(2, "negative hours (-1)")
+    report = format_report([ok, bad], dry_run=False)
+    assert "    line 2: negative hours (-1)" in report
+    assert report.endswith("Nothing was imported. Fix the rows above and try again.")
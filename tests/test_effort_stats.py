@@ -0,0 +1,49 @@
+import datetime
+
+import pytest
+
+from src.utils.effort_stats import compute_stats
+
+pytest.importorskip("numpy")  # Optional dependency, as in the dashboard
+
+EPOCH = datetime.date(1970, 1, 1)
+
+
+def week(year, month, day):
+    """Rollup week column: days since the epoch of a Monday"""
+    return (datetime.date(year, month, day) - EPOCH).days
+
+
+# (requirement_id, week, entries, 5 category hours)
+ROWS = [
+    (1, week(2024, 1, 1), 3, 1.0, 2.0, 3.0, 0.0, 0.0),
+    (2, week(2024, 1, 1), 1, 0.0, 0.0, 4.0, 0.0, 0.0),
+    (1, week(2024, 1, 15), 2, 0.0, 0.0, 0.0, 6.0, 2.0),
+]
+
+
+def test_empty_project():
+    stats = compute_stats(5, [], {})
+    assert stats.empty and stats.total_hours == 0.0 and stats.weeks is None
+
+
+def test_totals_and_weeks_without_gaps():
+    stats = compute_stats(5, ROWS, {1: "Login", 2: "Export"})
+    assert stats.entries == 6
+    assert stats.total_hours == 18.0
+    assert stats.category_totals.tolist() == [1.0, 2.0, 7.0, 6.0, 2.0]
+    # The empty week in between is listed with no hours
+    assert stats.weeks.tolist() == [datetime.date(2024, 1, 1), datetime.date(2024, 1, 8), datetime.date(2024, 1, 15)]
+    assert stats.weekly_totals.tolist() == [10.0, 0.0, 8.0]
+    assert stats.burn.shape == (3, 5)
+
+
+def test_moving_average_over_the_weeks_that_exist():
+    stats = compute_stats(5, ROWS, {}, window=2)
+    assert stats.moving_average.tolist() == [10.0, 5.0, 4.0]
+
+
+def test_requirements_by_share_largest_first():
+    stats = compute_stats(5, ROWS, {1: "Login"})
+    assert [(name, hours) for name, hours, _ in stats.requirements] == [("Login", 14.0), ("#2", 4.0)]
+    assert sum(share for _, _, share in stats.requirements) == pytest.approx(1.0)
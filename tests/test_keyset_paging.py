@@ -0,0 +1,126 @@
+from src.utils.database import KeysetQuery
+
+
+class FakeDb:
+    """Answers a KeysetQuery's statements from rows in memory, recording which ones ran
+
+    key(row) gives the sort key; the query's single parameter (a project id) is ignored.
+    """
+
+    def __init__(self, query, rows, key, descending=False):
+        self.keyset = query
+        self.rows = rows
+        self.key = key
+        self.descending = descending
+        self.calls = []
+
+    def ordered(self):
+        return sorted(self.rows, key=self.key, reverse=self.descending)
+
+    def after(self, anchor):
+        if self.descending:
+            return [row for row in self.ordered() if self.key(row) < anchor]
+        return [row for row in self.ordered() if self.key(row) > anchor]
+
+    def _run(self, statement, params):
+        q = self.keyset
+        name = {q.FIRST: "first", q.AFTER: "after", q.KEY_AT: "key_at", q.COUNT: "count", q.INDEX_OF: "index_of"}
+        self.calls.append(name[statement])
+        args = params[1:]  # Drop the project id
+        if statement is q.FIRST:
+            return self.ordered()[:args[-1]]
+        if statement is q.AFTER:
+            return self.after(tuple(args[:-1]))[:args[-1]]
+        if statement is q.KEY_AT:
+            rows = self.ordered()[args[0]:args[0] + 1]
+            return [self.key(row) for row in rows]
+        if statement is q.COUNT:
+            return [(len(self.rows),)]
+        if statement is q.INDEX_OF:
+            before = [row for row in self.rows
+                      if (self.key(row) > tuple(args) if self.descending else self.key(row) < tuple(args))]
+            return [(len(before),)]
+        raise AssertionError(statement.name)
+
+    def query(self, statement, params=()):
+        return self._run(statement, params)
+
+    def query_one(self, statement, params=()):
+        rows = self._run(statement, params)
+        return rows[0] if rows else None
+
+    def query_value(self, statement, params=()):
+        row = self.query_one(statement, params)
+        return row[0] if row else None
+
+
+def by_id(count):
+    query = KeysetQuery("test.by_id", "id, name", "items", "project_id = %s", "id")
+    db = FakeDb(query, [(i, f"item {i}") for i in range(1, count + 1)], key=lambda row: (row[0],))
+    return db, query.bind(db, 7)
+
+
+def test_sql_for_tuple_keys_in_descending_order():
+    query = KeysetQuery("test.priority", "id, name, priority", "risks", "project_id = %s",
+                        ("priority", "id"), key_index=(2, 0), descending=True)
+    assert "(priority, id) < (%s, %s) ORDER BY priority DESC, id DESC LIMIT %s" in query.AFTER.sql
+    assert "(priority, id) > (%s, %s)" in query.INDEX_OF.sql
+    assert query.key_indexes == (2, 0)
+
+
+def test_scrolling_down_follows_anchors_without_offsets():
+    db, result = by_id(25)
+    pages = [result.fetch(start, 10) for start in (0, 10, 20)]
+    assert [row[0] for page in pages for row in page] == list(range(1, 26))
+    assert db.calls == ["first", "after", "after"]
+    assert result.fetch(30, 10) == []
+
+
+def test_jumping_to_an_unread_page_looks_up_its_anchor_once():
+    db, result = by_id(50)
+    assert [row[0] for row in result.fetch(30, 5)] == [31, 32, 33, 34, 35]
+    assert db.calls == ["key_at", "after"]
+    assert [row[0] for row in result.fetch(35, 5)] == [36, 37, 38, 39, 40]
+    assert db.calls == ["key_at", "after", "after"]
+
+
+def test_tuple_keys_page_in_descending_order():
+    query = KeysetQuery("test.priority", "id, name, priority", "risks", "project_id = %s",
+                        ("priority", "id"), key_index=(2, 0), descending=True)
+    rows = [(i, f"risk {i}", i % 4) for i in range(1, 21)]
+    db = FakeDb(query, rows, key=lambda row: (row[2], row[0]), descending=True)
+    result = query.bind(db, 7)
+    read = result.fetch(0, 6) + result.fetch(6, 6) + result.fetch(12, 6) + result.fetch(18, 6)
+    assert read == sorted(rows, key=lambda row: (row[2], row[0]), reverse=True)
+    assert "key_at" not in db.calls
+
+
+def test_removed_moves_later_anchors_up():
+    db, result = by_id(30)
+    for start in (0, 10, 20):
+        result.fetch(start, 10)
+    # Row 5 (id 6) is deleted: the pages after it start one row earlier
+    db.rows = [row for row in db.rows if row[0] != 6]
+    result.removed(5)
+    db.calls.clear()
+    assert [row[0] for row in result.fetch(9, 10)] == list(range(11, 21))
+    assert [row[0] for row in result.fetch(19, 10)] == list(range(21, 31))
+    assert db.calls == ["after", "after"]
+
+
+def test_removing_the_last_row_of_a_page_drops_its_anchor():
+    db, result = by_id(30)
+    result.fetch(0, 10)
+    result.fetch(10, 10)
+    db.rows = [row for row in db.rows if row[0] != 10]
+    result.removed(9)
+    db.calls.clear()
+    assert [row[0] for row in result.fetch(9, 10)] == list(range(11, 21))
+    assert db.calls == ["key_at", "after"]
+
+
+def test_index_of_and_count():
+    db, result = by_id(30)
+    assert result.count() == 30
+    assert result.index_of(1) == 0
+    assert result.index_of((17,)) == 16
@@ -0,0 +1,122 @@
+import random
+
+from src.utils.text_index import TextIndex, tokenize
+
+ROWS = [
+    (1, "Payment gateway", "integrate the card provider"),
+    (2, "Login page", "password reset by mail"),
+    (3, "Report export", "monthly payment report as PDF"),
+    (4, "Audit log", "who changed what"),
+]
+
+
+def text_of(row):
+    return " ".join(row[1:])
+
+
+def ids(rows):
+    return [row[0] for row in rows]
+
+
+def brute_force(rows, text):
+    words = tokenize(text)
+    return [row for row in rows
+            if all(any(w.startswith(word) for w in tokenize(text_of(row))) for word in words)]
+
+
+def test_tokenize_lowercases_and_splits_on_non_word_characters():
+    assert tokenize("Re-quire  MENTS, v2") == ["re", "quire", "ments", "v2"]
+
+
+def test_filter_matches_word_prefixes_in_original_order():
+    index = TextIndex(ROWS, text_of)
+    assert ids(index.filter("pay")) == [1, 3]
+    assert ids(index.filter("PAYMENT rep")) == [3]
+    assert ids(index.filter("ment")) == []  # Prefixes of words, not substrings
+
+
+def test_empty_filter_returns_every_row():
+    index = TextIndex(ROWS, text_of)
+    assert ids(index.filter("")) == [1, 2, 3, 4]
+    assert ids(index.filter("  ,")) == [1, 2, 3, 4]
+
+
+def test_typing_on_and_back_matches_a_fresh_search():
+    index = TextIndex(ROWS, text_of)
+    for text in ["p", "pa", "pay", "pay r", "pay re", "pay", "p", "lo", "log", "l"]:
+        assert index.filter(text) == brute_force(ROWS, text), text
+
+
+def test_filter_agrees_with_brute_force_on_random_rows():
+    rng = random.Random(1)
+    vocabulary = ["".join(rng.choice("abcde") for _ in range(rng.randint(1, 5))) for _ in range(60)]
+    rows = [(i, " ".join(rng.choice(vocabulary) for _ in range(5))) for i in range(300)]
+    index = TextIndex(rows, text_of)
+    for _ in range(200):
+        text = " ".join(rng.choice(vocabulary)[:rng.randint(1, 3)] for _ in range(rng.randint(1, 3)))
+        assert index.filter(text) == brute_force(rows, text), text
+
+
+def test_add_lists_the_row_last():
+    index = TextIndex(ROWS, text_of)
+    index.filter("pay")
+    index.add((5, "Payroll", "new words zebra"))
+    assert ids(index.filter("pay")) == [1, 3, 5]
+    assert ids(index.filter("zeb")) == [5]
+    assert len(index) == 5 and 5 in index
+
+
+def test_replace_reindexes_in_place():
+    index = TextIndex(ROWS, text_of)
+    index.filter("login")
+    index.replace((2, "Sign in page", "password reset"))
+    assert ids(index.filter("login")) == []
+    assert ids(index.filter("sign")) == [2]
+    assert ids(index.filter("")) == [1, 2, 3, 4]
+
+
+def test_remove_drops_the_row_everywhere():
+    index = TextIndex(ROWS, text_of)
+    index.filter("pay")
+    index.remove(1)
+    index.remove(99)  # Not indexed: ignored
+    assert ids(index.filter("pay")) == [3]
+    assert ids(index.filter("")) == [2, 3, 4]
+    assert len(index) == 3 and 1 not in index
+
+
+def test_key_identifies_rows_for_patching():
+    rows = [("a", 10, "alpha"), ("b", 20, "beta")]
+    index = TextIndex(rows, lambda row: row[2], key=lambda row: row[1])
+    index.replace(("a", 10, "gamma"))
+    index.remove(20)
+    assert index.filter("") == [("a", 10, "gamma")]
+
+
+def test_patches_agree_with_a_rebuilt_index():
+    rng = random.Random(2)
+    vocabulary = ["".join(rng.choice("abcd") for _ in range(rng.randint(1, 4))) for _ in range(40)]
+
+    def row(key):
+        return (key, " ".join(rng.choice(vocabulary) for _ in range(4)))
+
+    rows = {key: row(key) for key in range(100)}
+    index = TextIndex(rows.values(), text_of)
+    next_key = 100
+    for _ in range(300):
+        action = rng.random()
+        if action < 0.3:
+            rows[next_key] = row(next_key)
+            index.add(rows[next_key])
+            next_key += 1
+        elif action < 0.6 and rows:
+            key = rng.choice(list(rows))
+            rows[key] = row(key)
+            index.replace(rows[key])
+        elif rows:
+            key = rng.choice(list(rows))
+            del rows[key]
+            index.remove(key)
+        text = rng.choice(vocabulary)[:2]
+        assert index.filter(text) == brute_force(list(rows.values()), text), text
+    assert len(index) == len(rows)